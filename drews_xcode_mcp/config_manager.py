@@ -123,8 +123,8 @@ class ConfigManager:
             return None
 
         try:
-            with open(file_path, 'r') as f:
-                return json.load(f)
+            with open(file_path, 'rb') as f:
+                return json.loads(f.read())
         except (json.JSONDecodeError, IOError) as e:
             print(f"Warning: Failed to load config from {file_path}: {e}", file=sys.stderr)
             return None
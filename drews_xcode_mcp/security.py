@@ -11,6 +11,9 @@ from drews_xcode_mcp.exceptions import AccessDeniedError, InvalidParameterError
 # Global allowed folders set - initialized by CLI
 ALLOWED_FOLDERS: Set[str] = set()
 
+# Bare-identifier project names accepted by validate_parent_for_new_project.
+_PROJECT_NAME_RE = re.compile(r'^[A-Za-z0-9][A-Za-z0-9_-]*$')
+
 
 def set_allowed_folders(folders: Set[str]):
     """Set the global allowed folders.
@@ -282,7 +285,7 @@ def validate_parent_for_new_project(parent_path: str, project_name: str) -> str:
     # terminates the token and yields a syntactically invalid OpenStep plist that
     # Xcode refuses to open. Quoting in the template would be an alternative, but
     # bare-identifier names keep the generated pbxproj simplest and safest.
-    if not re.match(r'^[A-Za-z0-9][A-Za-z0-9_-]*$', project_name):
+    if not _PROJECT_NAME_RE.match(project_name):
         raise InvalidParameterError(
             "project_name must start with a letter or digit and contain only "
             "letters, digits, hyphens, or underscores (no spaces)"
@@ -6,24 +6,29 @@ import os
 import re
 import sys
 import time
-from typing import Optional
+from typing import Optional, Pattern
 
 from drews_xcode_mcp.server import mcp, TOOL_BUILD
 from drews_xcode_mcp.config_manager import apply_config
 from drews_xcode_mcp.security import validate_and_normalize_project_path
 from drews_xcode_mcp.exceptions import InvalidParameterError, XCodeMCPError
 from drews_xcode_mcp.utils.applescript import (
-    build_open_and_wait_applescript,
+    build_open_and_wait_argv_applescript,
+    open_and_wait_script_args,
     build_wait_for_completion_applescript,
     resolve_build_timeout,
-    escape_applescript_string,
     run_applescript,
     show_notification,
     show_result_notification,
     show_error_notification,
     show_warning_notification,
 )
-from drews_xcode_mcp.utils.xcresult import extract_build_errors_and_warnings
+from drews_xcode_mcp.utils.schemes import invalidate_project_schemes
+from drews_xcode_mcp.utils.xcresult import (
+    ERROR_LINE_PATTERN,
+    WARNING_LINE_PATTERN,
+    extract_build_errors_and_warnings,
+)
 from drews_xcode_mcp.utils.build_log_parser import (
     find_derived_data_for_project,
     aggregate_warnings_since_clean,
@@ -37,12 +42,16 @@ from drews_xcode_mcp.utils.build_log_parser import (
 # the xcactivitylog + manifest within a few hundred ms; this is a generous cap.
 MANIFEST_ENTRY_WAIT_SECONDS = 10.0
 
+# "file:line:col: warning|error:" prefix, used to dedupe AppleScript log lines
+# against xcactivitylog entries.
+_FILE_LINE_COL_RE = re.compile(r'(.+?):(\d+):(\d+): (?:warning|error):')
+
 
 def _supplement_with_xcactivitylog_warnings(
     errors_json: str,
     project_path: str,
     include_warnings: Optional[bool],
-    regex_filter: Optional[str],
+    filter_pattern: Optional[Pattern],
     max_lines: int,
     pre_build_uuids: Optional[set] = None,
     unix_start_time: Optional[float] = None,
@@ -153,45 +162,44 @@ def _supplement_with_xcactivitylog_warnings(
         if not xcactivity_items:
             return _with_status(errors_json)
 
-        # Apply regex_filter to xcactivitylog items if provided
-        if regex_filter and regex_filter.strip():
-            filter_re = re.compile(regex_filter)
-            xcactivity_items = [
-                w for w in xcactivity_items
-                if filter_re.search(
-                    f"{w['file']}:{w['line']}:{w['column']}: {w['type']}: {w['message']}"
-                )
-            ]
-            if not xcactivity_items:
+        # Render each xcactivitylog item's diagnostic line once; it is used
+        # both for filter_pattern matching and for the output below.
+        xcactivity_lines = [
+            (w, f"{w['file']}:{w['line']}:{w['column']}: {w['type']}: {w['message']}")
+            for w in xcactivity_items
+        ]
+
+        # Apply the caller's regex_filter to xcactivitylog items if provided
+        if filter_pattern is not None:
+            xcactivity_lines = [(w, line) for w, line in xcactivity_lines if filter_pattern.search(line)]
+            if not xcactivity_lines:
                 return _with_status(errors_json)
 
         result = json.loads(errors_json)
         existing_text = result.get('errors_and_warnings', '')
         build_failed = result.get('summary', {}).get('build_failed', False)
 
-        # Parse error/warning lines from existing AppleScript result
-        error_re = re.compile(
-            r'(:\d+:\d+: error:)|(^error\s*:)|(:\s+error:)', re.IGNORECASE
-        )
-        warning_re = re.compile(
-            r'(:\d+:\d+: warning:)|(^warning\s*:)|(:\s+warning:)', re.IGNORECASE
-        )
-        flc_re = re.compile(r'(.+?):(\d+):(\d+): (?:warning|error):')
-
-        existing_lines = existing_text.split('\n')
-        applescript_error_lines = [l for l in existing_lines if error_re.search(l)]
-        applescript_warning_lines = [l for l in existing_lines if warning_re.search(l)]
-
-        # Build dedup set from xcactivitylog entries
+        # Split the existing AppleScript result into error and warning lines
+        # in one pass, classifying each line the way
+        # extract_build_errors_and_warnings did (error pattern first). Lines
+        # without a ':' can't match either pattern.
+        applescript_error_lines = []
+        applescript_warning_lines = []
+        for l in existing_text.split('\n'):
+            if ':' not in l:
+                continue
+            if ERROR_LINE_PATTERN.search(l):
+                applescript_error_lines.append(l)
+            elif WARNING_LINE_PATTERN.search(l):
+                applescript_warning_lines.append(l)
+
+        # Build the (file, line, column) dedup set and split xcactivitylog
+        # items into error and warning text lines in one pass.
         xcact_keys = set()
-        for w in xcactivity_items:
-            xcact_keys.add((w['file'], w['line'], w['column']))
-
-        # Separate xcactivitylog items into error and warning text lines
         xcact_error_lines = []
         xcact_warning_lines = []
-        for w in xcactivity_items:
-            line = f"{w['file']}:{w['line']}:{w['column']}: {w['type']}: {w['message']}"
+        for w, line in xcactivity_lines:
+            xcact_keys.add((w['file'], w['line'], w['column']))
             if w['type'] == 'error':
                 xcact_error_lines.append(line)
             else:
@@ -200,7 +208,7 @@ def _supplement_with_xcactivitylog_warnings(
         # Find AppleScript lines not already in xcactivitylog
         extra_errors = []
         for line in applescript_error_lines:
-            m = flc_re.match(line)
+            m = _FILE_LINE_COL_RE.match(line)
             if m:
                 key = (m.group(1), int(m.group(2)), int(m.group(3)))
                 if key not in xcact_keys:
@@ -210,7 +218,7 @@ def _supplement_with_xcactivitylog_warnings(
 
         extra_warnings = []
         for line in applescript_warning_lines:
-            m = flc_re.match(line)
+            m = _FILE_LINE_COL_RE.match(line)
             if m:
                 key = (m.group(1), int(m.group(2)), int(m.group(3)))
                 if key not in xcact_keys:
@@ -326,27 +334,30 @@ def build_project(project_path: str,
     effective_timeout = resolve_build_timeout(timeout)
 
     # Validate regex_filter up front so a bad pattern produces a clear error
-    # immediately, before any AppleScript runs. The supplement helper assumes
-    # the pattern compiles.
+    # immediately, before any AppleScript runs. The compiled pattern is what
+    # both log filters use, so it isn't compiled again.
+    filter_pattern = None
     if regex_filter and regex_filter.strip():
         try:
-            re.compile(regex_filter)
+            filter_pattern = re.compile(regex_filter)
         except re.error as e:
             raise InvalidParameterError(f"Invalid regex_filter: {e}")
 
     # Validate and normalize path
     scheme_desc = scheme if scheme else "active scheme"
     normalized_path = validate_and_normalize_project_path(project_path, f"Building {scheme_desc} in")
-    escaped_path = escape_applescript_string(normalized_path)
 
     # Show building notification
     project_name = os.path.basename(normalized_path)
     scheme_name = scheme if scheme else "active scheme"
     show_notification("Drew's Xcode MCP", subtitle=project_name, message=f"Building {scheme_name}")
 
-    escaped_scheme = escape_applescript_string(scheme) if scheme else None
+    # The path and scheme are passed as run-handler arguments, so the script
+    # text only varies with the timeout and whether a scheme is given. It is
+    # compiled once and the .scpt reused for every build, of any project.
     script = (
-        build_open_and_wait_applescript(escaped_path, escaped_scheme)
+        'on run argv\n'
+        + build_open_and_wait_argv_applescript(bool(scheme))
         + '    set actionResult to build workspaceDoc\n'
         + build_wait_for_completion_applescript("actionResult", effective_timeout)
         + '    set buildStatus to "unknown"\n'
@@ -355,7 +366,9 @@ def build_project(project_path: str,
         + '    end try\n'
         + '    return "BUILD_STATUS:" & buildStatus & "\n" & build log of actionResult\n'
         + 'end tell\n'
+        + 'end run\n'
     )
+    script_args = open_and_wait_script_args(normalized_path, scheme)
 
     # Snapshot the manifest's build UUIDs and capture our start time right
     # before triggering the build, so we can later identify the entry our
@@ -370,7 +383,15 @@ def build_project(project_path: str,
     # The script polls inside AppleScript for up to effective_timeout; the
     # subprocess timeout must exceed that, with a small buffer for workspace
     # load and IPC overhead.
-    success, output = run_applescript(script, timeout=effective_timeout + 60)
+    try:
+        success, output = run_applescript(
+            script, timeout=effective_timeout + 60, precompile=True, args=script_args
+        )
+    finally:
+        if scheme:
+            # The script made this the active scheme (a timeout may cut it off
+            # after the switch); drop the cached listing.
+            invalidate_project_schemes(normalized_path)
 
     if success:
         # Parse the BUILD_STATUS: prefix from the AppleScript output
@@ -387,12 +408,12 @@ def build_project(project_path: str,
                 build_log = ""
 
         # Always extract and format errors/warnings (returns JSON)
-        errors_output = extract_build_errors_and_warnings(build_log, include_warnings, regex_filter, max_lines, build_status=build_status)
+        errors_output = extract_build_errors_and_warnings(build_log, include_warnings, filter_pattern, max_lines, build_status=build_status)
 
         # Supplement with comprehensive warnings from xcactivitylog files
         # (AppleScript build log only has warnings for files recompiled in this build)
         errors_output = _supplement_with_xcactivitylog_warnings(
-            errors_output, normalized_path, include_warnings, regex_filter, max_lines,
+            errors_output, normalized_path, include_warnings, filter_pattern, max_lines,
             pre_build_uuids=pre_build_uuids, unix_start_time=unix_start_time,
             scheme_name=scheme,
         )
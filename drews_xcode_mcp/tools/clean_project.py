@@ -9,12 +9,11 @@ from drews_xcode_mcp.config_manager import apply_config
 from drews_xcode_mcp.security import validate_and_normalize_project_path
 from drews_xcode_mcp.exceptions import XCodeMCPError
 from drews_xcode_mcp.utils.applescript import (
-    build_open_and_wait_applescript,
+    build_open_and_wait_argv_applescript,
     build_wait_for_completion_applescript,
     is_action_timeout,
     resolve_build_timeout,
     format_timeout_duration,
-    escape_applescript_string,
     run_applescript,
     show_result_notification,
     show_warning_notification,
@@ -38,24 +37,27 @@ def clean_project(project_path: str, timeout: Optional[int] = None) -> str:
     """
     # Validate and normalize path
     normalized_path = validate_and_normalize_project_path(project_path, "Cleaning")
-    escaped_path = escape_applescript_string(normalized_path)
     effective_timeout = resolve_build_timeout(timeout)
 
     # `clean workspaceDoc` returns a scheme-action-result that completes
     # asynchronously (same as build/test), so capture it and poll `completed`
     # rather than assuming the command blocks. This bounds the wait by
     # `effective_timeout` and avoids reporting success before the clean has
-    # actually finished.
-    script = build_open_and_wait_applescript(escaped_path) + (
+    # actually finished. The path is a run-handler argument, so the compiled
+    # script is shared by every project.
+    script = 'on run argv\n' + build_open_and_wait_argv_applescript(False) + (
         '    set actionResult to clean workspaceDoc\n'
         + build_wait_for_completion_applescript("actionResult", effective_timeout, action_name="Clean")
         + '    return "Clean completed successfully"\n'
         'end tell\n'
+        'end run\n'
     )
 
     # The script polls inside AppleScript for up to effective_timeout; the
     # subprocess timeout must exceed that, plus a buffer for workspace load.
-    success, output = run_applescript(script, timeout=effective_timeout + 60)
+    success, output = run_applescript(
+        script, timeout=effective_timeout + 60, precompile=True, args=[normalized_path]
+    )
 
     project_name = os.path.basename(normalized_path)
 
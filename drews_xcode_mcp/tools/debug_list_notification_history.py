@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """debug_list_notification_history tool - List all notifications that have been posted"""
 
+import io
 import os
 import subprocess
 import sys
@@ -31,19 +32,21 @@ def debug_list_notification_history() -> str:
     if not history:
         result = "No notifications have been posted yet."
     else:
-        lines = [f"Notification History ({len(history)} notification{'s' if len(history) != 1 else ''}):", ""]
-
+        # One write per record; the trailing "\n" of the last record is
+        # dropped so the text matches the previous line-joined layout.
+        buf = io.StringIO()
+        buf.write(f"Notification History ({len(history)} notification{'s' if len(history) != 1 else ''}):\n\n")
         for i, notif in enumerate(history, 1):
-            lines.append(f"{i}. [{notif['timestamp']}]")
-            lines.append(f"   Title: {notif['title']}")
-            if notif['subtitle']:
-                lines.append(f"   Subtitle: {notif['subtitle']}")
-            if notif['message']:
-                lines.append(f"   Message: {notif['message']}")
-            lines.append(f"   Sound: {notif['sound']}")
-            lines.append("")
+            subtitle = f"   Subtitle: {notif['subtitle']}\n" if notif['subtitle'] else ""
+            message = f"   Message: {notif['message']}\n" if notif['message'] else ""
+            buf.write(
+                f"{i}. [{notif['timestamp']}]\n"
+                f"   Title: {notif['title']}\n"
+                f"{subtitle}{message}"
+                f"   Sound: {notif['sound']}\n\n"
+            )
 
-        result = "\n".join(lines)
+        result = buf.getvalue()[:-1]
 
     # Also show in TextEdit (scrollable). Write to a stable path so repeated
     # invocations don't leak temp files.
@@ -55,10 +58,14 @@ def debug_list_notification_history() -> str:
         print(f"warn: failed to write {NOTIFICATION_HISTORY_FILE}: {e}", file=sys.stderr)
         return result
 
+    # `open` hands the file to TextEdit and exits without waiting for the
+    # window, so the short wait is fine; its output is never read, so don't
+    # allocate pipes for it.
     try:
         subprocess.run(
             ['open', '-a', 'TextEdit', NOTIFICATION_HISTORY_FILE],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=5,
         )
     except subprocess.TimeoutExpired:
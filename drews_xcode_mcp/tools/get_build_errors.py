@@ -7,7 +7,10 @@ from drews_xcode_mcp.server import mcp, TOOL_READONLY
 from drews_xcode_mcp.config_manager import apply_config
 from drews_xcode_mcp.security import validate_and_normalize_project_path
 from drews_xcode_mcp.exceptions import InvalidParameterError, XCodeMCPError
-from drews_xcode_mcp.utils.applescript import escape_applescript_string, run_applescript
+from drews_xcode_mcp.utils.applescript import (
+    build_open_and_wait_argv_applescript,
+    run_applescript,
+)
 from drews_xcode_mcp.utils.xcresult import extract_build_errors_and_warnings
 
 
@@ -43,28 +46,9 @@ def get_build_errors(project_path: str,
 
     # Validate and normalize path
     normalized_path = validate_and_normalize_project_path(project_path, "Getting build errors for")
-    escaped_path = escape_applescript_string(normalized_path)
 
     # Get the last build log from the workspace
-    script = f'''
-    set projectPath to "{escaped_path}"
-
-    tell application "Xcode"
-        open projectPath
-
-        -- Get the workspace document
-        set workspaceDoc to first workspace document whose path is projectPath
-
-        -- Wait for it to load (timeout after ~30 seconds)
-        repeat 60 times
-            if loaded of workspaceDoc is true then exit repeat
-            delay 0.5
-        end repeat
-
-        if loaded of workspaceDoc is false then
-            error "Xcode workspace did not load in time."
-        end if
-
+    script = 'on run argv\n' + build_open_and_wait_argv_applescript(False) + '''
         -- Try to get the last build log
         try
             -- Get the most recent scheme action result
@@ -82,9 +66,10 @@ def get_build_errors(project_path: str,
             return ""
         end try
     end tell
+    end run
     '''
 
-    success, output = run_applescript(script)
+    success, output = run_applescript(script, precompile=True, args=[normalized_path])
 
     if success:
         if output == "":
@@ -60,6 +60,14 @@ def get_directory_listing(directory_path: str,
             size_bytes /= 1024.0
         return f"{size_bytes:.1f} TB"
 
+    # Compile the filter once rather than per directory entry.
+    filter_pattern = None
+    if regex_filter and regex_filter.strip():
+        try:
+            filter_pattern = re.compile(regex_filter)
+        except re.error as e:
+            raise InvalidParameterError(f"Invalid regex pattern: {e}")
+
     try:
         # Get all items in directory
         items = os.listdir(directory_path)
@@ -70,12 +78,8 @@ def get_directory_listing(directory_path: str,
             item_path = os.path.join(directory_path, item)
 
             # Apply regex filter if provided
-            if regex_filter and regex_filter.strip():
-                try:
-                    if not re.search(regex_filter, item):
-                        continue
-                except re.error as e:
-                    raise InvalidParameterError(f"Invalid regex pattern: {e}")
+            if filter_pattern is not None and not filter_pattern.search(item):
+                continue
 
             try:
                 stat_info = os.stat(item_path)
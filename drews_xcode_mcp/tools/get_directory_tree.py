@@ -36,6 +36,23 @@ MAX_TREE_LINES = 5000
 MAX_TREE_DEPTH = 32
 
 
+def _list_subdirectories(path: str) -> List[str]:
+    """
+    Return the sorted names of the directories directly inside `path`,
+    excluding hidden ones other than .git.
+
+    Uses scandir so each entry's type comes from the directory read itself
+    (d_type) instead of an extra stat per entry; only symlinks still need a
+    stat to see whether they point at a directory.
+    """
+    with os.scandir(path) as entries:
+        return sorted(
+            entry.name for entry in entries
+            # Include if not hidden, or if it's an important hidden dir
+            if (not entry.name.startswith('.') or entry.name == '.git') and entry.is_dir()
+        )
+
+
 @mcp.tool(annotations=TOOL_READONLY)
 @apply_config
 def get_directory_tree(directory_path: str, max_depth: int = 4) -> str:
@@ -124,36 +141,28 @@ def get_directory_tree(directory_path: str, max_depth: int = 4) -> str:
         if current_depth >= max_depth:
             return lines
 
-        # If it's a directory, recurse into it (with restrictions)
-        if os.path.isdir(path):
-            # Skip certain directories
-            if os.path.basename(path) in SKIP_DIR_NAMES:
-                return lines
-
-            # Don't recurse into .xcodeproj or .xcworkspace directories
-            if path.endswith('.xcodeproj') or path.endswith('.xcworkspace'):
-                return lines
-
-            try:
-                items = sorted(os.listdir(path))
-                # Filter to directories only, exclude hidden except for important ones
-                dir_items = []
-                for item in items:
-                    item_path = os.path.join(path, item)
-                    if os.path.isdir(item_path):
-                        # Include if not hidden, or if it's an important hidden dir
-                        if not item.startswith('.') or item in ['.git']:
-                            dir_items.append(item)
-
-                for i, item in enumerate(dir_items):
-                    if emitted >= MAX_TREE_LINES:
-                        overflowed = True
-                        break
-                    item_path = os.path.join(path, item)
-                    is_last_item = (i == len(dir_items) - 1)
-                    lines.extend(build_hierarchy(item_path, prefix, is_last_item, base_path, current_depth + 1))
-            except PermissionError:
-                pass
+        # Recurse into the directory (with restrictions). Only directories
+        # are ever passed in, so no isdir check is needed here.
+        # Skip certain directories
+        if os.path.basename(path) in SKIP_DIR_NAMES:
+            return lines
+
+        # Don't recurse into .xcodeproj or .xcworkspace directories
+        if path.endswith('.xcodeproj') or path.endswith('.xcworkspace'):
+            return lines
+
+        try:
+            dir_items = _list_subdirectories(path)
+
+            for i, item in enumerate(dir_items):
+                if emitted >= MAX_TREE_LINES:
+                    overflowed = True
+                    break
+                item_path = os.path.join(path, item)
+                is_last_item = (i == len(dir_items) - 1)
+                lines.extend(build_hierarchy(item_path, prefix, is_last_item, base_path, current_depth + 1))
+        except PermissionError:
+            pass
 
         return lines
 
@@ -161,14 +170,7 @@ def get_directory_tree(directory_path: str, max_depth: int = 4) -> str:
     hierarchy_lines = [scan_dir + "/"]
 
     try:
-        items = sorted(os.listdir(scan_dir))
-        # Filter to directories only
-        dir_items = []
-        for item in items:
-            item_path = os.path.join(scan_dir, item)
-            if os.path.isdir(item_path):
-                if not item.startswith('.') or item in ['.git']:
-                    dir_items.append(item)
+        dir_items = _list_subdirectories(scan_dir)
 
         for i, item in enumerate(dir_items):
             if emitted >= MAX_TREE_LINES:
@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 """get_latest_test_results tool - Get test results from last run"""
 
-import os
 import json
 import sys
 
@@ -42,7 +41,7 @@ def get_latest_test_results(project_path: str) -> str:
     # Try to find the most recent xcresult bundle
     xcresult_path = find_xcresult_bundle(project_path)
 
-    if xcresult_path and os.path.exists(xcresult_path):
+    if xcresult_path:
         # Extract and parse test results
         success, test_results = extract_test_results_from_xcresult(xcresult_path)
 
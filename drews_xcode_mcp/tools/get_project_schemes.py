@@ -6,12 +6,28 @@ from drews_xcode_mcp.config_manager import apply_config
 from drews_xcode_mcp.security import validate_and_normalize_project_path
 from drews_xcode_mcp.exceptions import XCodeMCPError
 from drews_xcode_mcp.utils.applescript import (
-    build_open_and_wait_applescript,
-    escape_applescript_string,
+    build_open_and_wait_argv_applescript,
     run_applescript,
     show_error_notification,
     show_result_notification,
 )
+from drews_xcode_mcp.utils.schemes import cache_schemes, get_cached_schemes, project_signature
+
+
+def _format_schemes(output: str) -> str:
+    """Post the result notification and append the usage hint to a listing."""
+    if not output:
+        return output
+    # Count schemes and show notification
+    scheme_lines = [line for line in output.split('\n') if line.strip()]
+    scheme_count = len(scheme_lines)
+    # Show first 3 schemes as preview
+    preview_schemes = '\n'.join(scheme_lines[:3])
+    if scheme_count > 3:
+        preview_schemes += f'\n+{scheme_count - 3} more'
+    show_result_notification(f"Found {scheme_count} scheme{'s' if scheme_count != 1 else ''}", preview_schemes)
+
+    return output + "\n\nUse `build_project` with a scheme name, or omit the scheme parameter to build the active scheme."
 
 
 @mcp.tool(annotations=TOOL_READONLY)
@@ -27,12 +43,22 @@ def get_project_schemes(project_path: str) -> str:
     Returns:
         A newline-separated list of scheme names, with the active scheme listed first.
         If no schemes are found, returns an empty string.
+
+    Listings are cached for up to 30 seconds. If the active scheme is changed in
+    Xcode's UI within that window, the "(active)" marker may still name the
+    previous scheme; pass an explicit scheme to build/run/test tools when it
+    matters. Switching schemes through this server's tools refreshes it.
     """
     # Validate and normalize path
     normalized_path = validate_and_normalize_project_path(project_path, "Getting schemes for")
-    escaped_path = escape_applescript_string(normalized_path)
 
-    script = build_open_and_wait_applescript(escaped_path) + '''
+    signature = project_signature(normalized_path)
+    if signature is not None:
+        cached = get_cached_schemes(normalized_path, signature)
+        if cached is not None:
+            return _format_schemes(cached)
+
+    script = 'on run argv\n' + build_open_and_wait_argv_applescript(False) + '''
         -- Try to get active scheme name, but don't fail if we can't
         set activeScheme to ""
         try
@@ -66,23 +92,15 @@ def get_project_schemes(project_path: str) -> str:
 
         return output
     end tell
+    end run
     '''
 
-    success, output = run_applescript(script)
+    success, output = run_applescript(script, precompile=True, args=[normalized_path])
 
     if success:
-        if output:
-            # Count schemes and show notification
-            scheme_lines = [line for line in output.split('\n') if line.strip()]
-            scheme_count = len(scheme_lines)
-            # Show first 3 schemes as preview
-            preview_schemes = '\n'.join(scheme_lines[:3])
-            if scheme_count > 3:
-                preview_schemes += f'\n+{scheme_count - 3} more'
-            show_result_notification(f"Found {scheme_count} scheme{'s' if scheme_count != 1 else ''}", preview_schemes)
-
-            output += "\n\nUse `build_project` with a scheme name, or omit the scheme parameter to build the active scheme."
-        return output
+        if signature is not None:
+            cache_schemes(normalized_path, signature, output)
+        return _format_schemes(output)
     else:
         show_error_notification("Failed to get schemes", output)
         raise XCodeMCPError(f"Failed to get schemes for {project_path}: {output}")
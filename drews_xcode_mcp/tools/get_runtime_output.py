@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """get_runtime_output tool - Get console output from last run"""
 
+import re
 import sys
 import json
 from typing import Optional
@@ -36,6 +37,15 @@ def get_runtime_output(project_path: str,
     # Validate and normalize path
     project_path = validate_and_normalize_project_path(project_path, "Getting runtime output for")
 
+    # Validate regex_filter before the (multi-second) xcresulttool extraction,
+    # and hand the compiled pattern down so it's only compiled once.
+    filter_pattern = None
+    if regex_filter and regex_filter.strip():
+        try:
+            filter_pattern = re.compile(regex_filter)
+        except re.error as e:
+            raise InvalidParameterError(f"Invalid regex_filter: {e}")
+
     # Find the most recent xcresult file for this project
     xcresult_path = find_xcresult_for_project(project_path)
 
@@ -46,7 +56,7 @@ def get_runtime_output(project_path: str,
     print(f"Found xcresult: {xcresult_path}", file=sys.stderr)
 
     # Extract console logs (returns JSON)
-    success, console_output = extract_console_logs_from_xcresult(xcresult_path, regex_filter, max_lines)
+    success, console_output = extract_console_logs_from_xcresult(xcresult_path, filter_pattern, max_lines)
 
     if not success:
         show_error_notification("Failed to extract runtime output", console_output)
@@ -5,6 +5,11 @@ import os
 import sys
 import subprocess
 import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 
 from drews_xcode_mcp.server import mcp, TOOL_READONLY
 from drews_xcode_mcp.config_manager import apply_config
@@ -54,6 +59,87 @@ def _get_recent_xcode_projects() -> list[str]:
         return []
 
 
+_MDFIND_QUERY = 'kMDItemFSName == "*.xcodeproj" || kMDItemFSName == "*.xcworkspace"'
+_MDFIND_TIMEOUT_SECONDS = 30
+_MAX_MDFIND_WORKERS = 8
+
+# Successful per-folder mdfind results, keyed by search path, kept briefly so
+# back-to-back get_xcode_projects calls (e.g. retrying with a different
+# regex_filter or depth) don't re-query Spotlight. Projects created by this
+# server are tracked separately (register_created_project), so the TTL only
+# delays projects created outside it.
+_MDFIND_CACHE_TTL_SECONDS = 30.0
+_MDFIND_CACHE_MAX = 32
+_MDFIND_CACHE: "OrderedDict[str, tuple[float, list[str]]]" = OrderedDict()
+_MDFIND_CACHE_LOCK = threading.Lock()
+
+
+def _outermost_roots(paths: list[str]) -> list[str]:
+    """
+    Drop search paths nested inside another search path (e.g. ~/dev/work when
+    ~/dev is also allowed): the outer mdfind already covers them, and searching
+    both would return the nested tree's projects twice. Order is preserved.
+    """
+    real_paths = [os.path.realpath(path) for path in paths]
+    prefixes = [real if real.endswith(os.sep) else real + os.sep for real in real_paths]
+    roots = []
+    seen = set()
+    for path, real in zip(paths, real_paths):
+        if real in seen or any(
+            real != other and real.startswith(prefix)
+            for other, prefix in zip(real_paths, prefixes)
+        ):
+            continue
+        seen.add(real)
+        roots.append(path)
+    return roots
+
+
+def _run_mdfind(path: str) -> tuple[list[str], Optional[str]]:
+    """
+    Run the project-finding Spotlight query under one search path.
+
+    Returns:
+        (found_paths, warning). On failure found_paths is empty and warning is
+        a "<path>: <reason>" line for the tool's output; the failure is also
+        reported via notification and stderr.
+    """
+    with _MDFIND_CACHE_LOCK:
+        cached = _MDFIND_CACHE.get(path)
+        if cached is not None and time.monotonic() < cached[0]:
+            _MDFIND_CACHE.move_to_end(path)
+            return list(cached[1]), None
+
+    try:
+        # -0 separates results with NUL, so names containing newlines
+        # survive. Output is read as bytes and each path decoded with
+        # fsdecode, which (unlike text=True) cannot fail on a non-UTF-8
+        # file name and skips the decode/strip copies of the whole blob.
+        mdfindResult = subprocess.run(
+            ['mdfind', '-0', '-onlyin', path, _MDFIND_QUERY],
+            capture_output=True, check=True,
+            timeout=_MDFIND_TIMEOUT_SECONDS,
+        )
+        found_paths = [os.fsdecode(found) for found in mdfindResult.stdout.split(b'\0') if found]
+        with _MDFIND_CACHE_LOCK:
+            _MDFIND_CACHE[path] = (time.monotonic() + _MDFIND_CACHE_TTL_SECONDS, found_paths)
+            _MDFIND_CACHE.move_to_end(path)
+            while len(_MDFIND_CACHE) > _MDFIND_CACHE_MAX:
+                _MDFIND_CACHE.popitem(last=False)
+        return list(found_paths), None
+    except subprocess.TimeoutExpired:
+        reason = f"mdfind timed out after {_MDFIND_TIMEOUT_SECONDS}s"
+        show_warning_notification(f"mdfind timed out for {os.path.basename(path)}")
+    except subprocess.CalledProcessError as e:
+        reason = f"mdfind exited {e.returncode}: {os.fsdecode(e.stderr or b'').strip() or '(no stderr)'}"
+        show_warning_notification(f"mdfind failed for {os.path.basename(path)}", reason)
+    except OSError as e:
+        reason = f"mdfind not invokable: {e}"
+        show_warning_notification(f"mdfind failed for {os.path.basename(path)}", str(e))
+    print(f"Warning: {reason} in {path}", file=sys.stderr)
+    return [], f"{path}: {reason}"
+
+
 def _filter_project_results(paths: list[str], search_paths: list[str] = None, max_depth: int = None, regex_filter: str = None) -> list[str]:
     """
     Filter project paths to remove noise and duplicates.
@@ -81,8 +167,17 @@ def _filter_project_results(paths: list[str], search_paths: list[str] = None, ma
         return []
 
     home_library = os.path.expanduser("~/Library")
+    home_library_prefix = home_library + os.sep
     filtered = []
 
+    # Resolve the search roots once rather than once per candidate path:
+    # realpath lstat()s every component, and mdfind can return thousands of
+    # paths. Use realpath so symlinked search paths still match the resolved
+    # paths returned by mdfind.
+    search_roots = []
+    if max_depth is not None and search_paths:
+        search_roots = [os.path.realpath(search_path) for search_path in search_paths]
+
     # Compile regex if provided
     regex_pattern = None
     if regex_filter:
@@ -104,7 +199,7 @@ def _filter_project_results(paths: list[str], search_paths: list[str] = None, ma
 
         # Filter 2: Skip anything under $HOME/Library. Match on a path-component
         # boundary so a sibling like "~/LibraryNotes" isn't swept up.
-        if path == home_library or path.startswith(home_library + os.sep):
+        if path == home_library or path.startswith(home_library_prefix):
             continue
 
         # Filter 3: Skip if any parent directory ends with .playground
@@ -122,15 +217,12 @@ def _filter_project_results(paths: list[str], search_paths: list[str] = None, ma
             continue
 
         # Filter 5: Check depth limit if specified
-        if max_depth is not None and search_paths:
+        if search_roots:
             # Calculate minimum depth from any search path.
-            # Use realpath on both sides so symlinked search paths still match
-            # the resolved paths returned by mdfind.
             min_depth = None
             abs_path = os.path.realpath(path)
 
-            for search_path in search_paths:
-                abs_search = os.path.realpath(search_path)
+            for abs_search in search_roots:
                 # Compare on a path-component boundary so "/a/App" doesn't match
                 # a sibling "/a/App-Other".
                 if abs_path == abs_search or abs_path.startswith(abs_search + os.sep):
@@ -248,48 +340,33 @@ def get_xcode_projects(
 
     # Search for projects in all paths. Collect per-path failures so the
     # caller can tell "no projects" apart from "the search itself was
-    # incomplete".
-    mdfind_timeout_seconds = 30
+    # incomplete". Each mdfind (and the recents decode, which launches
+    # `swift`) just waits on another process, so they run concurrently; map()
+    # keeps results in search-path order.
     all_results = []
     search_warnings = []
-    for path in paths_to_search:
-        try:
-            mdfindResult = subprocess.run(
-                ['mdfind', '-onlyin', path,
-                 'kMDItemFSName == "*.xcodeproj" || kMDItemFSName == "*.xcworkspace"'],
-                capture_output=True, text=True, check=True,
-                timeout=mdfind_timeout_seconds,
-            )
-            stdout = mdfindResult.stdout.strip()
-            if stdout:
-                all_results.extend(stdout.split('\n'))
-        except subprocess.TimeoutExpired:
-            reason = f"mdfind timed out after {mdfind_timeout_seconds}s"
-            search_warnings.append(f"{path}: {reason}")
-            show_warning_notification(f"mdfind timed out for {os.path.basename(path)}")
-            print(f"Warning: {reason} in {path}", file=sys.stderr)
-        except subprocess.CalledProcessError as e:
-            reason = f"mdfind exited {e.returncode}: {(e.stderr or '').strip() or '(no stderr)'}"
-            search_warnings.append(f"{path}: {reason}")
-            show_warning_notification(f"mdfind failed for {os.path.basename(path)}", reason)
-            print(f"Warning: {reason} in {path}", file=sys.stderr)
-        except OSError as e:
-            reason = f"mdfind not invokable: {e}"
-            search_warnings.append(f"{path}: {reason}")
-            show_warning_notification(f"mdfind failed for {os.path.basename(path)}", str(e))
-            print(f"Warning: {reason} in {path}", file=sys.stderr)
+    search_roots = _outermost_roots(paths_to_search)
+    max_workers = min(_MAX_MDFIND_WORKERS, len(search_roots) + (1 if include_recents else 0))
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        recents_future = executor.submit(_get_recent_xcode_projects) if include_recents else None
+        for found, warning in executor.map(_run_mdfind, search_roots):
+            all_results.extend(found)
+            if warning:
+                search_warnings.append(warning)
+        raw_recent_projects = recents_future.result() if recents_future else []
 
     # Supplement mdfind with recently created projects that Spotlight
     # may not have indexed yet
-    mdfind_set = set(all_results)
-    for path in _recently_created_projects:
-        if path not in mdfind_set and os.path.exists(path):
-            all_results.append(path)
+    if _recently_created_projects:
+        mdfind_set = set(all_results)
+        for path in _recently_created_projects:
+            if path not in mdfind_set and os.path.exists(path):
+                all_results.append(path)
 
     # Get recent projects if requested
     recent_projects = []
     if include_recents:
-        recent_projects = _get_recent_xcode_projects()
+        recent_projects = raw_recent_projects
         # Filter recents with same criteria
         recent_projects = _filter_project_results(
             recent_projects,
@@ -308,13 +385,10 @@ def get_xcode_projects(
 
     # Combine recents (first) + mdfind results, removing duplicates
     # Use dict to preserve order while removing duplicates
-    combined = {}
-    for path in recent_projects:
-        combined[path] = True
-    for path in filtered_results:
-        combined[path] = True
+    combined = dict.fromkeys(recent_projects)
+    combined.update(dict.fromkeys(filtered_results))
 
-    unique_results = list(combined.keys())
+    unique_results = list(combined)
 
     # Apply max_results limit
     if max_results and max_results > 0:
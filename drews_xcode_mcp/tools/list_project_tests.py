@@ -168,11 +168,13 @@ def list_project_tests(project_path: str,
         show_error_notification("Error enumerating tests", str(e))
         raise XCodeMCPError(f"Error enumerating tests for {project_name}: {e}")
 
+    # Read bytes: json.loads decodes them itself, so text mode's decoder and
+    # newline translation would only be a second pass over the file.
     try:
-        with open(output_path, 'r') as f:
+        with open(output_path, 'rb') as f:
             raw = f.read().strip()
     except OSError:
-        raw = ""
+        raw = b""
     finally:
         shutil.rmtree(tmpdir, ignore_errors=True)
 
@@ -192,7 +194,9 @@ def list_project_tests(project_path: str,
         if error_lines:
             snippet = '\n'.join(error_lines[:15])
         else:
-            tail = combined.strip().split('\n')
+            # rsplit stops after the last 15 lines rather than splitting the
+            # whole (often multi-MB) xcodebuild output.
+            tail = combined.strip().rsplit('\n', 15)
             snippet = '\n'.join(line for line in tail[-15:] if line.strip())
         show_error_notification("Could not enumerate tests", project_name)
         return (f"❌ Could not enumerate tests for scheme '{scheme}' "
@@ -222,7 +226,9 @@ def list_project_tests(project_path: str,
     total = len(enabled) + len(disabled)
     show_result_notification(f"Found {total} test{'s' if total != 1 else ''}", project_name)
 
-    lines = list(enabled)
+    # _collect_identifiers hands back fresh lists, so extend it in place
+    # rather than copying thousands of identifiers.
+    lines = enabled
     if disabled:
         lines.append("")
         lines.append(f"Disabled ({len(disabled)}):")
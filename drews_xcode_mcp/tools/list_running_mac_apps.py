@@ -22,29 +22,27 @@ def list_running_mac_apps() -> str:
     try:
         # AppleScript joins records with US (ASCII 0x1f) instead of the default
         # ", " so app names containing a comma or comma-space parse correctly.
+        # Each property is fetched for every process in one bulk reference
+        # (`name of every application process`), so System Events answers five
+        # Apple Events total instead of five per running app.
         script = '''
         set recordSep to (ASCII character 31)
         tell application "System Events"
-            set appList to {}
-            set runningApps to every application process
-
-            repeat with anApp in runningApps
-                set appName to name of anApp
-                set appBundleID to bundle identifier of anApp
-                set appPID to unix id of anApp
-                set appFrontmost to frontmost of anApp
-                set appVisible to visible of anApp
-
-                -- Format as tab-separated values for easy parsing
-                set appInfo to appName & tab & appBundleID & tab & appPID & tab & appFrontmost & tab & appVisible
-                set end of appList to appInfo
-            end repeat
-
-            set AppleScript's text item delimiters to recordSep
-            set joinedOutput to appList as string
-            set AppleScript's text item delimiters to ""
-            return joinedOutput
+            set {appNames, appBundleIDs, appPIDs, appFrontmosts, appVisibles} to ¬
+                {name, bundle identifier, unix id, frontmost, visible} of every application process
         end tell
+
+        set appList to {}
+        repeat with i from 1 to count of appNames
+            -- Format as tab-separated values for easy parsing
+            set appInfo to (item i of appNames) & tab & (item i of appBundleIDs) & tab & (item i of appPIDs) & tab & (item i of appFrontmosts) & tab & (item i of appVisibles)
+            set end of appList to appInfo
+        end repeat
+
+        set AppleScript's text item delimiters to recordSep
+        set joinedOutput to appList as string
+        set AppleScript's text item delimiters to ""
+        return joinedOutput
         '''
 
         success, output = run_applescript(script)
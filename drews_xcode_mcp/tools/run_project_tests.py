@@ -13,20 +13,24 @@ from drews_xcode_mcp.security import validate_and_normalize_project_path
 from drews_xcode_mcp.exceptions import InvalidParameterError, XCodeMCPError
 from drews_xcode_mcp.utils.run_guard import exclusive_per_project
 from drews_xcode_mcp.utils.applescript import (
-    build_open_and_wait_applescript,
+    build_open_and_wait_argv_applescript,
+    open_and_wait_script_args,
     build_wait_for_completion_applescript,
     is_action_timeout,
     resolve_build_timeout,
     format_timeout_duration,
-    escape_applescript_string,
     run_applescript,
     show_notification,
     show_result_notification,
     show_error_notification,
     show_warning_notification,
 )
+from drews_xcode_mcp.utils.schemes import invalidate_project_schemes
 from drews_xcode_mcp.utils.xcresult import snapshot_xcresult_mtimes, wait_for_xcresult_after_timestamp, extract_test_results_from_xcresult
 
+# Verbose stderr tracing, read once at import (set XCODE_MCP_DEBUG=1).
+_DEBUG = bool(os.environ.get('XCODE_MCP_DEBUG'))
+
 
 # TODO (follow-up): Implement selective test execution with xcodebuild.
 #
@@ -210,87 +214,29 @@ def run_project_tests(project_path: str,
     # if tests_to_run:
     #     return _run_tests_with_xcodebuild(project_path, tests_to_run, scheme, max_wait_seconds)
 
-    # Build the AppleScript from shared helpers + the test-specific failure
-    # extraction tail. The open/wait/scheme-set boilerplate lives in
-    # build_open_and_wait_applescript so both build and test paths share it.
-    escaped_path = escape_applescript_string(project_path)
-    escaped_scheme = escape_applescript_string(scheme) if scheme else None
+    # Build the AppleScript from shared helpers + the test-specific result
+    # tail. The open/wait/scheme-set boilerplate lives in
+    # build_open_and_wait_argv_applescript so both build and test paths share
+    # it. The path and scheme arrive as run-handler arguments, so the compiled
+    # .scpt is reused for every test run with the same timeout.
 
-    # Test-specific: after the wait loop completes, walk `test failures of
-    # testResult` and emit a structured text blob the Python side parses.
-    failure_extraction_tail = (
-        '    -- Get results\n'
-        '    set testStatus to status of testResult as string\n'
-        '    set testCompleted to completed of testResult\n'
-        '\n'
-        '    -- Get failures if any with full details\n'
-        '    set failureMessages to ""\n'
-        '    set failureCount to 0\n'
-        '    try\n'
-        '        set failures to test failures of testResult\n'
-        '        set failureCount to count of failures\n'
-        '        if failureCount > 0 then\n'
-        '            repeat with failure in failures\n'
-        '                set failureMsg to ""\n'
-        '                set failurePath to ""\n'
-        '                set failureLine to ""\n'
-        '\n'
-        '                try\n'
-        '                    set failureMsg to message of failure\n'
-        '                on error\n'
-        '                    set failureMsg to "Unknown test failure"\n'
-        '                end try\n'
-        '\n'
-        '                try\n'
-        '                    set failurePath to file path of failure\n'
-        '                end try\n'
-        '\n'
-        '                try\n'
-        '                    set failureLine to starting line number of failure as string\n'
-        '                end try\n'
-        '\n'
-        '                set failureMessages to failureMessages & "FAILURE: " & failureMsg & "\\n"\n'
-        '                if failurePath is not "" and failurePath is not missing value then\n'
-        '                    set failureMessages to failureMessages & "FILE: " & failurePath & "\\n"\n'
-        '                end if\n'
-        '                if failureLine is not "" and failureLine is not "missing value" then\n'
-        '                    set failureMessages to failureMessages & "LINE: " & failureLine & "\\n"\n'
-        '                end if\n'
-        '                set failureMessages to failureMessages & "---\\n"\n'
-        '            end repeat\n'
-        '        else\n'
-        '            -- No test failures in collection, but status might still be failed.\n'
-        '            -- We will parse the build log later to extract actual failure details.\n'
-        '            if testStatus is "failed" or testStatus contains "fail" then\n'
-        '                set failureMessages to "PARSE_FROM_LOG" & "\\n"\n'
-        '            end if\n'
-        '        end if\n'
-        '    on error errMsg\n'
-        '        if testStatus is "failed" or testStatus contains "fail" then\n'
-        '            set failureMessages to "PARSE_FROM_LOG" & "\\n"\n'
-        '        end if\n'
-        '    end try\n'
-        '\n'
-        '    -- Get build log for statistics\n'
-        '    set buildLog to ""\n'
-        '    try\n'
-        '        set buildLog to build log of testResult\n'
-        '    end try\n'
-        '\n'
-        '    return "Status: " & testStatus & "\\n" & ¬\n'
-        '           "Completed: " & testCompleted & "\\n" & ¬\n'
-        '           "FailureCount: " & (failureCount as string) & "\\n" & ¬\n'
-        '           "Failures:\\n" & failureMessages & "\\n" & ¬\n'
-        '           "---LOG---\\n" & buildLog\n'
-    )
+    # Test-specific: after the wait loop completes, reply with the scheme
+    # action status and nothing else. Counts, failure messages and locations
+    # are all read from the xcresult bundle, so walking `test failures` (three
+    # Apple Events per failure) or fetching the build log (megabytes over the
+    # osascript pipe) would only produce text that is thrown away.
+    result_tail = '    return status of testResult as string\n'
 
     script = (
-        build_open_and_wait_applescript(escaped_path, escaped_scheme)
+        'on run argv\n'
+        + build_open_and_wait_argv_applescript(bool(scheme))
         + '    set testResult to test workspaceDoc\n'
         + build_wait_for_completion_applescript("testResult", effective_timeout, action_name="Tests")
-        + failure_extraction_tail
+        + result_tail
         + 'end tell\n'
+        + 'end run\n'
     )
+    script_args = open_and_wait_script_args(project_path, scheme)
 
     # Snapshot existing test xcresults and capture start time before launching so
     # we only accept a .xcresult written by THIS test run, not a stale bundle
@@ -304,11 +250,18 @@ def run_project_tests(project_path: str,
     # raises XCodeMCPError — surface that as a test timeout rather than letting
     # it propagate as an opaque error.
     try:
-        success, output = run_applescript(script, timeout=effective_timeout + 60)
+        success, output = run_applescript(
+            script, timeout=effective_timeout + 60, precompile=True, args=script_args
+        )
     except XCodeMCPError:
         duration = format_timeout_duration(effective_timeout)
         show_warning_notification(f"Tests timeout ({duration})")
         return f"⏳ Tests did not complete within {duration} (Xcode did not respond)"
+    finally:
+        if scheme:
+            # The script made this the active scheme (a timeout may cut it off
+            # after the switch); drop the cached listing.
+            invalidate_project_schemes(project_path)
 
     if not success:
         # The AppleScript poll loop raises (rather than returning) when it times
@@ -323,16 +276,14 @@ def run_project_tests(project_path: str,
         return f"Failed to run tests: {output}"
 
     # Debug: Log raw output to see what we're getting
-    if os.environ.get('XCODE_MCP_DEBUG'):
+    if _DEBUG:
         print(f"DEBUG: Raw test output:\n{output}\n", file=sys.stderr)
 
     # Parse the AppleScript output to get test status. A timeout never reaches
     # here (the poll loop raises and is handled in the `if not success` branch
     # above), so the action always completed; `status` drives the messaging.
-    status = ""
-    for line in output.split('\n'):
-        if line.startswith("Status: "):
-            status = line.replace("Status: ", "").strip()
+    # The script's whole reply is the status string.
+    status = output.strip()
 
     # If tests completed, get detailed results from xcresult. Gate on the start
     # timestamp so a not-yet-finalized bundle doesn't cause us to return the
@@ -343,7 +294,8 @@ def run_project_tests(project_path: str,
     )
 
     if xcresult_path:
-        print(f"DEBUG: Found xcresult bundle at {xcresult_path}", file=sys.stderr)
+        if _DEBUG:
+            print(f"DEBUG: Found xcresult bundle at {xcresult_path}", file=sys.stderr)
 
         # Extract and parse test results
         success, test_results = extract_test_results_from_xcresult(xcresult_path)
@@ -365,10 +317,10 @@ def run_project_tests(project_path: str,
             # Return the parsed JSON
             return test_results
         else:
-            print(f"DEBUG: Failed to parse xcresult data: {test_results}", file=sys.stderr)
+            print(f"Warning: Failed to parse xcresult data: {test_results}", file=sys.stderr)
 
     # Fallback if we couldn't get xcresult data
-    print(f"DEBUG: No xcresult bundle found for {project_path}", file=sys.stderr)
+    print(f"Warning: No xcresult bundle found for {project_path}", file=sys.stderr)
 
     if status == "succeeded":
         show_result_notification("All tests PASSED")
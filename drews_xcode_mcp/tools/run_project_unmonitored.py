@@ -9,12 +9,13 @@ from drews_xcode_mcp.config_manager import apply_config
 from drews_xcode_mcp.security import validate_and_normalize_project_path
 from drews_xcode_mcp.exceptions import XCodeMCPError
 from drews_xcode_mcp.utils.applescript import (
-    build_open_and_wait_applescript,
-    escape_applescript_string,
+    build_open_and_wait_argv_applescript,
+    open_and_wait_script_args,
     run_applescript,
     show_notification,
     show_error_notification,
 )
+from drews_xcode_mcp.utils.schemes import invalidate_project_schemes
 
 
 @mcp.tool(annotations=TOOL_BUILD)
@@ -51,22 +52,29 @@ def run_project_unmonitored(project_path: str,
     # Validate and normalize path
     scheme_desc = scheme if scheme else "active scheme"
     normalized_path = validate_and_normalize_project_path(project_path, f"Launching {scheme_desc} in")
-    escaped_path = escape_applescript_string(normalized_path)
 
     # Show launching notification
     project_name = os.path.basename(normalized_path)
     scheme_name = scheme if scheme else "active scheme"
     show_notification("Drew's Xcode MCP", subtitle=scheme_name, message=f"Launching {project_name}")
 
-    escaped_scheme = escape_applescript_string(scheme) if scheme else None
     script = (
-        build_open_and_wait_applescript(escaped_path, escaped_scheme)
+        'on run argv\n'
+        + build_open_and_wait_argv_applescript(bool(scheme))
         + '    run workspaceDoc\n'
         + '    return "launched"\n'
         + 'end tell\n'
+        + 'end run\n'
     )
-
-    success, output = run_applescript(script)
+    script_args = open_and_wait_script_args(normalized_path, scheme)
+
+    try:
+        success, output = run_applescript(script, precompile=True, args=script_args)
+    finally:
+        if scheme:
+            # The script made this the active scheme (a timeout may cut it off
+            # after the switch); drop the cached listing.
+            invalidate_project_schemes(normalized_path)
 
     if not success:
         show_error_notification("Failed to launch app", project_name)
@@ -2,6 +2,7 @@
 """run_project_until_terminated tool - Run app until it terminates or times out"""
 
 import os
+import json
 import re
 import sys
 import time
@@ -16,14 +17,15 @@ from drews_xcode_mcp.utils.run_guard import exclusive_per_project
 from drews_xcode_mcp.utils.applescript import (
     resolve_build_timeout,
     format_timeout_duration,
-    build_open_and_wait_applescript,
-    escape_applescript_string,
+    build_open_and_wait_argv_applescript,
+    open_and_wait_script_args,
     run_applescript,
     show_notification,
     show_result_notification,
     show_error_notification,
     show_warning_notification,
 )
+from drews_xcode_mcp.utils.schemes import invalidate_project_schemes
 from drews_xcode_mcp.utils.xcresult import (
     snapshot_xcresult_mtimes,
     wait_for_xcresult_after_timestamp,
@@ -65,15 +67,15 @@ def run_project_until_terminated(project_path: str,
     # Validate and normalize path
     scheme_desc = scheme if scheme else "active scheme"
     normalized_path = validate_and_normalize_project_path(project_path, f"Running {scheme_desc} in")
-    escaped_path = escape_applescript_string(normalized_path)
     effective_timeout = resolve_build_timeout(timeout)
 
     # Validate regex_filter up front so a bad pattern fails immediately rather
-    # than after the (multi-minute) build+run, where it's otherwise only
-    # compiled during log extraction.
+    # than after the (multi-minute) build+run. The compiled pattern is what
+    # log extraction uses, so it isn't compiled a second time.
+    filter_pattern = None
     if regex_filter and regex_filter.strip():
         try:
-            re.compile(regex_filter)
+            filter_pattern = re.compile(regex_filter)
         except re.error as e:
             raise InvalidParameterError(f"Invalid regex_filter: {e}")
 
@@ -94,11 +96,13 @@ def run_project_until_terminated(project_path: str,
     # the old loop drifted longer than `effective_timeout` proportionally to the
     # timeout — which could push the run past the subprocess budget and get
     # osascript killed before its own `stop` ran. Wall-clock keeps the inner
-    # bound honest regardless of IPC overhead.
-    escaped_scheme = escape_applescript_string(scheme) if scheme else None
+    # bound honest regardless of IPC overhead. The poll delay starts at 0.05s
+    # and doubles up to 1s, so a quick exit is noticed almost immediately.
     script = (
-        build_open_and_wait_applescript(escaped_path, escaped_scheme)
+        'on run argv\n'
+        + build_open_and_wait_argv_applescript(bool(scheme))
         + '    set actionResult to run workspaceDoc\n'
+        + '    set pollDelay to 0.05\n'
         + '    set runStartDate to (current date)\n'
         + '    set didTimeout to false\n'
         + '    repeat\n'
@@ -107,21 +111,28 @@ def run_project_until_terminated(project_path: str,
         + '            set didTimeout to true\n'
         + '            exit repeat\n'
         + '        end if\n'
-        + '        delay 1.0\n'
+        + '        delay pollDelay\n'
+        + '        set pollDelay to pollDelay * 2\n'
+        + '        if pollDelay > 1.0 then set pollDelay to 1.0\n'
         + '    end repeat\n'
         + '    if didTimeout then\n'
         + '        stop workspaceDoc\n'
+        + '        set pollDelay to 0.05\n'
         + '        set stopStartDate to (current date)\n'
         + '        repeat\n'
         + '            if completed of actionResult is true then exit repeat\n'
         + '            if ((current date) - stopStartDate) >= 20 then exit repeat\n'
-        + '            delay 1.0\n'
+        + '            delay pollDelay\n'
+        + '            set pollDelay to pollDelay * 2\n'
+        + '            if pollDelay > 1.0 then set pollDelay to 1.0\n'
         + '        end repeat\n'
         + '        return "timeout"\n'
         + '    end if\n'
         + '    return "terminated"\n'
         + 'end tell\n'
+        + 'end run\n'
     )
+    script_args = open_and_wait_script_args(normalized_path, scheme)
 
     print(f"Launching app and waiting for termination (up to {format_timeout_duration(effective_timeout)})...", file=sys.stderr)
 
@@ -142,21 +153,30 @@ def run_project_until_terminated(project_path: str,
     # a fresh short-lived osascript before propagating, rather than leaving the
     # app running.
     try:
-        success, output = run_applescript(script, timeout=effective_timeout + 60)
+        success, output = run_applescript(
+            script, timeout=effective_timeout + 60, precompile=True, args=script_args
+        )
     except XCodeMCPError:
         stop_script = (
-            f'set projectPath to "{escaped_path}"\n'
+            'on run argv\n'
+            'set projectPath to item 1 of argv\n'
             'tell application "Xcode"\n'
             '    set workspaceDoc to first workspace document whose path is projectPath\n'
             '    stop workspaceDoc\n'
             'end tell\n'
+            'end run\n'
         )
         try:
-            run_applescript(stop_script)
+            run_applescript(stop_script, args=[normalized_path])
             print("Issued best-effort stop after run subprocess was killed.", file=sys.stderr)
         except XCodeMCPError:
             print("Best-effort stop after subprocess kill also failed; app may still be running.", file=sys.stderr)
         raise
+    finally:
+        if scheme:
+            # The script made this the active scheme (a timeout may cut it off
+            # after the switch); drop the cached listing.
+            invalidate_project_schemes(normalized_path)
 
     if not success:
         show_error_notification("Failed to launch app", project_name)
@@ -169,11 +189,10 @@ def run_project_until_terminated(project_path: str,
     else:
         print(f"App terminated naturally.", file=sys.stderr)
 
-    # Wait for xcresult to finalize
+    # Wait for an xcresult file that was modified at or after our start time.
+    # No fixed pre-sleep: the wait returns as soon as the bundle appears, and
+    # console-log extraction retries with backoff while it finishes writing.
     print(f"Waiting for runtime logs to become available...", file=sys.stderr)
-    time.sleep(2)
-
-    # Wait for an xcresult file that was modified at or after our start time
     xcresult_timeout = 10
     xcresult_path = wait_for_xcresult_after_timestamp(normalized_path, start_time, xcresult_timeout, prior_mtimes=existing_xcresults)
 
@@ -184,7 +203,7 @@ def run_project_until_terminated(project_path: str,
     print(f"Using xcresult: {xcresult_path}", file=sys.stderr)
 
     # Extract console logs (returns JSON)
-    success, console_output = extract_console_logs_from_xcresult(xcresult_path, regex_filter, max_lines)
+    success, console_output = extract_console_logs_from_xcresult(xcresult_path, filter_pattern, max_lines)
 
     if not success:
         show_error_notification("Failed to extract logs", console_output)
@@ -195,7 +214,6 @@ def run_project_until_terminated(project_path: str,
         return "Run completed. No console output found (or filtered out)."
 
     # Show result notification with error count
-    import json
     try:
         output_data = json.loads(console_output)
         summary = output_data.get("summary", {})
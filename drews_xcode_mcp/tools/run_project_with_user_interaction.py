@@ -2,12 +2,13 @@
 """run_project_with_user_interaction tool - Run app with user interaction"""
 
 import os
+import json
 import re
 import sys
 import time
 import datetime
 import subprocess
-from typing import Optional
+from typing import List, Optional
 
 from drews_xcode_mcp.server import mcp, TOOL_BUILD
 from drews_xcode_mcp.config_manager import apply_config
@@ -15,15 +16,16 @@ from drews_xcode_mcp.security import validate_and_normalize_project_path
 from drews_xcode_mcp.exceptions import XCodeMCPError, InvalidParameterError
 from drews_xcode_mcp.utils.run_guard import exclusive_per_project
 from drews_xcode_mcp.utils.applescript import (
-    build_open_and_wait_applescript,
+    build_open_and_wait_argv_applescript,
+    open_and_wait_script_args,
     build_action_completed_check_applescript,
-    escape_applescript_string,
     run_applescript,
     show_notification,
     show_result_notification,
     show_error_notification,
     show_persistent_alert,
 )
+from drews_xcode_mcp.utils.schemes import invalidate_project_schemes
 from drews_xcode_mcp.utils.xcresult import (
     snapshot_xcresult_mtimes,
     wait_for_xcresult_after_timestamp,
@@ -41,6 +43,19 @@ MAX_INTERACTIVE_RUN_SECONDS = 3600
 LAUNCH_SETTLE_TIMEOUT = 10
 
 
+def _action_completed(check_script: str, check_args: List[str]) -> bool:
+    """Run a completed-check AppleScript once; True if it reported "true".
+
+    Both check scripts return `completed ... as string`, which AppleScript
+    renders as lowercase "true"/"false", and run_applescript strips the output,
+    so a direct comparison is enough. The same script is polled every 0.5-2s
+    for the whole run, so it is run from a compiled .scpt; the project path and
+    action id arrive through `check_args`, keeping its text fixed.
+    """
+    success, completed_str = run_applescript(check_script, precompile=True, args=check_args)
+    return success and completed_str == "true"
+
+
 @mcp.tool(annotations=TOOL_BUILD)
 @apply_config
 @exclusive_per_project
@@ -73,14 +88,14 @@ def run_project_with_user_interaction(project_path: str,
     # Validate and normalize path
     scheme_desc = scheme if scheme else "active scheme"
     normalized_path = validate_and_normalize_project_path(project_path, f"Running {scheme_desc} in")
-    escaped_path = escape_applescript_string(normalized_path)
 
     # Validate regex_filter up front so a bad pattern fails immediately rather
-    # than after a multi-minute build+run (it's otherwise only compiled during
-    # log extraction at the very end).
+    # than after a multi-minute build+run. The compiled pattern is what log
+    # extraction uses, so it isn't compiled a second time.
+    filter_pattern = None
     if regex_filter and regex_filter.strip():
         try:
-            re.compile(regex_filter)
+            filter_pattern = re.compile(regex_filter)
         except re.error as e:
             raise InvalidParameterError(f"Invalid regex_filter: {e}")
 
@@ -89,17 +104,23 @@ def run_project_with_user_interaction(project_path: str,
     scheme_name = scheme if scheme else "active scheme"
     show_notification("Drew's Xcode MCP", subtitle=scheme_name, message=f"Running {project_name}")
 
-    escaped_scheme = escape_applescript_string(scheme) if scheme else None
     script = (
-        build_open_and_wait_applescript(escaped_path, escaped_scheme)
+        'on run argv\n'
+        + build_open_and_wait_argv_applescript(bool(scheme))
         + '    set actionResult to run workspaceDoc\n'
         + '    set actionId to ""\n'
+        + '    set probeState to "notfound"\n'
         + '    try\n'
         + '        set actionId to (id of actionResult) as string\n'
+        + '        repeat with r in scheme action results of workspaceDoc\n'
+        + '            if ((id of r) as string) is actionId then set probeState to "found"\n'
+        + '        end repeat\n'
         + '    end try\n'
-        + '    return "launched:" & actionId\n'
+        + '    return "launched:" & actionId & tab & probeState\n'
         + 'end tell\n'
+        + 'end run\n'
     )
+    script_args = open_and_wait_script_args(normalized_path, scheme)
 
     print(f"Launching app...", file=sys.stderr)
 
@@ -114,7 +135,13 @@ def run_project_with_user_interaction(project_path: str,
 
     # The launch AppleScript only kicks off `run workspaceDoc` and returns
     # immediately; the default timeout covers workspace load + dispatch.
-    success, output = run_applescript(script)
+    try:
+        success, output = run_applescript(script, precompile=True, args=script_args)
+    finally:
+        if scheme:
+            # The script made this the active scheme (a timeout may cut it off
+            # after the switch); drop the cached listing.
+            invalidate_project_schemes(normalized_path)
 
     if not success:
         show_error_notification("Failed to launch app", project_name)
@@ -123,39 +150,46 @@ def run_project_with_user_interaction(project_path: str,
     # Capture this run's action id so every poll below checks THIS action rather
     # than the workspace-global `last scheme action result`, which a concurrent
     # build/run/test on the same workspace could repoint mid-run.
+    # The launch script also probes, in the same osascript invocation, that the
+    # action it just started is findable by id — saving a separate round-trip.
+    # run_applescript already strips its output, so the reply is exactly
+    # "launched:<id>\t<found|notfound>".
     action_id = ""
-    if output.strip().startswith("launched:"):
-        action_id = output.strip()[len("launched:"):].strip()
+    probe = "notfound"
+    marker, _, launch_info = output.partition(":")
+    if marker == "launched":
+        action_id, _, probe = launch_info.partition("\t")
 
     # Last-action check, used as a fallback whenever the action-id check isn't
     # usable. This is the original behavior (subject to the cross-action race),
     # so falling back never does worse than before the id pinning was added.
-    fallback_check_script = f'''
-    set projectPath to "{escaped_path}"
+    fallback_check_script = '''
+    on run argv
+    set projectPath to item 1 of argv
 
     tell application "Xcode"
         set workspaceDoc to first workspace document whose path is projectPath
         set lastAction to last scheme action result of workspaceDoc
         return completed of lastAction as string
     end tell
+    end run
     '''
 
+    check_script = fallback_check_script
+    check_args = [normalized_path]
     if action_id:
-        escaped_action_id = escape_applescript_string(action_id)
-        check_script = build_action_completed_check_applescript(escaped_path, escaped_action_id)
-        # Probe once: the action we just started must be present in the
-        # workspace's action results. Fall back to the last-action check unless
-        # the probe clearly confirms id matching works — i.e. if the probe
-        # itself errors (probe_ok False) OR returns "notfound". Otherwise a
-        # transient probe failure would leave every later poll erroring and miss
-        # natural termination, hanging the run until the user clicks or the cap.
-        probe_ok, probe = run_applescript(check_script)
-        if not probe_ok or probe.strip().lower() == "notfound":
-            print(f"Warning: run action id not usable (probe_ok={probe_ok}, probe={probe!r}); falling back to last-action check", file=sys.stderr)
-            check_script = fallback_check_script
+        # The action we just started must be present in the workspace's action
+        # results. Fall back to the last-action check unless the launch-time
+        # probe clearly confirms id matching works. Otherwise every later poll
+        # would miss natural termination, hanging the run until the user clicks
+        # or the cap.
+        if probe == "found":
+            check_script = build_action_completed_check_applescript()
+            check_args = [normalized_path, action_id]
+        else:
+            print(f"Warning: run action id not usable (probe={probe!r}); falling back to last-action check", file=sys.stderr)
     else:
         print("Warning: could not capture run action id; falling back to last-action check", file=sys.stderr)
-        check_script = fallback_check_script
 
     print(f"App launched, waiting for it to settle (up to {LAUNCH_SETTLE_TIMEOUT}s)...", file=sys.stderr)
 
@@ -165,8 +199,7 @@ def run_project_with_user_interaction(project_path: str,
     settle_elapsed = 0.0
     app_terminated = False
     while settle_elapsed < LAUNCH_SETTLE_TIMEOUT:
-        success, completed_str = run_applescript(check_script)
-        if success and completed_str.strip().lower() == "true":
+        if _action_completed(check_script, check_args):
             print(f"App terminated during launch settle window (likely crashed at launch)", file=sys.stderr)
             app_terminated = True
             break
@@ -209,8 +242,7 @@ def run_project_with_user_interaction(project_path: str,
                 user_clicked_finish = True
                 break
 
-            success, completed_str = run_applescript(check_script)
-            if success and completed_str.strip().lower() == "true":
+            if _action_completed(check_script, check_args):
                 print(f"App terminated naturally", file=sys.stderr)
                 app_terminated = True
                 try:
@@ -246,29 +278,29 @@ def run_project_with_user_interaction(project_path: str,
     # If user clicked finish, we need to stop the app
     if user_clicked_finish and not app_terminated:
         print(f"Force-stopping app...", file=sys.stderr)
-        stop_script = f'''
-        set projectPath to "{escaped_path}"
+        stop_script = '''
+        on run argv
+        set projectPath to item 1 of argv
 
         tell application "Xcode"
             set workspaceDoc to first workspace document whose path is projectPath
             stop workspaceDoc
         end tell
+        end run
         '''
-        run_applescript(stop_script)
+        run_applescript(stop_script, args=[normalized_path])
 
         # Wait and verify it stopped, reusing the same action-pinned check.
         for _ in range(10):  # Wait up to 20 seconds
-            success, completed_str = run_applescript(check_script)
-            if success and completed_str.strip().lower() == "true":
+            if _action_completed(check_script, check_args):
                 print(f"App stopped successfully", file=sys.stderr)
                 break
             time.sleep(2)
 
-    # Wait for xcresult to finalize
+    # Wait for an xcresult file that was modified at or after our start time.
+    # No fixed pre-sleep: the wait returns as soon as the bundle appears, and
+    # console-log extraction retries with backoff while it finishes writing.
     print(f"Waiting for runtime logs to become available...", file=sys.stderr)
-    time.sleep(2)
-
-    # Wait for an xcresult file that was modified at or after our start time
     xcresult_timeout = 10
     xcresult_path = wait_for_xcresult_after_timestamp(normalized_path, start_time, xcresult_timeout, prior_mtimes=existing_xcresults)
 
@@ -279,7 +311,7 @@ def run_project_with_user_interaction(project_path: str,
     print(f"Using xcresult: {xcresult_path}", file=sys.stderr)
 
     # Extract console logs (returns JSON)
-    success, console_output = extract_console_logs_from_xcresult(xcresult_path, regex_filter, max_lines)
+    success, console_output = extract_console_logs_from_xcresult(xcresult_path, filter_pattern, max_lines)
 
     if not success:
         show_error_notification("Failed to extract logs", console_output)
@@ -290,7 +322,6 @@ def run_project_with_user_interaction(project_path: str,
         return "Run completed. No console output found (or filtered out)."
 
     # Show result notification with error count
-    import json
     try:
         output_data = json.loads(console_output)
         summary = output_data.get("summary", {})
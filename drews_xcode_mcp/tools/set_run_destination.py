@@ -9,8 +9,7 @@ from drews_xcode_mcp.config_manager import apply_config
 from drews_xcode_mcp.security import validate_and_normalize_project_path
 from drews_xcode_mcp.exceptions import InvalidParameterError, XCodeMCPError
 from drews_xcode_mcp.utils.applescript import (
-    build_open_and_wait_applescript,
-    escape_applescript_string,
+    build_open_and_wait_argv_applescript,
     run_applescript,
     show_notification,
     show_result_notification,
@@ -43,14 +42,12 @@ def set_run_destination(
         raise InvalidParameterError("destination_id cannot be empty")
 
     normalized_path = validate_and_normalize_project_path(project_path, "Setting destination for")
-    escaped_path = escape_applescript_string(normalized_path)
-    escaped_dest_id = escape_applescript_string(destination_id.strip())
     project_name = os.path.basename(normalized_path)
 
     show_notification("Setting Destination", project_name, destination_id)
 
-    script = build_open_and_wait_applescript(escaped_path) + f'''
-    set targetDeviceId to "{escaped_dest_id}"
+    script = 'on run argv\n' + build_open_and_wait_argv_applescript(False) + '''
+    set targetDeviceId to item 2 of argv
     set dests to run destinations of workspaceDoc
     set foundDest to missing value
     set foundName to ""
@@ -73,9 +70,12 @@ def set_run_destination(
     set active run destination of workspaceDoc to foundDest
     return foundName
 end tell
+end run
 '''
 
-    success, output = run_applescript(script)
+    success, output = run_applescript(
+        script, precompile=True, args=[normalized_path, destination_id.strip()]
+    )
 
     if not success:
         show_error_notification(f"Failed to set destination", output)
@@ -7,7 +7,7 @@ from drews_xcode_mcp.server import mcp, TOOL_MUTATING_IDEMPOTENT
 from drews_xcode_mcp.config_manager import apply_config
 from drews_xcode_mcp.security import validate_and_normalize_project_path
 from drews_xcode_mcp.exceptions import InvalidParameterError, XCodeMCPError
-from drews_xcode_mcp.utils.applescript import escape_applescript_string, run_applescript, show_result_notification, show_error_notification
+from drews_xcode_mcp.utils.applescript import run_applescript, show_result_notification, show_error_notification
 
 
 @mcp.tool(annotations=TOOL_MUTATING_IDEMPOTENT)
@@ -25,16 +25,19 @@ def stop_project(project_path: str) -> str:
     """
     # Validate and normalize path
     normalized_path = validate_and_normalize_project_path(project_path, "Stopping build/run for")
-    escaped_path = escape_applescript_string(normalized_path)
 
-    # AppleScript to stop the current build or run operation
-    script = f'''
+    # AppleScript to stop the current build or run operation. The path is
+    # passed as a run-handler argument, so the same compiled script serves
+    # every project.
+    script = '''
+    on run argv
+    set projectPath to item 1 of argv
     tell application "Xcode"
         -- Try to get the workspace document
         try
-            set workspaceDoc to first workspace document whose path is "{escaped_path}"
+            set workspaceDoc to first workspace document whose path is projectPath
         on error
-            return "ERROR: No open workspace found for path: {escaped_path}"
+            return "ERROR: No open workspace found for path: " & projectPath
         end try
 
         -- Stop the current action (build or run)
@@ -45,9 +48,10 @@ def stop_project(project_path: str) -> str:
             return "ERROR: " & errMsg
         end try
     end tell
+    end run
     '''
 
-    success, output = run_applescript(script)
+    success, output = run_applescript(script, precompile=True, args=[normalized_path])
 
     project_name = os.path.basename(normalized_path)
 
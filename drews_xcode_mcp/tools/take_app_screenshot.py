@@ -1,14 +1,11 @@
 #!/usr/bin/env python3
 """take_app_screenshot tool - Screenshot all windows of an app"""
 
-import os
-import subprocess
-
 from drews_xcode_mcp.server import mcp, TOOL_READONLY
 from drews_xcode_mcp.config_manager import apply_config
 from drews_xcode_mcp.exceptions import XCodeMCPError
 from drews_xcode_mcp.utils.applescript import show_result_notification, show_error_notification
-from drews_xcode_mcp.utils.screenshot import _get_all_windows, get_screenshot_path
+from drews_xcode_mcp.utils.screenshot import _find_apps_by_name, capture_windows
 
 
 @mcp.tool(annotations=TOOL_READONLY)
@@ -31,16 +28,8 @@ def take_app_screenshot(app_name: str) -> str:
         XCodeMCPError: If no matching app found, multiple apps match, or screenshot fails.
     """
     try:
-        # Get all windows
-        windows_data = _get_all_windows()
-
         # Find matching apps (case-insensitive substring match)
-        search_term = app_name.lower()
-        matching_apps = {}
-
-        for app, windows in windows_data.items():
-            if search_term in app.lower():
-                matching_apps[app] = windows
+        matching_apps = _find_apps_by_name(app_name)
 
         if not matching_apps:
             error_msg = f"App not found: {app_name}"
@@ -74,31 +63,7 @@ def take_app_screenshot(app_name: str) -> str:
         # Limit to 5 windows
         windows = windows[:5]
 
-        # Take screenshots
-        screenshot_paths = []
-
-        for window in windows:
-            screenshot_path = get_screenshot_path("app")
-
-            # Take the screenshot using screencapture (-x flag disables sound)
-            result = subprocess.run(
-                ['screencapture', '-x', '-l', str(window['id']), screenshot_path],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-
-            if result.returncode != 0:
-                show_error_notification("Failed to capture window", f"Window {window['id']}")
-                raise XCodeMCPError(f"Failed to capture window {window['id']}: {result.stderr}")
-
-            # Verify file was created
-            if not os.path.exists(screenshot_path):
-                error_msg = "Screenshot failed"
-                show_error_notification(error_msg, f"Window {window['id']}")
-                raise XCodeMCPError(f"Screenshot file was not created for window {window['id']}")
-
-            screenshot_paths.append(screenshot_path)
+        screenshot_paths = capture_windows([window['id'] for window in windows], "app")
 
         # Show success notification
         show_result_notification(f'Screenshotting "{app_matched}"')
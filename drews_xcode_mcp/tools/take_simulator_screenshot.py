@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 """take_simulator_screenshot tool - Screenshot iOS simulator"""
 
-import os
 import sys
 import subprocess
 from typing import Optional
@@ -10,7 +9,7 @@ from drews_xcode_mcp.server import mcp, TOOL_READONLY
 from drews_xcode_mcp.config_manager import apply_config
 from drews_xcode_mcp.exceptions import XCodeMCPError
 from drews_xcode_mcp.utils.applescript import show_result_notification, show_error_notification
-from drews_xcode_mcp.utils.screenshot import _get_booted_simulators, get_screenshot_path
+from drews_xcode_mcp.utils.screenshot import _get_booted_simulators, get_screenshot_path, run_capture_command, SIMCTL_SCREENSHOT_TIMEOUT
 
 
 @mcp.tool(annotations=TOOL_READONLY)
@@ -66,11 +65,9 @@ def take_simulator_screenshot(udid: Optional[str] = None) -> str:
         print(f"Taking screenshot of '{target_name}' (UDID: {target_udid})", file=sys.stderr)
 
         # Take the screenshot
-        result = subprocess.run(
+        result = run_capture_command(
             ['xcrun', 'simctl', 'io', target_udid, 'screenshot', screenshot_path],
-            capture_output=True,
-            text=True,
-            timeout=10
+            timeout=SIMCTL_SCREENSHOT_TIMEOUT,
         )
 
         if result.returncode != 0:
@@ -86,12 +83,6 @@ def take_simulator_screenshot(udid: Optional[str] = None) -> str:
                 show_error_notification("Failed to take screenshot", error_msg)
                 raise XCodeMCPError(f"Failed to take screenshot: {error_msg}")
 
-        # Verify the file was created
-        if not os.path.exists(screenshot_path):
-            error_msg = "Screenshot failed"
-            show_error_notification(error_msg, "File not created")
-            raise XCodeMCPError("Screenshot file was not created")
-
         print(f"Screenshot saved to: {screenshot_path}", file=sys.stderr)
         show_result_notification(f"Screenshotting {target_name}")
         return screenshot_path
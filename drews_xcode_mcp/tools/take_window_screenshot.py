@@ -1,14 +1,11 @@
 #!/usr/bin/env python3
 """take_window_screenshot tool - Screenshot macOS windows"""
 
-import os
-import subprocess
-
 from drews_xcode_mcp.server import mcp, TOOL_READONLY
 from drews_xcode_mcp.config_manager import apply_config
 from drews_xcode_mcp.exceptions import XCodeMCPError
 from drews_xcode_mcp.utils.applescript import show_result_notification, show_error_notification
-from drews_xcode_mcp.utils.screenshot import _get_all_windows, get_screenshot_path
+from drews_xcode_mcp.utils.screenshot import _find_window_by_id, _find_windows_by_title, capture_windows
 
 # Cap on how many windows a single title-substring query will screenshot. A
 # broad substring can match many windows; without a cap that's slow and a
@@ -38,28 +35,19 @@ def take_window_screenshot(window_id_or_name: str) -> str:
         XCodeMCPError: If no matching windows found or screenshot fails.
     """
     try:
-        # First, get all windows
-        windows_data = _get_all_windows()
-
         matches = []
 
         # Try to interpret as window ID first
         try:
             target_id = int(window_id_or_name)
-            for app_name, windows in windows_data.items():
-                for window in windows:
-                    if window['id'] == target_id:
-                        matches.append((window['id'], window['title'], app_name))
-                        break
-                if matches:
-                    break
+            entry = _find_window_by_id(target_id)
+            if entry:
+                app_name, window = entry
+                matches.append((window['id'], window['title'], app_name))
         except ValueError:
             # Not a number, search by title substring (case-insensitive)
-            search_term = window_id_or_name.lower()
-            for app_name, windows in windows_data.items():
-                for window in windows:
-                    if search_term in window['title'].lower():
-                        matches.append((window['id'], window['title'], app_name))
+            for app_name, window in _find_windows_by_title(window_id_or_name):
+                matches.append((window['id'], window['title'], app_name))
 
         if not matches:
             error_msg = f"Window not found: {window_id_or_name}"
@@ -70,31 +58,7 @@ def take_window_screenshot(window_id_or_name: str) -> str:
         total_matches = len(matches)
         matches = matches[:MAX_WINDOW_MATCHES]
 
-        # Take screenshots
-        screenshot_paths = []
-
-        for window_id, window_title, app_name in matches:
-            screenshot_path = get_screenshot_path("window")
-
-            # Take the screenshot using screencapture (-x flag disables sound)
-            result = subprocess.run(
-                ['screencapture', '-x', '-l', str(window_id), screenshot_path],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-
-            if result.returncode != 0:
-                show_error_notification("Failed to capture window", f"Window {window_id}")
-                raise XCodeMCPError(f"Failed to capture window {window_id}: {result.stderr}")
-
-            # Verify file was created
-            if not os.path.exists(screenshot_path):
-                error_msg = "Screenshot failed"
-                show_error_notification(error_msg, f"Window {window_id}")
-                raise XCodeMCPError(f"Screenshot file was not created for window {window_id}")
-
-            screenshot_paths.append(screenshot_path)
+        screenshot_paths = capture_windows([window_id for window_id, _, _ in matches], "window")
 
         # Show success notification
         if len(matches) == 1:
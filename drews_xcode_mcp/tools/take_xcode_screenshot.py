@@ -3,19 +3,67 @@
 
 import os
 import sys
-import subprocess
 
 from drews_xcode_mcp.server import mcp, TOOL_READONLY
 from drews_xcode_mcp.config_manager import apply_config
 from drews_xcode_mcp.security import validate_and_normalize_project_path
 from drews_xcode_mcp.exceptions import XCodeMCPError
 from drews_xcode_mcp.utils.applescript import (
-    escape_applescript_string,
+    DEFAULT_APPLESCRIPT_TIMEOUT,
+    SCREENCAPTURE_ERROR_NUMBER,
+    has_error_number,
     run_applescript,
     show_result_notification,
     show_error_notification,
 )
-from drews_xcode_mcp.utils.screenshot import get_screenshot_path
+from drews_xcode_mcp.utils.screenshot import (
+    SCREENCAPTURE_TIMEOUT,
+    SCREENSHOT_DIR,
+    new_screenshot_path,
+    prune_old_screenshots,
+)
+
+# Looks up the project's Xcode window and captures it in one osascript
+# invocation. Inputs arrive through argv (project path, workspace name,
+# screenshot directory, screenshot path), so the text is fixed and is run
+# from a compiled .scpt. The screenshot directory is only created once a
+# window was found, so a failed lookup leaves the cache untouched.
+_CAPTURE_XCODE_WINDOW_APPLESCRIPT = f'''
+on run argv
+    set projectPath to item 1 of argv
+    set workspaceName to item 2 of argv
+    set screenshotDir to item 3 of argv
+    set screenshotPath to item 4 of argv
+    set windowId to missing value
+    tell application "Xcode"
+        -- First, try to find the window by exact path match
+        repeat with w in windows
+            try
+                if path of document of w is projectPath then
+                    set windowId to id of w
+                    exit repeat
+                end if
+            end try
+        end repeat
+
+        -- If not found by path, try by name (less reliable but fallback)
+        if windowId is missing value then
+            try
+                set windowId to id of window workspaceName
+            on error
+                error "No Xcode window found for project: " & workspaceName
+            end try
+        end if
+    end tell
+
+    try
+        do shell script "mkdir -p " & quoted form of screenshotDir & " && screencapture -l " & windowId & " -x -o " & quoted form of screenshotPath
+    on error errMsg
+        error "Failed to capture screenshot: " & errMsg number {SCREENCAPTURE_ERROR_NUMBER}
+    end try
+    return windowId as string
+end run
+'''
 
 
 @mcp.tool(annotations=TOOL_READONLY)
@@ -35,76 +83,36 @@ def take_xcode_screenshot(project_path: str) -> str:
     """
     # Validate and normalize path
     normalized_path = validate_and_normalize_project_path(project_path, "Taking Xcode screenshot for")
-    escaped_path = escape_applescript_string(normalized_path)
 
     try:
         # Get the workspace name (used as window title in Xcode)
         workspace_name = os.path.basename(normalized_path)
-        escaped_workspace_name = escape_applescript_string(workspace_name)
-
-        # Get the window ID via AppleScript
-        script = f'''
-        tell application "Xcode"
-            -- First, try to find the window by exact path match
-            repeat with w in windows
-                try
-                    if path of document of w is "{escaped_path}" then
-                        return id of w
-                    end if
-                end try
-            end repeat
-
-            -- If not found by path, try by name (less reliable but fallback)
-            try
-                return id of window "{escaped_workspace_name}"
-            on error
-                error "No Xcode window found for project: {escaped_workspace_name}"
-            end try
-        end tell
-        '''
-
-        success, window_id = run_applescript(script)
-        if not success:
-            show_error_notification("Failed to get Xcode window", window_id)
-            raise XCodeMCPError(f"Failed to get Xcode window: {window_id}")
-
-        window_id = window_id.strip()
-        if not window_id:
-            show_error_notification("No Xcode window found", workspace_name)
-            raise XCodeMCPError(f"No Xcode window found for project: {workspace_name}")
-
-        print(f"Found Xcode window with ID: {window_id}", file=sys.stderr)
-
-        screenshot_path = get_screenshot_path("xcode")
+        screenshot_path = new_screenshot_path("xcode")
 
         print(f"Taking screenshot of Xcode window for '{workspace_name}'", file=sys.stderr)
 
-        # Capture the screenshot using screencapture
-        result = subprocess.run(
-            ["screencapture", "-l", window_id, "-x", "-o", screenshot_path],
-            capture_output=True,
-            text=True,
-            timeout=10
+        # Look up the window ID and run screencapture in the same osascript
+        # invocation, so a screenshot costs one process launch from Python
+        # rather than an AppleScript lookup followed by a separate capture.
+        success, output = run_applescript(
+            _CAPTURE_XCODE_WINDOW_APPLESCRIPT,
+            timeout=DEFAULT_APPLESCRIPT_TIMEOUT + SCREENCAPTURE_TIMEOUT,
+            precompile=True,
+            args=[normalized_path, workspace_name, SCREENSHOT_DIR, screenshot_path],
         )
-
-        if result.returncode != 0:
-            show_error_notification("Failed to capture screenshot", result.stderr)
-            raise XCodeMCPError(f"Failed to capture screenshot: {result.stderr}")
-
-        # Verify the file was created
-        if not os.path.exists(screenshot_path):
-            error_msg = "Screenshot failed"
-            show_error_notification(error_msg, "File not created")
-            raise XCodeMCPError("Screenshot file was not created")
-
+        if not success:
+            if has_error_number(output, SCREENCAPTURE_ERROR_NUMBER):
+                show_error_notification("Failed to capture screenshot", output)
+                raise XCodeMCPError(output)
+            show_error_notification("Failed to get Xcode window", output)
+            raise XCodeMCPError(f"Failed to get Xcode window: {output}")
+        prune_old_screenshots()
+
+        print(f"Captured Xcode window with ID: {output.strip()}", file=sys.stderr)
         print(f"Screenshot saved to: {screenshot_path}", file=sys.stderr)
         show_result_notification(f"Screenshotting Xcode {workspace_name}")
         return screenshot_path
 
-    except subprocess.TimeoutExpired:
-        error_msg = "Screenshot timeout"
-        show_error_notification(error_msg)
-        raise XCodeMCPError("Timeout while taking screenshot")
     except Exception as e:
         if isinstance(e, XCodeMCPError):
             if "not found" not in str(e).lower():
@@ -1,31 +1,44 @@
 #!/usr/bin/env python3
 """AppleScript execution and notification utilities"""
 
+import functools
+import hashlib
+import os
 import subprocess
 import sys
 import datetime
 import threading
-from collections import deque
-from typing import Tuple, List, Dict, Optional
+import time
+from string import Template
+from collections import OrderedDict, deque
+from typing import Tuple, List, Dict, Optional, Sequence
 
 from drews_xcode_mcp.exceptions import XCodeMCPError, InvalidParameterError
+from drews_xcode_mcp.utils.paths import COMPILED_SCRIPT_DIR
 
 # Global notification setting - initialized by CLI
 NOTIFICATIONS_ENABLED = True
 
 # Bounded notification history. Long-lived MCP servers post many notifications;
-# capping the history prevents unbounded memory growth.
+# capping the history prevents unbounded memory growth. Entries are raw
+# (time.time(), title, subtitle, message, sound) tuples; get_notification_history
+# formats them, so recording a notification doesn't pay for timestamp
+# formatting that is only needed when the debug tool reads the history.
 NOTIFICATION_HISTORY_MAX = 100
-NOTIFICATION_HISTORY: "deque[Dict[str, str]]" = deque(maxlen=NOTIFICATION_HISTORY_MAX)
+NOTIFICATION_HISTORY: "deque[Tuple[float, str, Optional[str], Optional[str], bool]]" = deque(
+    maxlen=NOTIFICATION_HISTORY_MAX
+)
 # Guards both `.append()` in show_notification and `list(...)` in
 # get_notification_history. FastMCP dispatches sync tools onto a threadpool;
 # without this, an interleaved iterate-during-append can raise
 # `RuntimeError: deque mutated during iteration` from the C iterator.
 _NOTIFICATION_HISTORY_LOCK = threading.Lock()
 
-# Number of 0.5-second poll iterations before giving up on waiting for an Xcode
-# workspace document to load.
-WORKSPACE_LOAD_REPEATS = 60
+# Seconds to wait for an Xcode workspace document to load before giving up.
+# The poll delay starts short and doubles up to WORKSPACE_LOAD_MAX_DELAY, so a
+# workspace that finishes loading quickly isn't held for a full 0.5s tick.
+WORKSPACE_LOAD_TIMEOUT_SECONDS = 30
+WORKSPACE_LOAD_MAX_DELAY = 0.5
 
 # Default maximum time (seconds) to wait for a build or run action to complete
 # in AppleScript polling loops. Used when a caller doesn't pass an explicit
@@ -46,6 +59,16 @@ MAX_BUILD_TIMEOUT_SECONDS = 7200
 # Apple's reserved error-number ranges.
 ACTION_TIMEOUT_ERROR_NUMBER = 9001
 
+# AppleScript error number raised by take_xcode_screenshot's script when the
+# window was found but screencapture failed, so the tool can tell that apart
+# from a missing window via has_error_number().
+SCREENCAPTURE_ERROR_NUMBER = 9002
+
+# Cap on the poll delay in build_wait_for_completion_applescript. Like the
+# workspace-load wait, the delay starts at 0.05s and doubles up to this cap, so
+# a short action returns within tens of milliseconds of completing.
+ACTION_POLL_MAX_DELAY = 0.5
+
 # Default subprocess timeout for `osascript` invocations that are expected to
 # return quickly (lookups, cleanup commands, individual status checks). Callers
 # that wrap a long-running inner AppleScript loop (build/run/test) must pass an
@@ -53,10 +76,36 @@ ACTION_TIMEOUT_ERROR_NUMBER = 9001
 # tools/run_project_*.py.
 DEFAULT_APPLESCRIPT_TIMEOUT = 60
 
+# osascript/osacompile are launched by absolute path with close_fds=False so
+# CPython can start them with posix_spawn instead of fork+exec, which is much
+# cheaper on macOS for a process with a large address space. Python's own file
+# descriptors are non-inheritable (PEP 446), so nothing extra leaks into the
+# child.
+OSASCRIPT = '/usr/bin/osascript'
+OSACOMPILE = '/usr/bin/osacompile'
+
 # Subprocess timeout for fire-and-forget notification dispatch. Short on
 # purpose: if Notification Center is wedged we don't want to block any tool.
 NOTIFICATION_TIMEOUT = 5
 
+# Notifications are posted by a single background thread so tools don't wait
+# on an osascript launch per notification. The queue is bounded: if Notification
+# Center stalls, the oldest pending notifications are dropped rather than
+# piling up. Everything queued while the worker was busy is posted together by
+# one osascript launch.
+NOTIFICATION_QUEUE_MAX = 32
+_NOTIFICATION_QUEUE: "deque[Tuple[str, str]]" = deque(maxlen=NOTIFICATION_QUEUE_MAX)
+_NOTIFICATION_QUEUE_COND = threading.Condition()
+_notification_worker: Optional[threading.Thread] = None
+
+# A notification identical to one posted within this many seconds is not
+# posted again (it is still recorded in NOTIFICATION_HISTORY). Repeated error
+# states otherwise re-post the same banner on every tool call. Only touched by
+# the poster thread, so it needs no lock.
+NOTIFICATION_DEDUPE_SECONDS = 5.0
+_NOTIFICATION_DEDUPE_MAX = 64
+_recently_posted: "OrderedDict[str, float]" = OrderedDict()
+
 
 def set_notifications_enabled(enabled: bool):
     """Set the global notification setting"""
@@ -67,7 +116,17 @@ def set_notifications_enabled(enabled: bool):
 def get_notification_history() -> List[Dict[str, str]]:
     """Get a snapshot of the notification history"""
     with _NOTIFICATION_HISTORY_LOCK:
-        return list(NOTIFICATION_HISTORY)
+        entries = list(NOTIFICATION_HISTORY)
+    return [
+        {
+            'timestamp': datetime.datetime.fromtimestamp(timestamp).isoformat(),
+            'title': title,
+            'subtitle': subtitle or '',
+            'message': message or '',
+            'sound': str(sound)
+        }
+        for timestamp, title, subtitle, message, sound in entries
+    ]
 
 
 def clear_notification_history():
@@ -76,10 +135,14 @@ def clear_notification_history():
         NOTIFICATION_HISTORY.clear()
 
 
+@functools.lru_cache(maxsize=256)
 def escape_applescript_string(s: str) -> str:
     """
     Escape a string for safe use in AppleScript.
 
+    Memoized: the same project path and scheme are escaped on every tool call
+    (and several times per call), and the result depends only on the input.
+
     Args:
         s: String to escape
 
@@ -92,43 +155,83 @@ def escape_applescript_string(s: str) -> str:
     return s
 
 
-def build_open_and_wait_applescript(escaped_path: str, escaped_scheme: Optional[str] = None) -> str:
+# Script templates are parsed once at import; callers only substitute the
+# per-call values. Constants (poll counts, error numbers) are baked in here so
+# each call is a single Template.substitute rather than a multi-part f-string.
+_OPEN_AND_WAIT_TEMPLATE = Template(
+    '${path_decl}'
+    '${scheme_decl}'
+    'tell application "Xcode"\n'
+    '    set workspaceDoc to missing value\n'
+    '    try\n'
+    '        set workspaceDoc to first workspace document whose path is projectPath\n'
+    '    end try\n'
+    '    if workspaceDoc is missing value then\n'
+    '        open projectPath\n'
+    '        set workspaceDoc to first workspace document whose path is projectPath\n'
+    '    end if\n'
+    '\n'
+    '    set loadDelay to 0.05\n'
+    '    set loadStartDate to (current date)\n'
+    '    repeat\n'
+    '        if loaded of workspaceDoc is true then exit repeat\n'
+    f'        if ((current date) - loadStartDate) >= {WORKSPACE_LOAD_TIMEOUT_SECONDS} then exit repeat\n'
+    '        delay loadDelay\n'
+    '        set loadDelay to loadDelay * 2\n'
+    f'        if loadDelay > {WORKSPACE_LOAD_MAX_DELAY} then set loadDelay to {WORKSPACE_LOAD_MAX_DELAY}\n'
+    '    end repeat\n'
+    '    if loaded of workspaceDoc is false then\n'
+    '        error "Xcode workspace did not load in time."\n'
+    '    end if\n'
+    '\n'
+    '${scheme_setup}'
+)
+# The path and scheme arrive as osascript arguments to the caller's
+# `on run argv` handler instead of string literals.
+_ARGV_PATH_DECL = 'set projectPath to item 1 of argv\n'
+_ARGV_SCHEME_DECL = 'set schemeName to item 2 of argv\n'
+_SCHEME_SETUP = (
+    "    set active scheme of workspaceDoc to (first scheme of workspaceDoc whose name is schemeName)\n"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def build_open_and_wait_argv_applescript(with_scheme: bool = False) -> str:
     """
     Return the AppleScript prologue that opens an Xcode project, waits for the
-    workspace document to load, and (if a scheme is provided) sets it active.
+    workspace document to load, and (if `with_scheme`) sets the active scheme.
+
+    A workspace Xcode already has open is used as-is: `open` is only sent when
+    no workspace document matches the path, so the common already-open case
+    skips that Apple Event and the reload/activation it can trigger.
+
+    The project path (and, when `with_scheme`, the scheme name) are read from
+    the run handler's `argv` rather than embedded as string literals. The
+    caller wraps the full script in `on run argv` ... `end run` and passes the
+    raw (unescaped) path and scheme via run_applescript's `args`. The script
+    text is then the same for every project, so with `precompile=True` one
+    compiled .scpt serves all of them, and no escaping is involved.
+
+    The returned snippet opens a `tell application "Xcode"` block and defines
+    `workspaceDoc`. It does NOT close the `tell` block — callers append their
+    action statements and a final `end tell`.
+    """
+    return _OPEN_AND_WAIT_TEMPLATE.substitute(
+        path_decl=_ARGV_PATH_DECL,
+        scheme_decl=_ARGV_SCHEME_DECL if with_scheme else "",
+        scheme_setup=_SCHEME_SETUP if with_scheme else "",
+    )
 
-    The returned snippet starts with `set projectPath to ...`, opens a
-    `tell application "Xcode"` block, and defines `workspaceDoc`. It does NOT
-    close the `tell` block — callers append their action statements and a final
-    `end tell`.
 
-    Args:
-        escaped_path: Project path, already passed through escape_applescript_string.
-        escaped_scheme: Optional scheme name, already escaped. When provided,
-            the snippet also sets the active scheme on the workspace document.
+def open_and_wait_script_args(normalized_path: str, scheme: Optional[str] = None) -> List[str]:
+    """Return the run-handler arguments for build_open_and_wait_argv_applescript.
+
+    Pass `bool(scheme)` as its `with_scheme`, so the argument list and the
+    prologue agree on whether `item 2 of argv` is read.
     """
-    scheme_decl = f'set schemeName to "{escaped_scheme}"\n' if escaped_scheme else ""
-    scheme_setup = (
-        "    set active scheme of workspaceDoc to (first scheme of workspaceDoc whose name is schemeName)\n"
-        if escaped_scheme else ""
-    )
-    return (
-        f'set projectPath to "{escaped_path}"\n'
-        f'{scheme_decl}'
-        f'tell application "Xcode"\n'
-        f'    open projectPath\n'
-        f'    set workspaceDoc to first workspace document whose path is projectPath\n'
-        f'\n'
-        f'    repeat {WORKSPACE_LOAD_REPEATS} times\n'
-        f'        if loaded of workspaceDoc is true then exit repeat\n'
-        f'        delay 0.5\n'
-        f'    end repeat\n'
-        f'    if loaded of workspaceDoc is false then\n'
-        f'        error "Xcode workspace did not load in time."\n'
-        f'    end if\n'
-        f'\n'
-        f'{scheme_setup}'
-    )
+    if not scheme:
+        return [normalized_path]
+    return [normalized_path, scheme]
 
 
 def format_timeout_duration(seconds: int) -> str:
@@ -144,6 +247,21 @@ def format_timeout_duration(seconds: int) -> str:
     return f"{seconds} second" + ("" if seconds == 1 else "s")
 
 
+_WAIT_FOR_COMPLETION_TEMPLATE = Template(
+    '    set pollDelay to 0.05\n'
+    '    set actionStartDate to (current date)\n'
+    '    repeat\n'
+    '        if completed of $result_var is true then exit repeat\n'
+    '        if ((current date) - actionStartDate) >= $timeout_seconds then\n'
+    f'            error "$action_name timed out after $duration" number {ACTION_TIMEOUT_ERROR_NUMBER}\n'
+    '        end if\n'
+    '        delay pollDelay\n'
+    '        set pollDelay to pollDelay * 2\n'
+    f'        if pollDelay > {ACTION_POLL_MAX_DELAY} then set pollDelay to {ACTION_POLL_MAX_DELAY}\n'
+    '    end repeat\n'
+)
+
+
 def build_wait_for_completion_applescript(
     result_var: str = "actionResult",
     timeout_seconds: int = BUILD_TIMEOUT_SECONDS,
@@ -169,16 +287,11 @@ def build_wait_for_completion_applescript(
             "Tests") so the message matches the action the caller actually ran.
             Internal constant, not user input — interpolated unescaped.
     """
-    duration = format_timeout_duration(timeout_seconds)
-    return (
-        f'    set actionStartDate to (current date)\n'
-        f'    repeat\n'
-        f'        if completed of {result_var} is true then exit repeat\n'
-        f'        if ((current date) - actionStartDate) >= {timeout_seconds} then\n'
-        f'            error "{action_name} timed out after {duration}" number {ACTION_TIMEOUT_ERROR_NUMBER}\n'
-        f'        end if\n'
-        f'        delay 0.5\n'
-        f'    end repeat\n'
+    return _WAIT_FOR_COMPLETION_TEMPLATE.substitute(
+        result_var=result_var,
+        timeout_seconds=timeout_seconds,
+        action_name=action_name,
+        duration=format_timeout_duration(timeout_seconds),
     )
 
 
@@ -191,10 +304,31 @@ def is_action_timeout(applescript_output: str) -> bool:
     wording — which is action-specific ("Build"/"Clean"/"Tests timed out…") and
     could otherwise be reworded out from under callers.
     """
-    return f'({ACTION_TIMEOUT_ERROR_NUMBER})' in (applescript_output or "")
+    return has_error_number(applescript_output, ACTION_TIMEOUT_ERROR_NUMBER)
+
+
+def has_error_number(applescript_output: str, number: int) -> bool:
+    """Return True if `applescript_output` (osascript's stderr) reports an
+    error raised with `error ... number <number>`."""
+    return f'({number})' in (applescript_output or "")
 
 
-def build_action_completed_check_applescript(escaped_path: str, escaped_action_id: str) -> str:
+_ACTION_COMPLETED_CHECK_APPLESCRIPT = (
+    'on run argv\n'
+    + _ARGV_PATH_DECL
+    + 'set targetId to item 2 of argv\n'
+    'tell application "Xcode"\n'
+    '    set workspaceDoc to first workspace document whose path is projectPath\n'
+    '    repeat with r in scheme action results of workspaceDoc\n'
+    '        if ((id of r) as string) is targetId then return (completed of r) as string\n'
+    '    end repeat\n'
+    '    return "notfound"\n'
+    'end tell\n'
+    'end run\n'
+)
+
+
+def build_action_completed_check_applescript() -> str:
     """
     Return AppleScript that reports whether a specific scheme action result has
     completed.
@@ -205,21 +339,11 @@ def build_action_completed_check_applescript(escaped_path: str, escaped_action_i
     string "true"/"false" for the matched action, or "notfound" when no action
     result with that id exists on the workspace document.
 
-    Args:
-        escaped_path: Project path, already escaped.
-        escaped_action_id: The action result's id, already escaped.
+    The project path and action id are read from `argv` (pass them, unescaped,
+    as run_applescript's `args`), so the script text is fixed and a single
+    compiled .scpt serves every run.
     """
-    return (
-        f'set projectPath to "{escaped_path}"\n'
-        f'set targetId to "{escaped_action_id}"\n'
-        f'tell application "Xcode"\n'
-        f'    set workspaceDoc to first workspace document whose path is projectPath\n'
-        f'    repeat with r in scheme action results of workspaceDoc\n'
-        f'        if ((id of r) as string) is targetId then return (completed of r) as string\n'
-        f'    end repeat\n'
-        f'    return "notfound"\n'
-        f'end tell\n'
-    )
+    return _ACTION_COMPLETED_CHECK_APPLESCRIPT
 
 
 def resolve_build_timeout(timeout: Optional[int]) -> int:
@@ -259,7 +383,124 @@ def resolve_build_timeout(timeout: Optional[int]) -> int:
     return timeout
 
 
-def run_applescript(script: str, timeout: int = DEFAULT_APPLESCRIPT_TIMEOUT) -> Tuple[bool, str]:
+# Compiled .scpt files for scripts that are re-run verbatim (completion polls,
+# argv-driven tool scripts), keyed by a hash of their source. The directory is
+# shared by every server process, so files are never unlinked on LRU eviction —
+# another process may still be running them. Each file is compiled under a
+# private temp name and renamed into place, so a reader never sees a partial
+# .scpt, and files untouched for COMPILED_SCRIPT_MAX_AGE_SECONDS are pruned.
+COMPILED_SCRIPT_CACHE_MAX = 32
+COMPILED_SCRIPT_MAX_AGE_SECONDS = 7 * 24 * 60 * 60
+COMPILED_SCRIPT_PRUNE_INTERVAL_SECONDS = 60 * 60
+_COMPILED_SCRIPTS: "OrderedDict[str, str]" = OrderedDict()
+_COMPILED_SCRIPTS_LOCK = threading.Lock()
+_compiled_scripts_last_prune: Optional[float] = None
+
+
+def _prune_compiled_scripts() -> None:
+    """Remove .scpt files in COMPILED_SCRIPT_DIR that have not been used recently.
+
+    Runs at most once per COMPILED_SCRIPT_PRUNE_INTERVAL_SECONDS. A process
+    whose cached file is pruned out from under it recompiles on its next run
+    (see run_applescript), so pruning by age is safe across processes.
+    """
+    global _compiled_scripts_last_prune
+    now = time.monotonic()
+    with _COMPILED_SCRIPTS_LOCK:
+        if (_compiled_scripts_last_prune is not None
+                and now - _compiled_scripts_last_prune < COMPILED_SCRIPT_PRUNE_INTERVAL_SECONDS):
+            return
+        _compiled_scripts_last_prune = now
+
+    cutoff = time.time() - COMPILED_SCRIPT_MAX_AGE_SECONDS
+    try:
+        entries = list(os.scandir(COMPILED_SCRIPT_DIR))
+    except OSError:
+        return
+    for entry in entries:
+        # Also sweeps temp files left behind by a process killed mid-compile.
+        if not entry.name.endswith(".scpt"):
+            continue
+        try:
+            if entry.stat().st_mtime < cutoff:
+                os.unlink(entry.path)
+        except OSError:
+            pass
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+def _forget_compiled_script(path: str) -> None:
+    """Drop `path` from this process's cache without touching the file."""
+    with _COMPILED_SCRIPTS_LOCK:
+        for key, cached in list(_COMPILED_SCRIPTS.items()):
+            if cached == path:
+                del _COMPILED_SCRIPTS[key]
+
+
+def _compiled_script_path(script: str) -> Optional[str]:
+    """Return a .scpt compiled from `script`, compiling it on first use.
+
+    Returns None if osacompile fails, so the caller can fall back to running
+    the source text.
+    """
+    key = hashlib.blake2b(script.encode("utf-8"), digest_size=8).hexdigest()
+    with _COMPILED_SCRIPTS_LOCK:
+        path = _COMPILED_SCRIPTS.get(key)
+        if path is not None:
+            _COMPILED_SCRIPTS.move_to_end(key)
+            return path
+
+    path = os.path.join(COMPILED_SCRIPT_DIR, f"{key}.scpt")
+    if os.path.exists(path):
+        # Already compiled by another server process (files only appear via
+        # os.replace, so it is complete). Touch it so age pruning keeps it.
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+    else:
+        _prune_compiled_scripts()
+        # osacompile picks its output format from the extension, so the temp
+        # name keeps ".scpt"; a leftover one is swept by age pruning.
+        tmp_path = os.path.join(
+            COMPILED_SCRIPT_DIR, f"{key}.{os.getpid()}.{threading.get_ident()}.tmp.scpt"
+        )
+        try:
+            os.makedirs(COMPILED_SCRIPT_DIR, exist_ok=True)
+            result = subprocess.run(
+                [OSACOMPILE, '-o', tmp_path, '-e', script],
+                capture_output=True,
+                close_fds=False,
+                text=True,
+                timeout=DEFAULT_APPLESCRIPT_TIMEOUT,
+            )
+            if result.returncode == 0:
+                os.replace(tmp_path, path)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            print(f"warn: osacompile failed, running script source instead: {e}", file=sys.stderr)
+            _remove_quietly(tmp_path)
+            return None
+        if result.returncode != 0:
+            print(f"warn: osacompile failed, running script source instead: {result.stderr.strip()}", file=sys.stderr)
+            _remove_quietly(tmp_path)
+            return None
+
+    with _COMPILED_SCRIPTS_LOCK:
+        _COMPILED_SCRIPTS[key] = path
+        while len(_COMPILED_SCRIPTS) > COMPILED_SCRIPT_CACHE_MAX:
+            _COMPILED_SCRIPTS.popitem(last=False)
+    return path
+
+
+def run_applescript(script: str, timeout: int = DEFAULT_APPLESCRIPT_TIMEOUT,
+                    precompile: bool = False,
+                    args: Sequence[str] = ()) -> Tuple[bool, str]:
     """Run an AppleScript and return success status and output.
 
     Args:
@@ -270,6 +511,13 @@ def run_applescript(script: str, timeout: int = DEFAULT_APPLESCRIPT_TIMEOUT) ->
             poll loops up to BUILD_TIMEOUT_SECONDS) MUST pass an explicit
             longer value (typically `BUILD_TIMEOUT_SECONDS` plus a buffer for
             workspace load + IPC).
+        precompile: Compile the script once with osacompile and run the cached
+            .scpt on later calls, skipping AppleScript's parse/compile step.
+            Only worth it for scripts re-run with identical source (completion
+            polls, or tool scripts that take their inputs through `args`);
+            one-shot scripts would pay an extra process launch.
+        args: Arguments passed to the script's `on run argv` handler. Values
+            are passed as-is, so they need no AppleScript escaping.
 
     Returns:
         (success, output) tuple. On AppleScript failure, output is the
@@ -280,12 +528,31 @@ def run_applescript(script: str, timeout: int = DEFAULT_APPLESCRIPT_TIMEOUT) ->
     Raises:
         XCodeMCPError: If the osascript subprocess exceeds `timeout` seconds.
     """
+    # Deliberately out-of-process. An in-process NSAppleScript can't be killed
+    # when Xcode wedges (the `timeout` contract above), isn't safe off the main
+    # thread, and would add a PyObjC dependency; `precompile` already gives the
+    # compile-once win for the scripts that are run repeatedly.
+    compiled_path = _compiled_script_path(script) if precompile else None
+    success, output = _run_osascript(script, compiled_path, args, timeout)
+    if not success and compiled_path and not os.path.exists(compiled_path):
+        # The shared .scpt was pruned by another process; osascript failed to
+        # open it before running anything, so recompiling and retrying is safe.
+        _forget_compiled_script(compiled_path)
+        success, output = _run_osascript(script, _compiled_script_path(script), args, timeout)
+    return success, output
+
+
+def _run_osascript(script: str, compiled_path: Optional[str],
+                   args: Sequence[str], timeout: int) -> Tuple[bool, str]:
+    argv = [OSASCRIPT, compiled_path] if compiled_path else [OSASCRIPT, '-e', script]
+    argv.extend(args)
     try:
         result = subprocess.run(
-            ['osascript', '-e', script],
+            argv,
             capture_output=True,
             text=True,
             check=True,
+            close_fds=False,
             timeout=timeout,
         )
         return True, result.stdout.strip()
@@ -310,13 +577,7 @@ def show_notification(title: str, subtitle: str = None, message: str = None, sou
     """
     # Record in history (always, even if notifications are disabled)
     with _NOTIFICATION_HISTORY_LOCK:
-        NOTIFICATION_HISTORY.append({
-            'timestamp': datetime.datetime.now().isoformat(),
-            'title': title,
-            'subtitle': subtitle or '',
-            'message': message or '',
-            'sound': str(sound)
-        })
+        NOTIFICATION_HISTORY.append((time.time(), title, subtitle, message, sound))
 
     # Check global setting first
     if not NOTIFICATIONS_ENABLED:
@@ -354,11 +615,62 @@ def show_notification(title: str, subtitle: str = None, message: str = None, sou
     if sound:
         script += ' sound name "Frog"'
 
+    _enqueue_notification(script, title)
+
+
+def _enqueue_notification(script: str, title: str):
+    """Queue a `display notification` script for the background poster."""
+    global _notification_worker
+    with _NOTIFICATION_QUEUE_COND:
+        _NOTIFICATION_QUEUE.append((script, title))
+        if _notification_worker is None:
+            _notification_worker = threading.Thread(
+                target=_drain_notifications, name="notification-poster", daemon=True
+            )
+            _notification_worker.start()
+        _NOTIFICATION_QUEUE_COND.notify()
+
+
+def _drain_notifications():
+    """Post queued notifications in batches, for the life of the process."""
+    while True:
+        with _NOTIFICATION_QUEUE_COND:
+            while not _NOTIFICATION_QUEUE:
+                _NOTIFICATION_QUEUE_COND.wait()
+            pending = list(_NOTIFICATION_QUEUE)
+            _NOTIFICATION_QUEUE.clear()
+        now = time.monotonic()
+        fresh = []
+        for script, title in pending:
+            if now - _recently_posted.get(script, float('-inf')) < NOTIFICATION_DEDUPE_SECONDS:
+                continue
+            _recently_posted[script] = now
+            _recently_posted.move_to_end(script)
+            fresh.append((script, title))
+        while len(_recently_posted) > _NOTIFICATION_DEDUPE_MAX:
+            _recently_posted.popitem(last=False)
+        if not fresh:
+            continue
+        try:
+            _post_notification(
+                "\n".join(script for script, _title in fresh),
+                ", ".join(title for _script, title in fresh),
+            )
+        except Exception as e:
+            # Keep the poster alive; a dead worker would silently swallow
+            # every later notification.
+            print(f"Warning: notification dispatch failed: {e}", file=sys.stderr)
+
+
+def _post_notification(script: str, title: str):
+    """Run a script of one or more `display notification` statements, logging
+    (not raising) failures."""
     try:
         subprocess.run(
-            ['osascript', '-e', script],
+            [OSASCRIPT, '-e', script],
             capture_output=True,
             timeout=NOTIFICATION_TIMEOUT,
+            close_fds=False,
         )
     except subprocess.TimeoutExpired:
         print(
@@ -367,7 +679,7 @@ def show_notification(title: str, subtitle: str = None, message: str = None, sou
             file=sys.stderr,
         )
     except FileNotFoundError:
-        print("Warning: osascript not found on PATH; cannot show notification", file=sys.stderr)
+        print(f"Warning: {OSASCRIPT} not found; cannot show notification", file=sys.stderr)
     except subprocess.CalledProcessError as e:
         print(f"Warning: notification dispatch failed: {e}", file=sys.stderr)
 
@@ -429,9 +741,10 @@ def show_persistent_alert(title: str, message: str, button_text: str = "OK") ->
 
             # Run in background (non-blocking) and return the process
             return subprocess.Popen(
-                ['osascript', '-e', script],
+                [OSASCRIPT, '-e', script],
                 stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
+                stderr=subprocess.DEVNULL,
+                close_fds=False,
             )
         except OSError as e:
             print(f"Warning: Failed to spawn alert process: {e}", file=sys.stderr)
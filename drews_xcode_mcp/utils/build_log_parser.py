@@ -9,6 +9,7 @@ import re
 import plistlib
 import threading
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Set, Tuple, Optional
 
 # Seconds between the Unix epoch (1970-01-01) and the Cocoa/CFAbsoluteTime
@@ -35,6 +36,11 @@ _XCACTIVITYLOG_CACHE_MAX = 200
 _XCACTIVITYLOG_CACHE: "OrderedDict[Tuple[str, int, int], Tuple[List[Dict], Set[str]]]" = OrderedDict()
 _XCACTIVITYLOG_CACHE_LOCK = threading.Lock()
 
+# Worker cap for parsing several xcactivitylogs at once. gzip decompression and
+# file reads release the GIL, so uncached logs overlap their I/O and inflate
+# work; leave a couple of cores free for Xcode itself.
+_MAX_PARSE_WORKERS = max(1, (os.cpu_count() or 2) - 2)
+
 
 def _xcactivitylog_cache_key(log_path: str) -> Optional[Tuple[str, int, int]]:
     """Return a cache key for `log_path`, or None if the file isn't stat-able.
@@ -79,12 +85,11 @@ def parse_manifest_plist(manifest_path: str) -> List[Dict]:
             parsed (corrupted, mid-write, permission denied). Callers should
             surface this distinct from the empty case.
     """
-    if not os.path.exists(manifest_path):
-        return []
-
     try:
         with open(manifest_path, 'rb') as f:
             plist_data = plistlib.load(f)
+    except FileNotFoundError:
+        return []
     except (plistlib.InvalidFileException, OSError, ValueError) as e:
         print(f"Error parsing manifest plist {manifest_path}: {e}", file=sys.stderr)
         raise ManifestParseError(str(e)) from e
@@ -227,10 +232,21 @@ def parse_xcactivitylog(log_path: str) -> Tuple[List[Dict], Set[str]]:
         # catastrophic backtracking — measured at ~8s per file. Pre-splitting
         # on the actual separators and skipping lines that obviously can't
         # contain a match drops that to tens of milliseconds.
-        lines = text.replace('\n', '\r').split('\r')
+        #
+        # Each marker is first looked for once across the whole text, so a
+        # clean log (no warnings or errors) skips those per-line checks, and
+        # a log with no markers at all is never split.
+        has_warnings = ': warning:' in text
+        has_errors = ': error:' in text
+        has_swift_compiles = 'SwiftCompile normal ' in text
+        has_other_compiles = 'CompileC' in text or 'CompileObjC' in text or 'CompileMetalFile ' in text
+        if has_warnings or has_errors or has_swift_compiles or has_other_compiles:
+            lines = text.replace('\n', '\r').split('\r')
+        else:
+            lines = ()
 
         for raw_line in lines:
-            if ': warning:' in raw_line:
+            if has_warnings and ': warning:' in raw_line:
                 for match in warning_pattern.finditer(raw_line):
                     warnings.append({
                         'file': _strip_surrogates(match.group(1)),
@@ -239,7 +255,7 @@ def parse_xcactivitylog(log_path: str) -> Tuple[List[Dict], Set[str]]:
                         'message': _strip_surrogates(match.group(4).strip()),
                         'type': 'warning',
                     })
-            if ': error:' in raw_line:
+            if has_errors and ': error:' in raw_line:
                 for match in error_pattern.finditer(raw_line):
                     warnings.append({
                         'file': _strip_surrogates(match.group(1)),
@@ -248,16 +264,17 @@ def parse_xcactivitylog(log_path: str) -> Tuple[List[Dict], Set[str]]:
                         'message': _strip_surrogates(match.group(4).strip()),
                         'type': 'error',
                     })
-            if 'SwiftCompile normal ' in raw_line:
+            if has_swift_compiles and 'SwiftCompile normal ' in raw_line:
                 for match in swift_compile_pattern.finditer(raw_line):
                     compiled_files.add(_strip_surrogates(match.group(1)))
-            if 'CompileC ' in raw_line or 'CompileCpp ' in raw_line \
-                    or 'CompileObjC ' in raw_line or 'CompileObjCpp ' in raw_line:
-                for match in cc_compile_pattern.finditer(raw_line):
-                    compiled_files.add(_strip_surrogates(match.group(1)))
-            if 'CompileMetalFile ' in raw_line:
-                for match in metal_compile_pattern.finditer(raw_line):
-                    compiled_files.add(_strip_surrogates(match.group(1)))
+            if has_other_compiles:
+                if 'CompileC ' in raw_line or 'CompileCpp ' in raw_line \
+                        or 'CompileObjC ' in raw_line or 'CompileObjCpp ' in raw_line:
+                    for match in cc_compile_pattern.finditer(raw_line):
+                        compiled_files.add(_strip_surrogates(match.group(1)))
+                if 'CompileMetalFile ' in raw_line:
+                    for match in metal_compile_pattern.finditer(raw_line):
+                        compiled_files.add(_strip_surrogates(match.group(1)))
 
     except (OSError, gzip.BadGzipFile, EOFError) as e:
         print(f"Error parsing xcactivitylog {log_path}: {e}", file=sys.stderr)
@@ -277,6 +294,15 @@ def parse_xcactivitylog(log_path: str) -> Tuple[List[Dict], Set[str]]:
     return [dict(w) for w in warnings], set(compiled_files)
 
 
+def _parse_xcactivitylogs(log_paths: List[str]) -> List[Tuple[List[Dict], Set[str]]]:
+    """Run parse_xcactivitylog over `log_paths`, in parallel when there are
+    several, returning results in the same order."""
+    if len(log_paths) <= 1:
+        return [parse_xcactivitylog(path) for path in log_paths]
+    with ThreadPoolExecutor(max_workers=min(_MAX_PARSE_WORKERS, len(log_paths))) as executor:
+        return list(executor.map(parse_xcactivitylog, log_paths))
+
+
 def aggregate_warnings_since_clean(
     manifest_path: str,
     logs_dir: str,
@@ -365,11 +391,8 @@ def aggregate_warnings_since_clean(
         file=sys.stderr,
     )
 
-    # Parse each build's xcactivitylog file
-    all_warnings = []
-    file_last_compiled: Dict[str, float] = {}
-    builds_analyzed = []
-
+    # Locate each build's xcactivitylog file
+    builds_with_logs = []
     for build in builds_to_analyze:
         log_file = os.path.join(logs_dir, build['fileName'])
 
@@ -377,8 +400,16 @@ def aggregate_warnings_since_clean(
             print(f"Warning: Log file not found: {log_file}", file=sys.stderr)
             continue
 
-        warnings, compiled_files = parse_xcactivitylog(log_file)
+        builds_with_logs.append((build, log_file))
+
+    # Parse them concurrently; results come back in build order.
+    parsed_logs = _parse_xcactivitylogs([log_file for _, log_file in builds_with_logs])
+
+    all_warnings = []
+    file_last_compiled: Dict[str, float] = {}
+    builds_analyzed = []
 
+    for (build, _), (warnings, compiled_files) in zip(builds_with_logs, parsed_logs):
         # Track the latest build time each file was compiled in
         build_time = build['timeStartedRecording']
         for f in compiled_files:
@@ -561,31 +592,33 @@ def wait_for_new_build_uuid(
     while True:
         matching: List[Tuple[float, str]] = []
         try:
-            if os.path.exists(manifest_path):
-                with open(manifest_path, 'rb') as f:
-                    plist_data = plistlib.load(f)
+            with open(manifest_path, 'rb') as f:
+                plist_data = plistlib.load(f)
 
-                for log_uuid, entry in plist_data.get('logs', {}).items():
-                    if log_uuid in before_uuids:
-                        continue
-                    if not isinstance(entry, dict):
-                        continue
-
-                    title = entry.get('title', '')
-                    if not title.startswith('Build '):
-                        continue
+            for log_uuid, entry in plist_data.get('logs', {}).items():
+                if log_uuid in before_uuids:
+                    continue
+                if not isinstance(entry, dict):
+                    continue
 
-                    if scheme_name is not None:
-                        if entry.get('schemeIdentifier-schemeName') != scheme_name:
-                            continue
+                title = entry.get('title', '')
+                if not title.startswith('Build '):
+                    continue
 
-                    started = entry.get('timeStartedRecording', 0)
-                    if not isinstance(started, (int, float)):
-                        continue
-                    if started < effective_start_cf:
+                if scheme_name is not None:
+                    if entry.get('schemeIdentifier-schemeName') != scheme_name:
                         continue
 
-                    matching.append((started, log_uuid))
+                started = entry.get('timeStartedRecording', 0)
+                if not isinstance(started, (int, float)):
+                    continue
+                if started < effective_start_cf:
+                    continue
+
+                matching.append((started, log_uuid))
+        except FileNotFoundError:
+            # First build for this DerivedData: manifest not written yet.
+            pass
         except Exception as e:
             print(f"Warning: error polling manifest {manifest_path}: {e}", file=sys.stderr)
             matching = []
@@ -621,15 +654,17 @@ def get_scheme_name_for_uuid(manifest_path: str, target_uuid: str) -> Optional[s
     wait_for_new_build_uuid and need its scheme name for downstream
     aggregation filtering.
     """
-    if not os.path.exists(manifest_path):
-        return None
     try:
         with open(manifest_path, 'rb') as f:
             plist_data = plistlib.load(f)
-    except Exception as e:
+    except FileNotFoundError:
+        return None
+    except (plistlib.InvalidFileException, OSError, ValueError) as e:
         print(f"Warning: failed to read manifest {manifest_path}: {e}", file=sys.stderr)
         return None
 
+    if not isinstance(plist_data, dict):
+        return None
     entry = plist_data.get('logs', {}).get(target_uuid)
     if not isinstance(entry, dict):
         return None
@@ -660,11 +695,11 @@ def derived_data_matches_project(derived_data_path: str, project_realpath: str)
         the candidate).
     """
     info_plist = os.path.join(derived_data_path, "info.plist")
-    if not os.path.exists(info_plist):
-        return None
     try:
         with open(info_plist, 'rb') as f:
             info = plistlib.load(f)
+    except FileNotFoundError:
+        return None
     except (OSError, plistlib.InvalidFileException) as e:
         print(f"Warning: failed to read {info_plist}: {e}", file=sys.stderr)
         return None
@@ -766,12 +801,12 @@ def find_derived_data_for_project(project_path: str) -> Optional[str]:
             derived_data_path, "Logs", "Build", "LogStoreManifest.plist"
         )
         try:
-            if os.path.exists(manifest_path):
-                mtime = os.path.getmtime(manifest_path)
-            else:
-                mtime = os.path.getmtime(derived_data_path)
+            mtime = os.path.getmtime(manifest_path)
         except OSError:
-            mtime = 0.0
+            try:
+                mtime = os.path.getmtime(derived_data_path)
+            except OSError:
+                mtime = 0.0
         candidates.append((mtime, derived_data_path))
 
     if not candidates:
@@ -14,3 +14,5 @@ CACHE_ROOT = os.path.expanduser("~/Library/Caches/xcode-mcp-server")
 SCREENSHOT_DIR = os.path.join(CACHE_ROOT, "screenshots")
 LOG_DIR = os.path.join(CACHE_ROOT, "logs")
 DEBUG_DIR = os.path.join(CACHE_ROOT, "debug")
+COMPILED_SCRIPT_DIR = os.path.join(CACHE_ROOT, "scpt")
+SWIFT_HELPER_DIR = os.path.join(CACHE_ROOT, "bin")
@@ -12,15 +12,25 @@ def generate_xcode_id() -> str:
     return uuid.uuid4().hex[:24].upper()
 
 
+# ASCII characters dropped by sanitize_to_identifier: everything except
+# letters, digits, space, hyphen and underscore. Non-ASCII characters are
+# dropped before translation by encoding with errors='ignore'.
+_IDENTIFIER_DROP_TABLE = str.maketrans('', '', ''.join(
+    chr(c) for c in range(128)
+    if not (chr(c).isascii() and (chr(c).isalnum() or chr(c) in ' _-'))
+))
+_IDENTIFIER_SEPARATOR_RE = re.compile(r'[ _-]+')
+
+
 def sanitize_to_identifier(name: str) -> str:
     """
     Convert a project name to a valid Swift identifier.
     "My Cool App" -> "MyCoolApp", "hello-world" -> "helloworld"
     """
     # Remove anything that isn't alphanumeric or whitespace/hyphen/underscore
-    cleaned = re.sub(r'[^A-Za-z0-9 _-]', '', name)
+    cleaned = name.encode('ascii', 'ignore').decode('ascii').translate(_IDENTIFIER_DROP_TABLE)
     # Split on separators, capitalize each word, join
-    parts = re.split(r'[ _-]+', cleaned)
+    parts = _IDENTIFIER_SEPARATOR_RE.split(cleaned)
     result = parts[0] + ''.join(p.capitalize() for p in parts[1:])
     # Ensure starts with a letter
     if result and not result[0].isalpha():
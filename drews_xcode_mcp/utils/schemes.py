@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Cache of per-project scheme listings for get_project_schemes.
+
+Listing schemes costs an Xcode Apple Event round trip, and agents tend to ask
+for them before every build. Entries are keyed by normalized project path and
+record the project files' stat signature, so adding or removing a scheme (or
+editing the project) misses; the TTL bounds staleness of the "(active)" marker,
+which the user can change in Xcode without touching any file we stat. Tools
+that switch the active scheme call invalidate_project_schemes() afterwards.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+SCHEMES_CACHE_TTL_SECONDS = 30.0
+SCHEMES_CACHE_MAX = 32
+_SCHEMES_CACHE: "OrderedDict[str, Tuple[float, tuple, str]]" = OrderedDict()
+_SCHEMES_CACHE_LOCK = threading.Lock()
+
+
+def project_signature(normalized_path: str) -> Optional[tuple]:
+    """mtime_ns of the project's contents file and shared-schemes folder.
+
+    Returns None if the project can't be stat'ed, in which case the listing
+    should not be cached.
+    """
+    if normalized_path.endswith('.xcworkspace'):
+        contents = os.path.join(normalized_path, 'contents.xcworkspacedata')
+    else:
+        contents = os.path.join(normalized_path, 'project.pbxproj')
+    signature = []
+    for path in (normalized_path, contents,
+                 os.path.join(normalized_path, 'xcshareddata', 'xcschemes')):
+        try:
+            signature.append(os.stat(path).st_mtime_ns)
+        except FileNotFoundError:
+            signature.append(None)
+        except OSError:
+            return None
+    return tuple(signature)
+
+
+def get_cached_schemes(normalized_path: str, signature: tuple) -> Optional[str]:
+    """Return the cached listing if it is unexpired and `signature` still matches."""
+    with _SCHEMES_CACHE_LOCK:
+        cached = _SCHEMES_CACHE.get(normalized_path)
+        if cached is None:
+            return None
+        expires_at, cached_signature, output = cached
+        if cached_signature != signature or time.monotonic() >= expires_at:
+            del _SCHEMES_CACHE[normalized_path]
+            return None
+        _SCHEMES_CACHE.move_to_end(normalized_path)
+        return output
+
+
+def cache_schemes(normalized_path: str, signature: tuple, output: str):
+    """Record a fresh listing, evicting the least recently used entries."""
+    with _SCHEMES_CACHE_LOCK:
+        _SCHEMES_CACHE[normalized_path] = (
+            time.monotonic() + SCHEMES_CACHE_TTL_SECONDS, signature, output
+        )
+        _SCHEMES_CACHE.move_to_end(normalized_path)
+        while len(_SCHEMES_CACHE) > SCHEMES_CACHE_MAX:
+            _SCHEMES_CACHE.popitem(last=False)
+
+
+def invalidate_project_schemes(normalized_path: str):
+    """Drop the cached scheme listing for a project (e.g. after the active
+    scheme was switched)."""
+    with _SCHEMES_CACHE_LOCK:
+        _SCHEMES_CACHE.pop(normalized_path, None)
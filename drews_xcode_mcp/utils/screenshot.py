@@ -1,14 +1,28 @@
 #!/usr/bin/env python3
 """Screenshot and window management utilities"""
 
+import hashlib
+import json
 import os
+import re
 import subprocess
+import sys
 import tempfile
+import threading
 import time
-import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 from drews_xcode_mcp.exceptions import XCodeMCPError
-from drews_xcode_mcp.utils.paths import SCREENSHOT_DIR
+from drews_xcode_mcp.utils.paths import SCREENSHOT_DIR, SWIFT_HELPER_DIR
+
+# Optional: with pyobjc-framework-Quartz installed (the `quartz` extra), the
+# window list is read in-process instead of by spawning `swift`, which pays a
+# multi-second JIT compile per call.
+try:
+    import Quartz
+except ImportError:
+    Quartz = None
 
 # Screenshots are written to a per-user cache directory (see utils.paths) so
 # they are not world-readable like /tmp would be. Files older than the
@@ -16,35 +30,139 @@ from drews_xcode_mcp.utils.paths import SCREENSHOT_DIR
 # without an external cron.
 SCREENSHOT_RETENTION_SECONDS = 24 * 60 * 60
 
+# Per-command subprocess timeouts, sized to each tool's happy path rather than
+# one blanket value: `simctl list` answers in well under a second, so a hung
+# CoreSimulatorService should fail fast; `simctl io ... screenshot` may wait on
+# the simulator to render; the window-list helper normally runs as a cached
+# binary, but falls back to `swift <file>`, which pays a 1-3s JIT compile.
+# subprocess.run kills and reaps the child itself when these expire.
+SIMCTL_LIST_TIMEOUT = 3
+SIMCTL_SCREENSHOT_TIMEOUT = 15
+SCREENCAPTURE_TIMEOUT = 5
+SWIFT_SCRIPT_TIMEOUT = 8
+
+# Upper bound on concurrent screencapture processes for multi-window captures.
+# The screenshot tools already cap a request at 5 windows.
+MAX_PARALLEL_CAPTURES = 5
+
+# Device line from `simctl list devices booted`, e.g.
+# "iPad (A16) (D89C8520-3426-49B2-9CF5-09DCA506DC66) (Booted)"
+_BOOTED_DEVICE_RE = re.compile(r'(.+?)\s+\(([A-F0-9-]+)\)\s+\(Booted\)')
+
 
 def _prune_old_screenshots(directory: str, retention_seconds: int) -> None:
     """Delete .png files in `directory` older than `retention_seconds`."""
     cutoff = time.time() - retention_seconds
+    # scandir yields the stat alongside each entry (cached by the iterator), so
+    # pruning costs one directory read instead of a listdir plus a stat per file.
     try:
-        entries = os.listdir(directory)
+        entries = os.scandir(directory)
     except OSError:
         return
-    for name in entries:
-        if not name.endswith('.png'):
-            continue
-        path = os.path.join(directory, name)
-        try:
-            if os.path.getmtime(path) < cutoff:
-                os.unlink(path)
-        except OSError:
-            continue
+    with entries:
+        for entry in entries:
+            if not entry.name.endswith('.png'):
+                continue
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+            except OSError:
+                continue
 
 
-def get_screenshot_path(prefix: str) -> str:
+def get_screenshot_paths(prefix: str, count: int) -> List[str]:
     """
-    Return a unique path inside the screenshot cache directory.
+    Return `count` unique paths inside the screenshot cache directory.
 
     Ensures the directory exists and prunes screenshots older than
     SCREENSHOT_RETENTION_SECONDS so the cache does not grow without bound.
+    Multi-window captures ask for all their paths at once so the directory is
+    pruned once per batch rather than once per window.
     """
+    # Checked on every call: the cache directory can be removed while the
+    # server runs (e.g. by clearing ~/Library/Caches).
     os.makedirs(SCREENSHOT_DIR, exist_ok=True)
+    prune_old_screenshots()
+    return [new_screenshot_path(prefix) for _ in range(count)]
+
+
+def get_screenshot_path(prefix: str) -> str:
+    """Return a single unique screenshot path (see get_screenshot_paths)."""
+    return get_screenshot_paths(prefix, 1)[0]
+
+
+def new_screenshot_path(prefix: str) -> str:
+    """
+    Return a unique path inside the screenshot cache directory without
+    touching the filesystem.
+
+    For captures that may not happen (e.g. the window lookup can still fail):
+    the caller creates SCREENSHOT_DIR right before writing and calls
+    prune_old_screenshots() once the capture succeeded.
+    """
+    # 64 random bits per name is plenty for files pruned after a day, and
+    # os.urandom skips uuid4's object construction and formatting.
+    return os.path.join(SCREENSHOT_DIR, f"{prefix}_{os.urandom(8).hex()}.png")
+
+
+def prune_old_screenshots() -> None:
+    """Delete screenshots older than SCREENSHOT_RETENTION_SECONDS."""
     _prune_old_screenshots(SCREENSHOT_DIR, SCREENSHOT_RETENTION_SECONDS)
-    return os.path.join(SCREENSHOT_DIR, f"{prefix}_{uuid.uuid4()}.png")
+
+
+def run_capture_command(cmd: list, timeout: int) -> subprocess.CompletedProcess:
+    """
+    Run a screenshot-writing command (`screencapture`, `simctl io ... screenshot`).
+
+    These tools write the image straight to the path on their command line and
+    print nothing useful on stdout, so stdout goes to /dev/null instead of being
+    buffered and decoded in Python. Only stderr is captured, for error messages.
+
+    Both tools exit non-zero when the image could not be written, so callers
+    treat returncode == 0 as proof the file exists rather than stat'ing it.
+    """
+    return subprocess.run(
+        cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        timeout=timeout,
+    )
+
+
+def _capture_window(window_id: int, path: str) -> str:
+    """Screenshot one CGWindow to `path`; raises XCodeMCPError on failure."""
+    # -x disables the shutter sound
+    result = run_capture_command(
+        ['screencapture', '-x', '-l', str(window_id), path],
+        timeout=SCREENCAPTURE_TIMEOUT,
+    )
+    if result.returncode != 0:
+        raise XCodeMCPError(f"Failed to capture window {window_id}: {result.stderr}")
+    return path
+
+
+def capture_windows(window_ids: List[int], prefix: str) -> List[str]:
+    """
+    Screenshot each CGWindow ID in `window_ids` to its own PNG.
+
+    `screencapture -l` takes a single window per invocation (extra output paths
+    map to displays, not windows), so each window is its own process. Those
+    processes run concurrently: the threads just block in subprocess with the
+    GIL released, so wall time is roughly one capture instead of N.
+
+    Returns:
+        The screenshot paths, in the same order as `window_ids`.
+
+    Raises:
+        XCodeMCPError: If any capture fails.
+    """
+    paths = get_screenshot_paths(prefix, len(window_ids))
+    if len(window_ids) <= 1:
+        return [_capture_window(window_id, path) for window_id, path in zip(window_ids, paths)]
+    with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_CAPTURES, len(window_ids))) as executor:
+        # map preserves input order and re-raises a worker's exception here.
+        return list(executor.map(_capture_window, window_ids, paths))
 
 
 def _get_booted_simulators():
@@ -56,7 +174,7 @@ def _get_booted_simulators():
         ['xcrun', 'simctl', 'list', 'devices', 'booted'],
         capture_output=True,
         text=True,
-        timeout=10
+        timeout=SIMCTL_LIST_TIMEOUT
     )
 
     if result.returncode != 0:
@@ -74,8 +192,7 @@ def _get_booted_simulators():
         # Check for booted device lines
         elif '(Booted)' in line and current_os:
             # Parse device info from line like: "iPad (A16) (D89C8520-3426-49B2-9CF5-09DCA506DC66) (Booted)"
-            import re
-            match = re.match(r'(.+?)\s+\(([A-F0-9-]+)\)\s+\(Booted\)', line)
+            match = _BOOTED_DEVICE_RE.match(line)
             if match:
                 device_name = match.group(1).strip()
                 device_udid = match.group(2).strip()
@@ -88,25 +205,136 @@ def _get_booted_simulators():
     return booted_simulators
 
 
-def _get_all_windows():
+# Window enumeration is memoized briefly so a "list windows, then screenshot
+# some of them" sequence enumerates once. Short enough that a window opened or
+# closed between calls is picked up almost immediately.
+WINDOW_LIST_TTL_SECONDS = 1.0
+_window_list_cache = None  # (monotonic timestamp, _WindowSnapshot)
+_window_list_lock = threading.Lock()
+
+
+class _WindowSnapshot(NamedTuple):
+    """One enumeration, plus lookup indexes built alongside it."""
+    apps_with_windows: Dict[str, List[dict]]
+    by_id: Dict[int, Tuple[str, dict]]
+    # (lowercased app name, app name), for case-insensitive app search
+    apps_lower: List[Tuple[str, str]]
+    # (lowercased title, app name, window), for case-insensitive title search
+    titles_lower: List[Tuple[str, str, dict]]
+
+
+def _get_window_snapshot(force_refresh: bool = False) -> _WindowSnapshot:
+    """Return the (possibly cached) window enumeration; see _get_all_windows."""
+    global _window_list_cache
+    with _window_list_lock:
+        if not force_refresh and _window_list_cache is not None:
+            cached_at, cached = _window_list_cache
+            if time.monotonic() - cached_at < WINDOW_LIST_TTL_SECONDS:
+                return cached
+
+        try:
+            if Quartz is not None:
+                apps_with_windows = _get_all_windows_quartz()
+            else:
+                apps_with_windows = _get_all_windows_swift()
+        except XCodeMCPError:
+            _window_list_cache = None
+            raise
+
+        by_id = {}
+        apps_lower = []
+        titles_lower = []
+        for app_name, windows in apps_with_windows.items():
+            apps_lower.append((app_name.lower(), app_name))
+            for window in windows:
+                by_id.setdefault(window['id'], (app_name, window))
+                titles_lower.append((window['title'].lower(), app_name, window))
+        snapshot = _WindowSnapshot(apps_with_windows, by_id, apps_lower, titles_lower)
+        _window_list_cache = (time.monotonic(), snapshot)
+        return snapshot
+
+
+def _get_all_windows(force_refresh: bool = False):
     """
     Internal helper to get all windows grouped by app.
-    Returns a dict of {app_name: [window_info, ...]}
+    Returns a dict of {app_name: [window_info, ...]}, sorted by app name, where
+    window_info is {'id': int, 'pid': int, 'title': str}. Only on-screen,
+    normal-layer windows with a title are included.
+
+    Results younger than WINDOW_LIST_TTL_SECONDS are reused unless
+    `force_refresh` is set. Callers must not mutate the returned dict.
     """
-    # Use Swift to get window information via CoreGraphics
-    swift_code = '''
+    return _get_window_snapshot(force_refresh).apps_with_windows
+
+
+def _find_window_by_id(window_id: int) -> Optional[Tuple[str, dict]]:
+    """Return (app_name, window_info) for an on-screen window ID, or None."""
+    return _get_window_snapshot().by_id.get(window_id)
+
+
+def _find_windows_by_title(search_term: str) -> List[Tuple[str, dict]]:
+    """Return [(app_name, window_info), ...] whose title contains `search_term`
+    (case-insensitive), in enumeration order."""
+    search_term = search_term.lower()
+    return [
+        (app_name, window)
+        for title_lower, app_name, window in _get_window_snapshot().titles_lower
+        if search_term in title_lower
+    ]
+
+
+def _find_apps_by_name(search_term: str) -> Dict[str, List[dict]]:
+    """Return {app_name: [window_info, ...]} for apps whose name contains
+    `search_term` (case-insensitive)."""
+    search_term = search_term.lower()
+    snapshot = _get_window_snapshot()
+    return {
+        app_name: snapshot.apps_with_windows[app_name]
+        for app_lower, app_name in snapshot.apps_lower
+        if search_term in app_lower
+    }
+
+
+def _get_all_windows_quartz():
+    """In-process window enumeration via CGWindowListCopyWindowInfo."""
+    window_list = Quartz.CGWindowListCopyWindowInfo(
+        Quartz.kCGWindowListOptionOnScreenOnly | Quartz.kCGWindowListExcludeDesktopElements,
+        Quartz.kCGNullWindowID,
+    )
+    if window_list is None:
+        raise XCodeMCPError("Failed to get window list")
+
+    apps_with_windows = {}
+    for window in window_list:
+        title = window.get(Quartz.kCGWindowName) or ""
+        # Skip menu bar items and system UI (layer 0 is normal windows)
+        # Also skip windows without titles
+        if window.get(Quartz.kCGWindowLayer, 0) != 0 or not title:
+            continue
+        app_name = str(window.get(Quartz.kCGWindowOwnerName) or "Unknown")
+        apps_with_windows.setdefault(app_name, []).append({
+            'id': int(window.get(Quartz.kCGWindowNumber, 0)),
+            'pid': int(window.get(Quartz.kCGWindowOwnerPID, 0)),
+            'title': str(title),
+        })
+
+    return dict(sorted(apps_with_windows.items()))
+
+
+# CoreGraphics window enumerator for when PyObjC's Quartz is not installed.
+_WINDOW_LIST_SWIFT = '''
 import Cocoa
 import CoreGraphics
 
 // Get all on-screen windows
 let options: CGWindowListOption = [.optionOnScreenOnly, .excludeDesktopElements]
 guard let windowList = CGWindowListCopyWindowInfo(options, kCGNullWindowID) as? [[String: Any]] else {
-    print("ERROR: Failed to get window list")
+    fputs("Failed to get window list\\n", stderr)
     exit(1)
 }
 
 // Group windows by app and filter out system UI elements
-var appWindows: [String: [(id: Int, title: String, pid: Int)]] = [:]
+var appWindows: [String: [[String: Any]]] = [:]
 
 for window in windowList {
     let windowID = window[kCGWindowNumber as String] as? Int ?? 0
@@ -118,63 +346,177 @@ for window in windowList {
     // Skip menu bar items and system UI (layer 0 is normal windows)
     // Also skip windows without titles
     if windowLayer == 0 && !windowTitle.isEmpty {
-        if appWindows[appName] == nil {
-            appWindows[appName] = []
-        }
-        appWindows[appName]?.append((id: windowID, title: windowTitle, pid: ownerPID))
+        appWindows[appName, default: []].append(["id": windowID, "pid": ownerPID, "title": windowTitle])
     }
 }
 
-// Output as structured format for parsing
-for (app, windows) in appWindows.sorted(by: { $0.key < $1.key }) {
-    print("APP:\\(app)")
-    for window in windows {
-        print("WINDOW:\\(window.id)\\t\\(window.pid)\\t\\(window.title)")
-    }
-}
+// Output as JSON: {app_name: [{"id", "pid", "title"}, ...]}
+let data = try! JSONSerialization.data(withJSONObject: appWindows, options: [])
+FileHandle.standardOutput.write(data)
 '''
 
-    # TemporaryDirectory guarantees cleanup on normal exit, including
-    # exceptions raised inside the block.
-    with tempfile.TemporaryDirectory(prefix='xcode-mcp-swift-') as tmpdir:
-        temp_file = os.path.join(tmpdir, 'get_windows.swift')
-        with open(temp_file, 'w') as f:
-            f.write(swift_code)
+# Compiled once with swiftc and cached under CACHE_ROOT; the binary name carries
+# a hash of the source, so editing _WINDOW_LIST_SWIFT builds a fresh binary
+# instead of running a stale one (binaries from older hashes are removed when a
+# new one is built). The build runs on a background thread so no enumeration
+# waits on swiftc; until it lands, the source is interpreted with `swift`.
+SWIFTC_COMPILE_TIMEOUT = 120
+# After a failed build, wait this long before trying again, so a missing or
+# broken swiftc is not re-run on every enumeration but a transient failure
+# doesn't disable the compiled helper for the life of the process.
+SWIFTC_RETRY_SECONDS = 600
+_WINDOW_LIST_BINARY_PREFIX = "list_windows_"
+_window_list_binary = None
+_window_list_build_running = False
+_window_list_build_failed_at = None  # monotonic time of the last failed build
+_window_list_binary_lock = threading.Lock()
 
-        result = subprocess.run(
-            ['swift', temp_file],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
 
-        if result.returncode != 0:
-            raise XCodeMCPError(f"Failed to get window list: {result.stderr}")
+def _window_list_binary_name() -> str:
+    key = hashlib.blake2b(_WINDOW_LIST_SWIFT.encode('utf-8'), digest_size=8).hexdigest()
+    return f"{_WINDOW_LIST_BINARY_PREFIX}{key}"
 
-        output = result.stdout
 
-    # Check for error
-    if output.startswith("ERROR:"):
-        raise XCodeMCPError(output.replace("ERROR: ", ""))
+def _prune_stale_window_list_binaries(current_name: str) -> None:
+    """Remove helpers built from older sources, and temp files left behind by
+    a process that died mid-build."""
+    stale_tmp_cutoff = time.time() - 2 * SWIFTC_COMPILE_TIMEOUT
+    try:
+        entries = list(os.scandir(SWIFT_HELPER_DIR))
+    except OSError:
+        return
+    for entry in entries:
+        if not entry.name.startswith(_WINDOW_LIST_BINARY_PREFIX) or entry.name == current_name:
+            continue
+        try:
+            if entry.name.startswith(current_name) and entry.stat().st_mtime >= stale_tmp_cutoff:
+                continue  # another process's build in progress
+            os.unlink(entry.path)
+        except OSError:
+            pass
 
-    # Parse the output
-    apps_with_windows = {}
-    current_app = None
-
-    for line in output.strip().split('\n'):
-        if line.startswith('APP:'):
-            current_app = line[4:]
-            apps_with_windows[current_app] = []
-        elif line.startswith('WINDOW:') and current_app:
-            parts = line[7:].split('\t', 2)
-            if len(parts) >= 3:
-                window_id = int(parts[0])
-                pid = parts[1]
-                title = parts[2]
-                apps_with_windows[current_app].append({
-                    'id': window_id,
-                    'pid': pid,
-                    'title': title
-                })
 
-    return apps_with_windows
+def _build_window_list_binary(binary: str) -> None:
+    """Compile the window-list helper to `binary` (background thread body)."""
+    global _window_list_binary, _window_list_build_running, _window_list_build_failed_at
+    # Build beside the final path (same filesystem) and rename into place, so a
+    # concurrent server process never execs a half-written file.
+    built = f"{binary}.{os.getpid()}.tmp"
+    error = None
+    try:
+        os.makedirs(SWIFT_HELPER_DIR, exist_ok=True)
+        _prune_stale_window_list_binaries(os.path.basename(binary))
+        with tempfile.TemporaryDirectory(prefix='xcode-mcp-swift-') as tmpdir:
+            source = os.path.join(tmpdir, 'list_windows.swift')
+            with open(source, 'w') as f:
+                f.write(_WINDOW_LIST_SWIFT)
+            result = subprocess.run(
+                ['swiftc', '-O', '-o', built, source],
+                capture_output=True,
+                text=True,
+                timeout=SWIFTC_COMPILE_TIMEOUT
+            )
+        if result.returncode == 0:
+            os.replace(built, binary)
+        else:
+            error = result.stderr.strip()
+    except (OSError, subprocess.TimeoutExpired) as e:
+        error = e
+
+    if error is not None:
+        try:
+            os.unlink(built)
+        except OSError:
+            pass
+        print(f"warn: swiftc failed, interpreting window helper instead: {error}", file=sys.stderr)
+    with _window_list_binary_lock:
+        _window_list_build_running = False
+        if error is None:
+            _window_list_binary = binary
+        else:
+            _window_list_build_failed_at = time.monotonic()
+
+
+def _window_list_binary_path() -> Optional[str]:
+    """Return the compiled window-list helper, or None if it isn't ready.
+
+    Never blocks on swiftc: a missing binary is built on a background thread
+    (unless a build is already running or failed within SWIFTC_RETRY_SECONDS),
+    and callers interpret the source with `swift` in the meantime.
+    """
+    global _window_list_binary, _window_list_build_running
+    with _window_list_binary_lock:
+        if _window_list_binary is not None:
+            return _window_list_binary
+        if _window_list_build_running:
+            return None
+
+        binary = os.path.join(SWIFT_HELPER_DIR, _window_list_binary_name())
+        if os.path.exists(binary):
+            _window_list_binary = binary
+            return binary
+        if (_window_list_build_failed_at is not None
+                and time.monotonic() - _window_list_build_failed_at < SWIFTC_RETRY_SECONDS):
+            return None
+        _window_list_build_running = True
+
+    threading.Thread(
+        target=_build_window_list_binary, args=(binary,),
+        name='xcode-mcp-swiftc', daemon=True,
+    ).start()
+    return None
+
+
+def _forget_window_list_binary(binary: str) -> None:
+    """Stop using `binary` (e.g. another process pruned it); it is rebuilt on
+    a later enumeration."""
+    global _window_list_binary
+    with _window_list_binary_lock:
+        if _window_list_binary == binary:
+            _window_list_binary = None
+
+
+def _run_window_list_swift() -> str:
+    """Run the window-list helper and return its stdout."""
+    binary = _window_list_binary_path()
+    result = None
+    if binary is not None:
+        try:
+            result = subprocess.run(
+                [binary],
+                capture_output=True,
+                text=True,
+                timeout=SWIFT_SCRIPT_TIMEOUT
+            )
+        except OSError as e:
+            print(f"warn: window helper {binary} failed to start, interpreting instead: {e}", file=sys.stderr)
+            _forget_window_list_binary(binary)
+    if result is None:
+        # TemporaryDirectory guarantees cleanup on normal exit, including
+        # exceptions raised inside the block.
+        with tempfile.TemporaryDirectory(prefix='xcode-mcp-swift-') as tmpdir:
+            temp_file = os.path.join(tmpdir, 'get_windows.swift')
+            with open(temp_file, 'w') as f:
+                f.write(_WINDOW_LIST_SWIFT)
+
+            result = subprocess.run(
+                ['swift', temp_file],
+                capture_output=True,
+                text=True,
+                timeout=SWIFT_SCRIPT_TIMEOUT
+            )
+
+    if result.returncode != 0:
+        raise XCodeMCPError(f"Failed to get window list: {result.stderr}")
+    return result.stdout
+
+
+def _get_all_windows_swift():
+    """Window enumeration by running a CoreGraphics Swift helper."""
+    output = _run_window_list_swift()
+    try:
+        apps_with_windows = json.loads(output)
+    except ValueError as e:
+        raise XCodeMCPError(f"Failed to parse window list: {e}")
+    # Swift dictionaries are unordered; sort by app name like the Quartz path.
+    return dict(sorted(apps_with_windows.items()))
@@ -13,8 +13,10 @@ import os
 import re
 import subprocess
 import sys
+import threading
 import time
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 
 
 def project_flag_for(project_path: str) -> str:
@@ -102,6 +104,11 @@ def get_first_scheme(project_path: str) -> Optional[str]:
     return None
 
 
+# One `key:value` field of a -showdestinations line; the value runs until the
+# next ", key:" or the end of the line.
+_DESTINATION_FIELD_RE = re.compile(r'(\w+):(.+?)(?=, \w+:|$)')
+
+
 def parse_destination_line(line: str) -> Optional[Dict]:
     """
     Parse a single `xcodebuild -showdestinations` destination line.
@@ -122,8 +129,7 @@ def parse_destination_line(line: str) -> Optional[Dict]:
 
     # Parse key:value pairs — keys are simple words, values run until next ", key:" or end
     result = {}
-    pattern = r'(\w+):(.+?)(?=, \w+:|$)'
-    for match in re.finditer(pattern, inner):
+    for match in _DESTINATION_FIELD_RE.finditer(inner):
         key = match.group(1).strip()
         value = match.group(2).strip()
         result[key] = value
@@ -176,17 +182,53 @@ def find_xcuserstate(project_path: str) -> str:
     return max(matches, key=os.path.getmtime)
 
 
+# Decoded xcuserstate destinations keyed by (path, mtime_ns, size). Xcode
+# rewrites the file whenever the destination changes, so an unchanged stat means
+# the seconds-long `swift` decode would return the same answer.
+_DESTINATIONS_CACHE_MAX = 32
+_DESTINATIONS_CACHE: "OrderedDict[Tuple[str, int, int], Dict]" = OrderedDict()
+_DESTINATIONS_CACHE_LOCK = threading.Lock()
+
+
 def decode_active_destinations(xcuserstate_path: str) -> Dict:
     """Run the Swift decoder to extract the active destination per scheme.
 
     Returns a dict like {"SchemeName": "UDID_platform_arch"}, or an empty dict
     on any failure (missing script, swift not found, timeout, bad output).
+    Successful decodes are cached until the xcuserstate file changes.
     """
+    try:
+        st = os.stat(xcuserstate_path)
+        cache_key = (xcuserstate_path, st.st_mtime_ns, st.st_size)
+    except OSError:
+        cache_key = None
+    if cache_key is not None:
+        with _DESTINATIONS_CACHE_LOCK:
+            cached = _DESTINATIONS_CACHE.get(cache_key)
+            if cached is not None:
+                _DESTINATIONS_CACHE.move_to_end(cache_key)
+                return dict(cached)
+
+    destinations = _run_destination_decoder(xcuserstate_path)
+    if not isinstance(destinations, dict):
+        return {}
+
+    if cache_key is not None:
+        with _DESTINATIONS_CACHE_LOCK:
+            _DESTINATIONS_CACHE[cache_key] = destinations
+            _DESTINATIONS_CACHE.move_to_end(cache_key)
+            while len(_DESTINATIONS_CACHE) > _DESTINATIONS_CACHE_MAX:
+                _DESTINATIONS_CACHE.popitem(last=False)
+    return dict(destinations)
+
+
+def _run_destination_decoder(xcuserstate_path: str) -> Optional[Dict]:
+    """Uncached body of decode_active_destinations; None on failure."""
     swift_script = os.path.join(os.path.dirname(os.path.abspath(__file__)),
                                 'decode_active_destination.swift')
     if not os.path.exists(swift_script):
         print(f"warn: helper script not found: {swift_script}", file=sys.stderr)
-        return {}
+        return None
 
     try:
         result = subprocess.run(
@@ -195,10 +237,10 @@ def decode_active_destinations(xcuserstate_path: str) -> Dict:
         )
     except subprocess.TimeoutExpired:
         print("warn: decode_active_destination.swift timed out", file=sys.stderr)
-        return {}
+        return None
     except FileNotFoundError:
         print("warn: `swift` binary not found on PATH", file=sys.stderr)
-        return {}
+        return None
 
     if result.returncode != 0:
         print(
@@ -206,7 +248,7 @@ def decode_active_destinations(xcuserstate_path: str) -> Dict:
             f"{result.stderr.strip()}",
             file=sys.stderr,
         )
-        return {}
+        return None
 
     if not result.stdout.strip():
         return {}
@@ -215,7 +257,7 @@ def decode_active_destinations(xcuserstate_path: str) -> Dict:
         return json.loads(result.stdout.strip())
     except json.JSONDecodeError as e:
         print(f"warn: decode_active_destination.swift produced invalid JSON: {e}", file=sys.stderr)
-        return {}
+        return None
 
 
 def resolve_active_destination_id(project_path: str, scheme: Optional[str] = None) -> Optional[str]:
@@ -1,19 +1,34 @@
 #!/usr/bin/env python3
 """xcresult and build log utilities"""
 
+import bisect
+import functools
 import os
 import sys
 import subprocess
 import json
 import re
+import select
 import time
 import datetime
-from typing import Optional, Tuple
+import io
+import threading
+from collections import OrderedDict, deque
+from typing import Optional, Pattern, Tuple, Union
 
 from drews_xcode_mcp.exceptions import InvalidParameterError
 from drews_xcode_mcp.utils.paths import LOG_DIR
 from drews_xcode_mcp.utils.build_log_parser import select_derived_data_dirs_for_project
 
+# Optional: with orjson installed (the `fastjson` extra), the multi-MB
+# xcresulttool dumps are parsed in C several times faster. orjson.JSONDecodeError
+# subclasses json.JSONDecodeError, so the existing error handling still applies.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Global build warning settings - initialized by CLI.
 # These are set once during startup and then read by every concurrent build
 # tool invocation. We use a one-way latch (`_BUILD_WARNINGS_LOCKED`) to make
@@ -24,6 +39,44 @@ BUILD_WARNINGS_ENABLED = True
 BUILD_WARNINGS_FORCED = None  # True if forced on, False if forced off, None if not forced
 _BUILD_WARNINGS_LOCKED = False
 
+# Verbose stderr tracing, read once at import (set XCODE_MCP_DEBUG=1).
+_DEBUG = bool(os.environ.get('XCODE_MCP_DEBUG'))
+
+# Compiler errors/warnings in Xcode diagnostic format:
+# - file:line:column: error: message (typical compiler output)
+# - ^error: at start of line (standalone errors like linker errors)
+# - path: error: message (project-level errors like missing packages, signing)
+# The leading \s+ in the third alternative avoids false positives from
+# Objective-C method signatures like "error:(NSError**)error".
+# Compiled once here; build_project reuses them to re-split its results.
+ERROR_LINE_PATTERN = re.compile(r'(:\d+:\d+: error:)|(^error\s*:)|(:\s+error:)', re.IGNORECASE | re.MULTILINE)
+WARNING_LINE_PATTERN = re.compile(r'(:\d+:\d+: warning:)|(^warning\s*:)|(:\s+warning:)', re.IGNORECASE | re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=1)
+def _xcresulttool_command() -> Tuple[str, ...]:
+    """Return the argv prefix for invoking xcresulttool.
+
+    `xcrun` does an SDK/toolchain lookup on every launch before it execs the
+    tool, so the absolute path is resolved once and reused. Falls back to
+    going through xcrun if the lookup fails. Absolute paths (with
+    close_fds=False at the call sites) also let CPython posix_spawn the tool
+    instead of fork+exec.
+    """
+    try:
+        result = subprocess.run(
+            ['/usr/bin/xcrun', '--find', 'xcresulttool'],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return ('/usr/bin/xcrun', 'xcresulttool')
+    tool_path = result.stdout.strip()
+    if result.returncode != 0 or not os.path.isfile(tool_path):
+        return ('/usr/bin/xcrun', 'xcresulttool')
+    return (tool_path,)
+
 
 def set_build_warnings_enabled(enabled: bool, forced: bool = False):
     """Set the global build warnings setting.
@@ -50,43 +103,54 @@ def freeze_build_warnings_settings():
 
 
 def extract_console_logs_from_xcresult(xcresult_path: str,
-                                      regex_filter: Optional[str] = None,
+                                      regex_filter: Union[str, Pattern, None] = None,
                                       max_lines: int = 20) -> Tuple[bool, str]:
     """
     Extract console logs from xcresult bundle and return structured JSON.
 
     Args:
         xcresult_path: Path to the .xcresult file
-        regex_filter: Optional regex pattern to find matching lines
+        regex_filter: Optional regex (pattern string or compiled) to find
+            matching lines
         max_lines: Maximum matching lines to return (default 20)
 
     Returns:
         Tuple of (success, json_output_or_error_message)
     """
-    # The xcresult file may still be finalizing, so retry a few times
-    max_retries = 7
-    retry_delay = 1
+    # The xcresult file may still be finalizing, so retry a few times. The
+    # bundle is usually complete by the time the caller finds it, so back off
+    # exponentially from a short first delay rather than sleeping a fixed
+    # second per attempt; the total budget (~6s) matches the old schedule.
+    retry_delays = (0.1, 0.2, 0.4, 0.8, 1.6, 3.2)
+    max_retries = len(retry_delays) + 1
 
     for attempt in range(max_retries):
         try:
             if attempt > 0:
+                retry_delay = retry_delays[attempt - 1]
                 print(f"Retry attempt {attempt + 1}/{max_retries} after {retry_delay}s delay...", file=sys.stderr)
                 time.sleep(retry_delay)
 
+            # Console logs for a chatty app run to many MB of JSON. Keep stdout
+            # as bytes (both JSON parsers accept them directly) instead of paying a
+            # text-mode decode + newline-translation pass over the whole dump;
+            # only the small stderr is decoded, and only on failure.
             result = subprocess.run(
-                ['xcrun', 'xcresulttool', 'get', 'log',
+                [*_xcresulttool_command(), 'get', 'log',
                  '--path', xcresult_path,
                  '--type', 'console'],
-                capture_output=True,
-                text=True,
-                timeout=30
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                timeout=30,
+                close_fds=False
             )
 
             if result.returncode != 0:
-                if "root ID is missing" in result.stderr and attempt < max_retries - 1:
-                    print(f"xcresult not ready yet: {result.stderr.strip()}", file=sys.stderr)
+                stderr_text = result.stderr.decode('utf-8', errors='replace')
+                if "root ID is missing" in stderr_text and attempt < max_retries - 1:
+                    print(f"xcresult not ready yet: {stderr_text.strip()}", file=sys.stderr)
                     continue
-                return False, f"Failed to extract console logs: {result.stderr}"
+                return False, f"Failed to extract console logs: {stderr_text}"
 
             # Success - break out of retry loop
             break
@@ -102,7 +166,7 @@ def extract_console_logs_from_xcresult(xcresult_path: str,
 
     # Parse the JSON output
     try:
-        log_data = json.loads(result.stdout)
+        log_data = _json_loads(result.stdout)
 
         # Extract ALL log entries (no filtering at this stage)
         all_logs = []
@@ -144,7 +208,7 @@ def extract_console_logs_from_xcresult(xcresult_path: str,
 
 
 def _format_structured_logs(all_logs: list, xcresult_path: str,
-                           regex_filter: Optional[str], max_lines: int) -> str:
+                           regex_filter: Union[str, Pattern, None], max_lines: int) -> str:
     """
     Format structured logs into JSON with priority-based selection and write full unfiltered log file.
 
@@ -159,7 +223,8 @@ def _format_structured_logs(all_logs: list, xcresult_path: str,
     Args:
         all_logs: Complete list of all log entries (unfiltered)
         xcresult_path: Path to xcresult bundle (used for temp file naming)
-        regex_filter: Optional regex to find matching lines
+        regex_filter: Optional regex (pattern string or compiled) to find
+            matching lines
         max_lines: Maximum matching lines to include in response
 
     Returns:
@@ -206,38 +271,50 @@ def _format_structured_logs(all_logs: list, xcresult_path: str,
     # Find matching lines if regex_filter is provided
     matching_lines = []
     total_matching = 0
-    if regex_filter and regex_filter.strip():
+    filter_pattern = None
+    if isinstance(regex_filter, re.Pattern):
+        filter_pattern = regex_filter
+    elif regex_filter and regex_filter.strip():
         try:
-            for log in all_logs:
-                if re.search(regex_filter, log['content']):
-                    total_matching += 1
-                    if len(matching_lines) < max_lines:
-                        matching_lines.append({
-                            'line': log['line'],
-                            'content': log['content'],
-                            'kind': log['kind'],
-                            'subsystem': log.get('subsystem'),
-                            'category': log.get('category')
-                        })
-            summary['matching_lines'] = total_matching
+            filter_pattern = re.compile(regex_filter)
         except re.error as e:
             raise InvalidParameterError(f"Invalid regex pattern: {e}")
+    if filter_pattern is not None:
+        for log in all_logs:
+            if filter_pattern.search(log['content']):
+                total_matching += 1
+                if len(matching_lines) < max_lines:
+                    matching_lines.append({
+                        'line': log['line'],
+                        'content': log['content'],
+                        'kind': log['kind'],
+                        'subsystem': log.get('subsystem'),
+                        'category': log.get('category')
+                    })
+        summary['matching_lines'] = total_matching
+
+    # all_logs is in ascending 'line' order (numbered while parsing), so each
+    # context window is located by bisection instead of rescanning every log
+    # entry once per selected error/warning.
+    log_line_numbers = [log['line'] for log in all_logs]
 
     # Helper function to get context lines from ALL logs (unfiltered)
-    def get_context(log_list, target_log, lines_before, lines_after):
+    def get_context(target_log, lines_before, lines_after):
         """Get context lines around a target log entry."""
         target_line = target_log['line']
         context_before = []
         context_after = []
 
-        for log in log_list:
+        start = bisect.bisect_left(log_line_numbers, target_line - lines_before)
+        end = bisect.bisect_right(log_line_numbers, target_line + lines_after)
+        for log in all_logs[start:end]:
             line_num = log['line']
-            if target_line - lines_before <= line_num < target_line:
+            if line_num < target_line:
                 context_before.append({
                     'line': line_num,
                     'content': log['content']
                 })
-            elif target_line < line_num <= target_line + lines_after:
+            elif line_num > target_line:
                 context_after.append({
                     'line': line_num,
                     'content': log['content']
@@ -250,7 +327,7 @@ def _format_structured_logs(all_logs: list, xcresult_path: str,
     if errors_and_faults:
         # First 2 errors (3 before, 2 after)
         for err in errors_and_faults[:2]:
-            before, after = get_context(all_logs, err, 3, 2)
+            before, after = get_context(err, 3, 2)
             selected_errors.append({
                 'line': err['line'],
                 'content': err['content'],
@@ -264,7 +341,7 @@ def _format_structured_logs(all_logs: list, xcresult_path: str,
         # Last 3 errors (5 before, 4 after) - avoid duplicates if < 8 total
         if len(errors_and_faults) > 5:
             for err in errors_and_faults[-3:]:
-                before, after = get_context(all_logs, err, 5, 4)
+                before, after = get_context(err, 5, 4)
                 selected_errors.append({
                     'line': err['line'],
                     'content': err['content'],
@@ -277,7 +354,7 @@ def _format_structured_logs(all_logs: list, xcresult_path: str,
         elif len(errors_and_faults) > 2:
             # If 3-5 total, just add the remaining ones with context
             for err in errors_and_faults[2:]:
-                before, after = get_context(all_logs, err, 5, 4)
+                before, after = get_context(err, 5, 4)
                 selected_errors.append({
                     'line': err['line'],
                     'content': err['content'],
@@ -291,7 +368,7 @@ def _format_structured_logs(all_logs: list, xcresult_path: str,
     # Select warnings with context (from ALL unfiltered logs)
     selected_warnings = []
     for warn in warnings[:2]:
-        before, after = get_context(all_logs, warn, 2, 1)
+        before, after = get_context(warn, 2, 1)
         selected_warnings.append({
             'line': warn['line'],
             'content': warn['content'],
@@ -340,7 +417,7 @@ def _format_structured_logs(all_logs: list, xcresult_path: str,
 
 def extract_build_errors_and_warnings(build_log: str,
                                      include_warnings: Optional[bool] = None,
-                                     regex_filter: Optional[str] = None,
+                                     regex_filter: Union[str, Pattern, None] = None,
                                      max_lines: int = 25,
                                      build_status: Optional[str] = None) -> str:
     """
@@ -364,7 +441,8 @@ def extract_build_errors_and_warnings(build_log: str,
         build_log: The raw build log output from Xcode
         include_warnings: Include warnings in output. If not provided, uses global setting.
                          Note: Command-line flags override this parameter if set.
-        regex_filter: Optional regex to further filter error/warning lines
+        regex_filter: Optional regex (pattern string or compiled) to further
+                     filter error/warning lines
         max_lines: Maximum number of error/warning lines to include (default 25)
         build_status: The status string from Xcode's scheme action result
                      (e.g. "succeeded", "failed", "error occurred").
@@ -399,20 +477,70 @@ def extract_build_errors_and_warnings(build_log: str,
     # Write complete UNFILTERED build log to a per-user cache directory.
     os.makedirs(LOG_DIR, exist_ok=True)
 
-    build_hash = hashlib.md5(build_log.encode()).hexdigest()[:8]
+    # Encode the (possibly multi-MB) log once and reuse the bytes for both the
+    # hash and the file, instead of encoding it again through a text-mode write.
+    build_log_bytes = build_log.encode()
+    build_hash = hashlib.md5(build_log_bytes).hexdigest()[:8]
     temp_log_path = os.path.join(LOG_DIR, f"build-{build_hash}.txt")
 
     try:
-        with open(temp_log_path, 'w') as f:
-            f.write(build_log)
+        with open(temp_log_path, 'wb') as f:
+            f.write(build_log_bytes)
     except Exception as e:
         print(f"Warning: Failed to write full log to {temp_log_path}: {e}", file=sys.stderr)
         temp_log_path = None
 
-    output_lines = build_log.split("\n")
+    filter_pattern = None
+    if isinstance(regex_filter, re.Pattern):
+        filter_pattern = regex_filter
+    elif regex_filter and regex_filter.strip():
+        try:
+            filter_pattern = re.compile(regex_filter)
+        except re.error as e:
+            raise InvalidParameterError(f"Invalid regex pattern: {e}")
+
+    # Only the first max_lines matching lines of each kind can be displayed,
+    # so the lists stop growing there; the counters keep the totals (before
+    # and after regex_filter) that the summary reports.
+    error_lines = []
+    warning_lines = []
+    total_errors = 0
+    total_warnings = 0
+    matched_errors = 0
+    matched_warnings = 0
+    log_says_failed = False
+    # Last max_lines non-blank lines, shown when the build failed without any
+    # recognizable error lines.
+    log_tail = deque(maxlen=max_lines)
+
+    # Single streamed pass over the log: no list of every line is built, and
+    # the "Build failed" check, the diagnostic scan and the tail share it.
+    for line in io.StringIO(build_log):
+        line = line.rstrip('\n')
+        stripped = line.strip()
+        if not stripped:
+            continue
+        log_tail.append(line)
+        # Every alternative in both diagnostic patterns requires a ':', so
+        # lines without one (most command and progress lines) skip the regex.
+        if ':' not in line:
+            if stripped.lower() == "build failed":
+                log_says_failed = True
+            continue
+        if ERROR_LINE_PATTERN.search(line):
+            total_errors += 1
+            if filter_pattern is None or filter_pattern.search(line):
+                matched_errors += 1
+                if len(error_lines) < max_lines:
+                    error_lines.append(line)
+        elif show_warnings and WARNING_LINE_PATTERN.search(line):
+            total_warnings += 1
+            if filter_pattern is None or filter_pattern.search(line):
+                matched_warnings += 1
+                if len(warning_lines) < max_lines:
+                    warning_lines.append(line)
 
     # Determine build outcome from Xcode's status property when available
-    log_says_failed = any(line.strip().lower() == "build failed" for line in output_lines)
     if build_status is not None:
         build_failed = build_status.lower() not in ("succeeded",)
         # Safety net: if the log explicitly says "Build failed" but AppleScript
@@ -422,44 +550,12 @@ def extract_build_errors_and_warnings(build_log: str,
     else:
         build_failed = log_says_failed
 
-    error_lines = []
-    warning_lines = []
-
-    # Pattern for compiler errors/warnings in Xcode diagnostic format:
-    # - file:line:column: error: message (typical compiler output)
-    # - ^error: at start of line (standalone errors like linker errors)
-    # - path: error: message (project-level errors like missing packages, signing)
-    # The leading \s+ in the third alternative avoids false positives from
-    # Objective-C method signatures like "error:(NSError**)error"
-    error_pattern = re.compile(r'(:\d+:\d+: error:)|(^error\s*:)|(:\s+error:)', re.IGNORECASE | re.MULTILINE)
-    warning_pattern = re.compile(r'(:\d+:\d+: warning:)|(^warning\s*:)|(:\s+warning:)', re.IGNORECASE | re.MULTILINE)
-
-    # Single iteration through output lines to extract errors/warnings
-    for line in output_lines:
-        if error_pattern.search(line):
-            error_lines.append(line)
-        elif show_warnings and warning_pattern.search(line):
-            warning_lines.append(line)
-
-    # Store total counts before filtering
-    total_errors = len(error_lines)
-    total_warnings = len(warning_lines)
-
-    # Apply regex filter if provided
-    if regex_filter and regex_filter.strip():
-        try:
-            filter_pattern = re.compile(regex_filter)
-            error_lines = [line for line in error_lines if filter_pattern.search(line)]
-            warning_lines = [line for line in warning_lines if filter_pattern.search(line)]
-        except re.error as e:
-            raise InvalidParameterError(f"Invalid regex pattern: {e}")
-
     # Combine errors first, then warnings
     important_lines = error_lines + warning_lines
 
     # Calculate what we're actually showing
-    displayed_errors = min(len(error_lines), max_lines)
-    displayed_warnings = 0 if len(error_lines) >= max_lines else min(len(warning_lines), max_lines - len(error_lines))
+    displayed_errors = min(matched_errors, max_lines)
+    displayed_warnings = 0 if matched_errors >= max_lines else min(matched_warnings, max_lines - matched_errors)
 
     # Limit to max_lines
     if len(important_lines) > max_lines:
@@ -468,7 +564,7 @@ def extract_build_errors_and_warnings(build_log: str,
     important_list = "\n".join(important_lines)
 
     # Build appropriate message based on what we found
-    if error_lines and warning_lines:
+    if matched_errors and matched_warnings:
         # Build detailed count message
         count_msg = f"Build failed with {total_errors} error{'s' if total_errors != 1 else ''} and {total_warnings} warning{'s' if total_warnings != 1 else ''}."
         if total_errors + total_warnings > max_lines:
@@ -477,34 +573,32 @@ def extract_build_errors_and_warnings(build_log: str,
                 count_msg += f" Showing first {displayed_errors} of {total_errors} errors."
             else:
                 # Showing errors and warnings, but some may be truncated
-                error_part = f"all {displayed_errors} error{'s' if displayed_errors != 1 else ''}" if displayed_errors == len(error_lines) else f"first {displayed_errors} of {len(error_lines)} errors"
-                warning_part = f"first {displayed_warnings} of {len(warning_lines)} warnings"
+                error_part = f"all {displayed_errors} error{'s' if displayed_errors != 1 else ''}" if displayed_errors == matched_errors else f"first {displayed_errors} of {matched_errors} errors"
+                warning_part = f"first {displayed_warnings} of {matched_warnings} warnings"
                 count_msg += f" Showing {error_part} and {warning_part}."
         output_text = f"{count_msg}\n{important_list}"
-    elif error_lines:
+    elif matched_errors:
         count_msg = f"Build failed with {total_errors} error{'s' if total_errors != 1 else ''}."
-        if len(error_lines) > max_lines:
+        if matched_errors > max_lines:
             count_msg += f" Showing first {max_lines} of {total_errors} errors."
         output_text = f"{count_msg}\n{important_list}"
-    elif warning_lines:
+    elif matched_warnings:
         if build_failed:
             # Build failed but only warnings matched (no error patterns) — e.g. signing failure after partial compilation
-            tail_lines = [l for l in output_lines if l.strip()][-max_lines:]
-            tail_text = "\n".join(tail_lines)
+            tail_text = "\n".join(log_tail)
             count_msg = f"Build failed with 0 recognized errors and {total_warnings} warning{'s' if total_warnings != 1 else ''}. See log tail and full log for details."
             output_text = f"{count_msg}\n{tail_text}"
             total_errors = 1  # Signal failure in summary
         else:
             count_msg = f"Build succeeded with {total_warnings} warning{'s' if total_warnings != 1 else ''}."
-            if len(warning_lines) > max_lines:
+            if matched_warnings > max_lines:
                 count_msg += f" Showing first {max_lines} of {total_warnings} warnings."
             output_text = f"{count_msg}\n{important_list}"
     else:
         if build_failed:
             # Build failed but no errors matched our regex patterns
             # (e.g. signing errors, provisioning issues, validation failures)
-            tail_lines = [l for l in output_lines if l.strip()][-max_lines:]
-            tail_text = "\n".join(tail_lines)
+            tail_text = "\n".join(log_tail)
             output_text = f"Build failed with 0 recognized errors. See log tail and full log for details.\n{tail_text}"
             total_errors = 1  # Signal failure in summary
         else:
@@ -540,6 +634,15 @@ def extract_build_errors_and_warnings(build_log: str,
 # missing package products).
 
 
+# select_derived_data_dirs_for_project results keyed by the project realpath
+# plus each name-prefix candidate's (path, mtime_ns). Xcode writing a
+# candidate's info.plist, or a candidate appearing or disappearing, changes the
+# key; otherwise the info.plist parsing would come out the same.
+_MATCHING_DIRS_CACHE_MAX = 32
+_MATCHING_DIRS_CACHE: "OrderedDict[tuple, list]" = OrderedDict()
+_MATCHING_DIRS_CACHE_LOCK = threading.Lock()
+
+
 def _matching_derived_data_dirs(project_path: str) -> list:
     """
     Return the DerivedData directories that belong to this project, as a list of
@@ -551,7 +654,8 @@ def _matching_derived_data_dirs(project_path: str) -> list:
 
     This is the expensive part of locating .xcresult bundles — it lists the
     whole DerivedData base and parses each candidate's info.plist — so callers
-    that poll should resolve it ONCE rather than per iteration.
+    that poll should resolve it ONCE rather than per iteration. The info.plist
+    matching is cached while the candidate directories are unchanged.
 
     Args:
         project_path: Path to .xcodeproj or .xcworkspace
@@ -564,11 +668,19 @@ def _matching_derived_data_dirs(project_path: str) -> list:
     )
     derived_data_base = os.path.expanduser("~/Library/Developer/Xcode/DerivedData")
 
-    if not os.path.exists(derived_data_base):
-        return []
-
+    # DerivedData holds one directory per project ever built, so list it with
+    # scandir: the name-prefix test runs before anything is stat'ed, and
+    # is_dir() is answered from the directory entry's type without a stat call.
+    name_prefix = project_name + "-"
     try:
-        entries = os.listdir(derived_data_base)
+        with os.scandir(derived_data_base) as entries:
+            dir_candidates = [
+                (0.0, entry.path)
+                for entry in entries
+                if entry.name.startswith(name_prefix) and entry.is_dir()
+            ]
+    except FileNotFoundError:
+        return []
     except OSError as e:
         print(
             f"Error listing DerivedData base {derived_data_base}: {e}",
@@ -576,21 +688,37 @@ def _matching_derived_data_dirs(project_path: str) -> list:
         )
         return []
 
-    dir_candidates = [
-        (0.0, os.path.join(derived_data_base, d))
-        for d in entries
-        if d.startswith(project_name + "-")
-        and os.path.isdir(os.path.join(derived_data_base, d))
-    ]
     if not dir_candidates:
         return []
-    return select_derived_data_dirs_for_project(dir_candidates, normalized_path)
+
+    try:
+        cache_key = (normalized_path, tuple(
+            (path, os.stat(path).st_mtime_ns) for _key, path in dir_candidates
+        ))
+    except OSError:
+        cache_key = None
+    if cache_key is not None:
+        with _MATCHING_DIRS_CACHE_LOCK:
+            cached = _MATCHING_DIRS_CACHE.get(cache_key)
+            if cached is not None:
+                _MATCHING_DIRS_CACHE.move_to_end(cache_key)
+                return list(cached)
+
+    matching = select_derived_data_dirs_for_project(dir_candidates, normalized_path)
+    if cache_key is not None:
+        with _MATCHING_DIRS_CACHE_LOCK:
+            _MATCHING_DIRS_CACHE[cache_key] = matching
+            _MATCHING_DIRS_CACHE.move_to_end(cache_key)
+            while len(_MATCHING_DIRS_CACHE) > _MATCHING_DIRS_CACHE_MAX:
+                _MATCHING_DIRS_CACHE.popitem(last=False)
+    return list(matching)
 
 
 def _scan_logs_for_xcresults(matching_dirs: list, logs_subdir: str) -> list:
     """
-    Return [(mtime, path), ...] for every .xcresult bundle under the given
-    DerivedData directories' `Logs/<logs_subdir>` folder, sorted newest-first.
+    Return [(mtime, path, ctime), ...] for every .xcresult bundle under the
+    given DerivedData directories' `Logs/<logs_subdir>` folder, in no
+    particular order. Both times come from the one stat scandir does per entry.
 
     Cheap relative to _matching_derived_data_dirs (no info.plist parsing), so it
     is safe to call once per poll iteration. The `Logs/<subdir>` folder is
@@ -604,29 +732,31 @@ def _scan_logs_for_xcresults(matching_dirs: list, logs_subdir: str) -> list:
     candidates = []
     for _key, derived_data_path in matching_dirs:
         logs_dir = os.path.join(derived_data_path, "Logs", logs_subdir)
-        if not os.path.isdir(logs_dir):
-            continue
+        # scandir hands back each entry's full path and stats it once, instead
+        # of an isdir() probe plus a join + getmtime() per bundle.
         try:
-            for f in os.listdir(logs_dir):
-                if not f.endswith('.xcresult'):
-                    continue
-                full_path = os.path.join(logs_dir, f)
-                try:
-                    candidates.append((os.path.getmtime(full_path), full_path))
-                except OSError:
-                    continue
+            with os.scandir(logs_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith('.xcresult'):
+                        continue
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    candidates.append((st.st_mtime, entry.path, st.st_ctime))
+        except (FileNotFoundError, NotADirectoryError):
+            continue
         except OSError as e:
             print(f"Error listing {logs_dir}: {e}", file=sys.stderr)
             continue
 
-    candidates.sort(reverse=True)
     return candidates
 
 
 def _gather_xcresult_candidates(project_path: str, logs_subdir: str) -> list:
     """
-    Return [(mtime, path), ...] for every .xcresult bundle that belongs to this
-    project, sorted newest-first. Shared by _find_most_recent_xcresult and
+    Return [(mtime, path, ctime), ...] for every .xcresult bundle that belongs
+    to this project, unordered. Shared by _find_most_recent_xcresult and
     snapshot_xcresult_mtimes. Single-shot convenience over
     _matching_derived_data_dirs + _scan_logs_for_xcresults; pollers should call
     those two directly so the expensive directory matching happens once.
@@ -658,7 +788,7 @@ def snapshot_xcresult_mtimes(project_path: str, logs_subdir: str = "Launch") ->
         project_path: Path to .xcodeproj or .xcworkspace
         logs_subdir: "Launch" (runtime logs) or "Test" (test results)
     """
-    return {path: mtime for mtime, path in _gather_xcresult_candidates(project_path, logs_subdir)}
+    return {path: mtime for mtime, path, _ctime in _gather_xcresult_candidates(project_path, logs_subdir)}
 
 
 def _find_most_recent_xcresult(project_path: str, logs_subdir: str) -> Optional[str]:
@@ -685,7 +815,7 @@ def _find_most_recent_xcresult(project_path: str, logs_subdir: str) -> Optional[
     candidates = _gather_xcresult_candidates(project_path, logs_subdir)
     if not candidates:
         return None
-    return candidates[0][1]
+    return max(candidates)[1]
 
 
 def find_xcresult_for_project(project_path: str) -> Optional[str]:
@@ -734,7 +864,7 @@ def wait_for_xcresult_after_timestamp(project_path: str, start_timestamp: float,
         Path to the xcresult file if found, or None if timeout expires or no valid file found
     """
     prior = prior_mtimes or {}
-    debug = bool(os.environ.get('XCODE_MCP_DEBUG'))
+    debug = _DEBUG
 
     # Some filesystems store mtime/ctime with only 1-second resolution, so a file
     # created in the same wall-clock second as start_timestamp can read as older.
@@ -753,8 +883,10 @@ def wait_for_xcresult_after_timestamp(project_path: str, start_timestamp: float,
     end_time = time.time() + timeout_seconds
 
     while time.time() < end_time:
-        # Candidates are newest-first; take the newest that is genuinely new.
-        for mtime, xcresult_path in _scan_logs_for_xcresults(matching_dirs, logs_subdir):
+        # Walk candidates newest-first; take the newest that is genuinely new.
+        candidates = _scan_logs_for_xcresults(matching_dirs, logs_subdir)
+        candidates.sort(reverse=True)
+        for mtime, xcresult_path, create_time in candidates:
             prior_mtime = prior.get(xcresult_path)
 
             if prior_mtime is not None:
@@ -770,21 +902,66 @@ def wait_for_xcresult_after_timestamp(project_path: str, start_timestamp: float,
 
             # Brand-new path (absent from the snapshot). Apply the secondary
             # timestamp gate as a sanity check on both create and modify times.
-            try:
-                create_time = os.path.getctime(xcresult_path)
-            except OSError:
-                continue
             if mtime >= effective_start and create_time >= effective_start:
                 print(f"Accepting new xcresult: {xcresult_path}", file=sys.stderr)
                 return xcresult_path
             if debug:
                 print(f"Skipping xcresult older than start time: {xcresult_path}", file=sys.stderr)
 
-        time.sleep(1)
+        logs_dirs = [os.path.join(path, "Logs", logs_subdir) for _key, path in matching_dirs]
+        _wait_for_directory_change(logs_dirs, min(1.0, max(0.0, end_time - time.time())))
 
     return None
 
 
+# O_EVTONLY (macOS) opens a descriptor only for event notification: it doesn't
+# count as a use of the volume, so watching DerivedData never blocks an unmount.
+_EVENT_ONLY_OPEN_FLAGS = getattr(os, 'O_EVTONLY', os.O_RDONLY)
+
+
+def _wait_for_directory_change(directories: list, timeout: float) -> None:
+    """
+    Block until one of `directories` changes or `timeout` seconds pass.
+
+    On macOS this is a kqueue vnode watch, so a bundle appearing in Logs/<subdir>
+    wakes the poller immediately instead of at the next whole-second tick.
+    Directories that don't exist yet are simply not watched; the timeout still
+    bounds the wait, so they are picked up on the next pass. Elsewhere (no
+    kqueue) it is a plain sleep.
+    """
+    if not hasattr(select, 'kqueue'):
+        time.sleep(timeout)
+        return
+
+    fds = []
+    try:
+        for directory in directories:
+            try:
+                fds.append(os.open(directory, _EVENT_ONLY_OPEN_FLAGS))
+            except OSError:
+                continue
+        if not fds:
+            time.sleep(timeout)
+            return
+        events = [
+            select.kevent(
+                fd,
+                filter=select.KQ_FILTER_VNODE,
+                flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+                fflags=select.KQ_NOTE_WRITE | select.KQ_NOTE_EXTEND,
+            )
+            for fd in fds
+        ]
+        kq = select.kqueue()
+        try:
+            kq.control(events, 1, timeout)
+        finally:
+            kq.close()
+    finally:
+        for fd in fds:
+            os.close(fd)
+
+
 def format_test_identifier(bundle: str, class_name: str = None, method: str = None) -> str:
     """
     Format test identifier in standard format.
@@ -813,6 +990,13 @@ def find_xcresult_bundle(project_path: str, wait_seconds: int = 10) -> Optional[
     return _find_most_recent_xcresult(project_path, logs_subdir="Test")
 
 
+# Formatted extract_test_results_from_xcresult output, keyed by
+# _xcresult_cache_key. Bounded LRU, as with the xcactivitylog parse cache.
+_TEST_RESULTS_CACHE_MAX = 64
+_TEST_RESULTS_CACHE: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+_TEST_RESULTS_CACHE_LOCK = threading.Lock()
+
+
 def extract_test_results_from_xcresult(xcresult_path: str) -> Tuple[bool, str]:
     """
     Extract and parse test results from xcresult bundle.
@@ -849,21 +1033,64 @@ def extract_test_results_from_xcresult(xcresult_path: str) -> Tuple[bool, str]:
         The failures array preserves per-failure file/line for tests with
         multiple asserts; failure_message is a newline-joined convenience
         copy of the messages.
+
+        Successful results are cached per bundle (see _xcresult_cache_key), so
+        polling the same finished run does not relaunch xcresulttool.
+    """
+    cache_key = _xcresult_cache_key(xcresult_path)
+    if cache_key is not None:
+        with _TEST_RESULTS_CACHE_LOCK:
+            cached = _TEST_RESULTS_CACHE.get(cache_key)
+            if cached is not None:
+                _TEST_RESULTS_CACHE.move_to_end(cache_key)
+                return True, cached
+
+    success, output = _extract_test_results(xcresult_path)
+
+    if success and cache_key is not None:
+        with _TEST_RESULTS_CACHE_LOCK:
+            _TEST_RESULTS_CACHE[cache_key] = output
+            _TEST_RESULTS_CACHE.move_to_end(cache_key)
+            while len(_TEST_RESULTS_CACHE) > _TEST_RESULTS_CACHE_MAX:
+                _TEST_RESULTS_CACHE.popitem(last=False)
+    return success, output
+
+
+def _xcresult_cache_key(xcresult_path: str) -> Optional[Tuple[str, int, int]]:
+    """Return a cache key for an .xcresult bundle, or None if it can't be stat'ed.
+
+    The bundle is a directory, and its own mtime only moves when top-level
+    entries are added or removed, so the key also carries Info.plist's mtime,
+    which xcodebuild rewrites when it finalizes the bundle. A re-run that
+    reuses the same path therefore misses the cache.
     """
     try:
-        # Extract test results from xcresult bundle
+        bundle_mtime = os.stat(xcresult_path).st_mtime_ns
+        info_mtime = os.stat(os.path.join(xcresult_path, 'Info.plist')).st_mtime_ns
+    except OSError:
+        return None
+    return (xcresult_path, bundle_mtime, info_mtime)
+
+
+def _extract_test_results(xcresult_path: str) -> Tuple[bool, str]:
+    """Uncached body of extract_test_results_from_xcresult."""
+    try:
+        # Extract test results from xcresult bundle. As with console logs,
+        # stdout stays bytes for the JSON parser; only stderr is decoded, on failure.
         result = subprocess.run(
-            ['xcrun', 'xcresulttool', 'get', 'test-results', 'tests', '--path', xcresult_path],
-            capture_output=True,
-            text=True,
-            timeout=10
+            [*_xcresulttool_command(), 'get', 'test-results', 'tests', '--path', xcresult_path],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            timeout=10,
+            close_fds=False
         )
 
         if result.returncode != 0:
-            return False, f"Failed to extract test results: {result.stderr}"
+            stderr_text = result.stderr.decode('utf-8', errors='replace')
+            return False, f"Failed to extract test results: {stderr_text}"
 
         # Parse the JSON
-        test_data = json.loads(result.stdout)
+        test_data = _json_loads(result.stdout)
 
     except subprocess.TimeoutExpired:
         return False, "Timeout extracting test results"
@@ -872,16 +1099,18 @@ def extract_test_results_from_xcresult(xcresult_path: str) -> Tuple[bool, str]:
     except Exception as e:
         return False, f"Error extracting test results: {e}"
 
-    # Recursively walk the test tree to find all test cases
+    # Recursively walk the test tree, appending every test case to all_tests.
+    # A shared accumulator avoids re-copying each subtree's results into its
+    # parent's list at every level of nesting.
+    all_tests = []
+
     def walk_test_nodes(node, parent_path=""):
         """Recursively walk test nodes and collect test case results."""
-        test_cases = []
-
         node_type = node.get('nodeType', '')
         node_name = node.get('name', '')
 
         # Build the path for this node
-        if node_type in ['Unit test bundle', 'Test Suite']:
+        if node_type in ('Unit test bundle', 'Test Suite'):
             current_path = f"{parent_path}/{node_name}" if parent_path else node_name
         else:
             current_path = parent_path
@@ -895,64 +1124,70 @@ def extract_test_results_from_xcresult(xcresult_path: str) -> Tuple[bool, str]:
             }
 
             # Extract failure details if test failed
-            if test_info['result'] in ['Failed', 'Failure']:
+            if test_info['result'] in ('Failed', 'Failure'):
                 failures = []
 
                 # Get failure messages from the node
-                if 'failureMessages' in node:
-                    for failure in node['failureMessages']:
-                        failure_info = {
-                            'message': failure.get('message', 'Unknown failure')
-                        }
-
-                        # Extract file location if available
-                        if 'location' in failure:
-                            location = failure['location']
-                            if 'file' in location:
-                                failure_info['file'] = location['file']
-                            if 'line' in location:
-                                failure_info['line'] = location['line']
-
-                        failures.append(failure_info)
+                for failure in node.get('failureMessages', ()):
+                    failure_info = {
+                        'message': failure.get('message', 'Unknown failure')
+                    }
+
+                    # Extract file location if available
+                    if 'location' in failure:
+                        location = failure['location']
+                        if 'file' in location:
+                            failure_info['file'] = location['file']
+                        if 'line' in location:
+                            failure_info['line'] = location['line']
+
+                    failures.append(failure_info)
 
                 test_info['failures'] = failures
 
-            test_cases.append(test_info)
+            all_tests.append(test_info)
 
         # Recursively process children
-        if 'children' in node:
-            for child in node['children']:
-                test_cases.extend(walk_test_nodes(child, current_path))
-
-        return test_cases
+        for child in node.get('children', ()):
+            walk_test_nodes(child, current_path)
 
     # Walk the test tree starting from testNodes
-    all_tests = []
     for test_node in test_data.get('testNodes', []):
-        all_tests.extend(walk_test_nodes(test_node))
-
-    # Categorize tests. Xcode 16+ Swift Testing emits statuses beyond the
-    # classic Passed/Failed/Skipped trio (e.g. "Expected Failure"); anything
-    # we don't recognize lands in `other` so the buckets sum to total_tests.
-    passed_tests = [t for t in all_tests if t['result'] in ['Passed', 'Success']]
-    failed_tests = [t for t in all_tests if t['result'] in ['Failed', 'Failure']]
-    skipped_tests = [t for t in all_tests if t['result'] in ['Skipped']]
-    classified = {id(t) for t in passed_tests + failed_tests + skipped_tests}
-    other_tests = [t for t in all_tests if id(t) not in classified]
+        walk_test_nodes(test_node)
+
+    # Categorize tests in one pass. Xcode 16+ Swift Testing emits statuses
+    # beyond the classic Passed/Failed/Skipped trio (e.g. "Expected Failure");
+    # anything we don't recognize lands in `other` so the buckets sum to
+    # total_tests.
+    passed_count = 0
+    skipped_count = 0
+    failed_tests = []
+    other_statuses = set()
+    other_count = 0
+    for t in all_tests:
+        result = t['result']
+        if result in ('Passed', 'Success'):
+            passed_count += 1
+        elif result in ('Failed', 'Failure'):
+            failed_tests.append(t)
+        elif result == 'Skipped':
+            skipped_count += 1
+        else:
+            other_count += 1
+            other_statuses.add(result)
 
     # Build summary
     summary = {
         'total_tests': len(all_tests),
-        'passed': len(passed_tests),
+        'passed': passed_count,
         'failed': len(failed_tests),
-        'skipped': len(skipped_tests),
+        'skipped': skipped_count,
     }
 
-    if other_tests:
-        other_statuses = sorted({t['result'] for t in other_tests})
+    if other_count:
         summary['other'] = {
-            'count': len(other_tests),
-            'statuses': other_statuses,
+            'count': other_count,
+            'statuses': sorted(other_statuses),
         }
 
     # Format failed tests for output
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Tests for the shared compiled-AppleScript (.scpt) cache.
+
+COMPILED_SCRIPT_DIR is shared by every server process, so the cache must never
+expose a half-written .scpt, must not unlink files on in-process LRU eviction,
+and must recover when another process prunes a file it still references.
+osacompile/osascript are replaced by a stub so the tests run anywhere.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import drews_xcode_mcp.utils.applescript as applescript
+
+
+class _FakeSubprocess:
+    """Stands in for subprocess.run: osacompile writes its -o file, osascript
+    fails like the real one when handed a compiled path that doesn't exist."""
+
+    def __init__(self):
+        self.calls = []
+
+    def run(self, argv, **kwargs):
+        self.calls.append(list(argv))
+        if argv[0] == applescript.OSACOMPILE:
+            out_path = argv[argv.index('-o') + 1]
+            with open(out_path, "w") as f:
+                f.write("compiled")
+            return subprocess.CompletedProcess(argv, 0, stdout="", stderr="")
+        if argv[1] != '-e' and not os.path.exists(argv[1]):
+            raise subprocess.CalledProcessError(1, argv, output="", stderr="No such file or directory")
+        return subprocess.CompletedProcess(argv, 0, stdout="ok\n", stderr="")
+
+    def compiles(self):
+        return [c for c in self.calls if c[0] == applescript.OSACOMPILE]
+
+
+class CompiledScriptCacheTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.fake = _FakeSubprocess()
+        self._orig_run = applescript.subprocess.run
+        self._orig_dir = applescript.COMPILED_SCRIPT_DIR
+        self._orig_max = applescript.COMPILED_SCRIPT_CACHE_MAX
+        applescript.subprocess.run = self.fake.run
+        applescript.COMPILED_SCRIPT_DIR = self._tmp.name
+        applescript._COMPILED_SCRIPTS.clear()
+        applescript._compiled_scripts_last_prune = None
+
+    def tearDown(self):
+        applescript.subprocess.run = self._orig_run
+        applescript.COMPILED_SCRIPT_DIR = self._orig_dir
+        applescript.COMPILED_SCRIPT_CACHE_MAX = self._orig_max
+        applescript._COMPILED_SCRIPTS.clear()
+        self._tmp.cleanup()
+
+    def test_compiles_to_temp_name_then_renames(self):
+        path = applescript._compiled_script_path('return "a"')
+        self.assertTrue(os.path.exists(path))
+        out_path = self.fake.compiles()[0][2]
+        self.assertNotEqual(out_path, path)
+        self.assertEqual(os.listdir(self._tmp.name), [os.path.basename(path)])
+
+    def test_reuses_file_compiled_by_another_process(self):
+        path = applescript._compiled_script_path('return "a"')
+        applescript._COMPILED_SCRIPTS.clear()  # a fresh process
+        self.assertEqual(applescript._compiled_script_path('return "a"'), path)
+        self.assertEqual(len(self.fake.compiles()), 1)
+
+    def test_eviction_does_not_unlink(self):
+        applescript.COMPILED_SCRIPT_CACHE_MAX = 2
+        paths = [applescript._compiled_script_path(f'return "{i}"') for i in range(4)]
+        self.assertEqual(len(applescript._COMPILED_SCRIPTS), 2)
+        for path in paths:
+            self.assertTrue(os.path.exists(path))
+
+    def test_recompiles_when_cached_file_was_pruned(self):
+        script = 'return "a"'
+        path = applescript._compiled_script_path(script)
+        os.unlink(path)
+        self.assertEqual(applescript.run_applescript(script, precompile=True), (True, "ok"))
+        self.assertEqual(len(self.fake.compiles()), 2)
+        self.assertTrue(os.path.exists(path))
+
+    def test_prunes_old_files_only(self):
+        old = os.path.join(self._tmp.name, "old.scpt")
+        stale_tmp = os.path.join(self._tmp.name, "dead.123.456.tmp.scpt")
+        for p in (old, stale_tmp):
+            with open(p, "w") as f:
+                f.write("x")
+            past = time.time() - applescript.COMPILED_SCRIPT_MAX_AGE_SECONDS - 60
+            os.utime(p, (past, past))
+        path = applescript._compiled_script_path('return "a"')
+        self.assertEqual(os.listdir(self._tmp.name), [os.path.basename(path)])
+
+    def test_compile_failure_leaves_no_temp_file(self):
+        def failing_run(argv, **kwargs):
+            out_path = argv[argv.index('-o') + 1]
+            with open(out_path, "w") as f:
+                f.write("partial")
+            raise subprocess.TimeoutExpired(argv, 1)
+        applescript.subprocess.run = failing_run
+        self.assertIsNone(applescript._compiled_script_path('return "a"'))
+        self.assertEqual(os.listdir(self._tmp.name), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Tests for the background notification poster.
+
+show_notification queues a `display notification` script; a single worker
+thread posts everything pending with one osascript launch, skips repeats seen
+within NOTIFICATION_DEDUPE_SECONDS (history still records them), drops the
+oldest entries once NOTIFICATION_QUEUE_MAX are pending, and survives a failing
+dispatch. subprocess.run is stubbed, so nothing is actually displayed.
+"""
+
+import subprocess
+import sys
+import threading
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import drews_xcode_mcp.utils.applescript as applescript
+
+WAIT_SECONDS = 5
+
+
+class NotificationPosterTests(unittest.TestCase):
+    def setUp(self):
+        self.scripts = []
+        self.fail_next = False
+        self._posted = threading.Condition()
+        self._orig_run = applescript.subprocess.run
+        self._orig_enabled = applescript.NOTIFICATIONS_ENABLED
+        applescript.subprocess.run = self._fake_run
+        applescript.NOTIFICATIONS_ENABLED = True
+        applescript._recently_posted.clear()
+        applescript.clear_notification_history()
+
+    def tearDown(self):
+        applescript.subprocess.run = self._orig_run
+        applescript.NOTIFICATIONS_ENABLED = self._orig_enabled
+        applescript.clear_notification_history()
+
+    def _fake_run(self, argv, **kwargs):
+        with self._posted:
+            if self.fail_next:
+                self.fail_next = False
+                self._posted.notify_all()
+                raise RuntimeError("dispatch exploded")
+            self.scripts.append(argv[argv.index('-e') + 1])
+            self._posted.notify_all()
+        return subprocess.CompletedProcess(argv, 0, stdout=b"", stderr=b"")
+
+    def _wait_for_posts(self, count):
+        with self._posted:
+            self.assertTrue(
+                self._posted.wait_for(lambda: len(self.scripts) >= count, WAIT_SECONDS),
+                f"expected {count} dispatches, got {len(self.scripts)}",
+            )
+        return self.scripts
+
+    def test_burst_is_posted_in_one_batch(self):
+        # Holding the queue's condition keeps the worker from draining until
+        # the whole burst is queued.
+        with applescript._NOTIFICATION_QUEUE_COND:
+            for i in range(3):
+                applescript.show_notification(f"burst {i}")
+        scripts = self._wait_for_posts(1)
+        self.assertEqual(len(scripts), 1)
+        lines = scripts[0].split("\n")
+        self.assertEqual(len(lines), 3)
+        for i, line in enumerate(lines):
+            self.assertIn(f'"burst {i}"', line)
+
+    def test_repeats_are_dropped_but_recorded(self):
+        applescript.show_notification("same")
+        self._wait_for_posts(1)
+        applescript.show_notification("same")
+        applescript.show_notification("sentinel")
+        scripts = self._wait_for_posts(2)
+        self.assertEqual(len(scripts), 2)
+        self.assertNotIn('"same"', scripts[1])
+        self.assertIn('"sentinel"', scripts[1])
+        titles = [entry['title'] for entry in applescript.get_notification_history()]
+        self.assertEqual(titles, ["same", "same", "sentinel"])
+
+    def test_oldest_dropped_when_queue_full(self):
+        total = applescript.NOTIFICATION_QUEUE_MAX + 3
+        with applescript._NOTIFICATION_QUEUE_COND:
+            for i in range(total):
+                applescript.show_notification(f"queued {i}")
+        scripts = self._wait_for_posts(1)
+        lines = scripts[0].split("\n")
+        self.assertEqual(len(lines), applescript.NOTIFICATION_QUEUE_MAX)
+        self.assertIn('"queued 3"', lines[0])
+        self.assertIn(f'"queued {total - 1}"', lines[-1])
+
+    def test_failing_dispatch_keeps_worker_alive(self):
+        self.fail_next = True
+        applescript.show_notification("lost")
+        with self._posted:
+            self.assertTrue(self._posted.wait_for(lambda: not self.fail_next, WAIT_SECONDS))
+        applescript.show_notification("after failure")
+        scripts = self._wait_for_posts(1)
+        self.assertIn('"after failure"', scripts[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
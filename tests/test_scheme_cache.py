@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Tests for the get_project_schemes listing cache.
+
+A cached listing must miss once the project's stat signature changes (scheme
+added/removed, project edited) or its TTL lapses, and must be dropped whenever
+a tool's script switches the active scheme, since the "(active)" marker would
+otherwise be stale.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import drews_xcode_mcp.utils.schemes as schemes
+from drews_xcode_mcp.utils.applescript import open_and_wait_script_args
+
+
+class SchemeCacheTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.project = os.path.join(self._tmp.name, "MyApp.xcodeproj")
+        os.makedirs(self.project)
+        self.pbxproj = os.path.join(self.project, "project.pbxproj")
+        with open(self.pbxproj, "w") as f:
+            f.write("// project")
+        self._orig_ttl = schemes.SCHEMES_CACHE_TTL_SECONDS
+        with schemes._SCHEMES_CACHE_LOCK:
+            schemes._SCHEMES_CACHE.clear()
+
+    def tearDown(self):
+        schemes.SCHEMES_CACHE_TTL_SECONDS = self._orig_ttl
+        with schemes._SCHEMES_CACHE_LOCK:
+            schemes._SCHEMES_CACHE.clear()
+        self._tmp.cleanup()
+
+    def _cache(self, output="App (active)\nAppTests"):
+        signature = schemes.project_signature(self.project)
+        schemes.cache_schemes(self.project, signature, output)
+        return signature
+
+    def test_hit_with_unchanged_signature(self):
+        signature = self._cache()
+        self.assertEqual(schemes.get_cached_schemes(self.project, signature), "App (active)\nAppTests")
+
+    def test_miss_when_project_file_changes(self):
+        self._cache()
+        st = os.stat(self.pbxproj)
+        os.utime(self.pbxproj, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        signature = schemes.project_signature(self.project)
+        self.assertIsNone(schemes.get_cached_schemes(self.project, signature))
+
+    def test_miss_when_shared_scheme_added(self):
+        before = self._cache()
+        os.makedirs(os.path.join(self.project, "xcshareddata", "xcschemes"))
+        after = schemes.project_signature(self.project)
+        self.assertNotEqual(before, after)
+        self.assertIsNone(schemes.get_cached_schemes(self.project, after))
+
+    def test_miss_after_ttl(self):
+        schemes.SCHEMES_CACHE_TTL_SECONDS = -1.0
+        signature = self._cache()
+        self.assertIsNone(schemes.get_cached_schemes(self.project, signature))
+
+    def test_invalidate(self):
+        signature = self._cache()
+        schemes.invalidate_project_schemes(self.project)
+        self.assertIsNone(schemes.get_cached_schemes(self.project, signature))
+
+    def test_script_args_leave_cache_alone(self):
+        # Tools invalidate after the scheme switch has run, not while building
+        # its arguments (a listing fetched in between would re-cache the old
+        # active scheme).
+        signature = self._cache()
+        self.assertEqual(open_and_wait_script_args(self.project), [self.project])
+        self.assertEqual(open_and_wait_script_args(self.project, "AppTests"), [self.project, "AppTests"])
+        self.assertIsNotNone(schemes.get_cached_schemes(self.project, signature))
+
+
+if __name__ == '__main__':
+    unittest.main()